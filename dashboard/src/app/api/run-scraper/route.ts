@@ -2,10 +2,108 @@ import { NextRequest, NextResponse } from 'next/server'
 import { spawn } from 'child_process'
 import path from 'path'
 
+// Resident scraper service (scraper/scraper_service.py) with a warm browser
+const SCRAPER_SERVICE_URL = process.env.SCRAPER_SERVICE_URL || 'http://127.0.0.1:8765'
+const SERVICE_TIMEOUT_MS = 1000
+
+interface ScrapeRequest {
+  genders?: string[]
+  schools?: string[]
+  exclude_schools?: string[]
+  school_pattern?: string
+}
+
+interface ServiceJob {
+  job_id: string
+  status: string
+  created_at: string
+}
+
+type ServiceSubmission = { job: ServiceJob } | { rejected: { error?: string } } | null
+
+const LIST_FIELDS = ['genders', 'schools', 'exclude_schools'] as const
+
+async function readScrapeRequest(request: NextRequest): Promise<unknown> {
+  try {
+    return await request.json()
+  } catch {
+    // The dashboard button posts without a body
+    return {}
+  }
+}
+
+// Same rules as the scraper service, so both paths reject the same requests
+function validateScrapeRequest(body: unknown): { scrapeRequest: ScrapeRequest } | { error: string } {
+  if (body === null || typeof body !== 'object' || Array.isArray(body)) {
+    return { error: 'Request body must be a JSON object' }
+  }
+  const fields = body as Record<string, unknown>
+  for (const key of LIST_FIELDS) {
+    const value = fields[key]
+    if (value !== undefined && !(Array.isArray(value) && value.every(item => typeof item === 'string'))) {
+      return { error: `'${key}' must be a list of strings` }
+    }
+  }
+  if (fields.school_pattern !== undefined && fields.school_pattern !== null &&
+      typeof fields.school_pattern !== 'string') {
+    return { error: "'school_pattern' must be a string" }
+  }
+  return { scrapeRequest: body as ScrapeRequest }
+}
+
+async function submitToService(scrapeRequest: ScrapeRequest): Promise<ServiceSubmission> {
+  try {
+    const response = await fetch(`${SCRAPER_SERVICE_URL}/jobs`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(scrapeRequest),
+      signal: AbortSignal.timeout(SERVICE_TIMEOUT_MS)
+    })
+    if (response.status === 400) {
+      // The request itself is bad; spawning the scraper with it would not help
+      return { rejected: await response.json() }
+    }
+    if (!response.ok) {
+      console.warn(`⚠️ Scraper service rejected job (${response.status}): ${await response.text()}`)
+      return null
+    }
+    return { job: await response.json() }
+  } catch {
+    // Service not running - fall back to spawning the scraper
+    return null
+  }
+}
+
 export async function POST(request: NextRequest) {
   try {
     console.log('🏆 Starting scraper from dashboard...')
     
+    const validated = validateScrapeRequest(await readScrapeRequest(request))
+    if ('error' in validated) {
+      return NextResponse.json({ success: false, error: validated.error }, { status: 400 })
+    }
+    const { scrapeRequest } = validated
+    
+    const submitted = await submitToService(scrapeRequest)
+    if (submitted && 'rejected' in submitted) {
+      return NextResponse.json(
+        { success: false, error: submitted.rejected.error || 'Scraper service rejected the job' },
+        { status: 400 }
+      )
+    }
+    if (submitted) {
+      const { job } = submitted
+      console.log(`🕷️ Scraper job ${job.job_id} queued on scraper service`)
+      
+      return NextResponse.json({
+        success: true,
+        message: 'Scraper job started on scraper service',
+        jobId: job.job_id,
+        status: job.status,
+        startTime: job.created_at
+      })
+    }
+    
     // Path to the scraper directory
     const scraperPath = path.join(process.cwd(), '..', 'scraper')
     const scriptPath = path.join(scraperPath, 'run_scraper.py')
@@ -23,10 +121,34 @@ export async function POST(request: NextRequest) {
       )
     }
     
+    // A spawned scraper would exit at startup on a bad pattern while this route reported it started.
+    // JavaScript regex syntax is close enough to Python's to catch typos like an unclosed group.
+    if (scrapeRequest.school_pattern) {
+      try {
+        new RegExp(scrapeRequest.school_pattern, 'i')
+      } catch (error) {
+        return NextResponse.json(
+          {
+            success: false,
+            error: `Invalid school_pattern: ${error instanceof Error ? error.message : 'Unknown error'}`
+          },
+          { status: 400 }
+        )
+      }
+    }
+    
+    // Pass the requested selection through the scraper's settings
+    const env: NodeJS.ProcessEnv = { ...process.env }
+    if (scrapeRequest.genders) env.SCRAPER_GENDERS = scrapeRequest.genders.join(',')
+    if (scrapeRequest.schools) env.SCRAPER_SCHOOLS = scrapeRequest.schools.join(',')
+    if (scrapeRequest.exclude_schools) env.SCRAPER_EXCLUDE_SCHOOLS = scrapeRequest.exclude_schools.join(',')
+    if (scrapeRequest.school_pattern) env.SCRAPER_SCHOOL_PATTERN = scrapeRequest.school_pattern
+    
     // Return immediately with status - scraper runs in background
     // In production, you'd want to use a proper job queue
     const scraperProcess = spawn('python3', ['run_scraper.py'], {
       cwd: scraperPath,
+      env,
       detached: true,
       stdio: 'ignore'
     })
@@ -58,12 +180,47 @@ export async function POST(request: NextRequest) {
   }
 }
 
-export async function GET() {
-  // Simple status endpoint
-  return NextResponse.json({
-    message: 'Scraper API is running',
-    endpoints: {
-      'POST /api/run-scraper': 'Start the scraper process'
+export async function GET(request: NextRequest) {
+  const jobId = request.nextUrl.searchParams.get('jobId')
+  
+  if (!jobId) {
+    // Simple status endpoint
+    return NextResponse.json({
+      message: 'Scraper API is running',
+      endpoints: {
+        'POST /api/run-scraper': 'Start the scraper (scraper service if running, otherwise a new process)',
+        'GET /api/run-scraper?jobId=<id>': 'Scraper service job status',
+        'GET /api/run-scraper?jobId=<id>&stream=1': 'Scraper service job progress as NDJSON'
+      }
+    })
+  }
+  
+  const stream = request.nextUrl.searchParams.get('stream') === '1'
+  const jobPath = `${SCRAPER_SERVICE_URL}/jobs/${encodeURIComponent(jobId)}${stream ? '/events' : ''}`
+  
+  try {
+    const response = await fetch(jobPath, { cache: 'no-store' })
+    
+    if (stream && response.ok && response.body) {
+      // Relay progress events as they arrive
+      return new Response(response.body, {
+        headers: {
+          'Content-Type': 'application/x-ndjson',
+          'Cache-Control': 'no-cache'
+        }
+      })
     }
-  })
-}
\ No newline at end of file
+    
+    return NextResponse.json(await response.json(), { status: response.status })
+  
+  } catch (error) {
+    return NextResponse.json(
+      {
+        success: false,
+        error: 'Scraper service unavailable',
+        details: error instanceof Error ? error.message : 'Unknown error'
+      },
+      { status: 503 }
+    )
+  }
+}
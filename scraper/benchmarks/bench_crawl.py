@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+End-to-end crawl throughput benchmark against the local fixture site.
+Runs each scraper mode over a fixture_site.FixtureSite and reports
+wrestlers/minute and p50/p95 per-wrestler latency, with database writes
+replaced by a dry-run writer so nothing reaches Supabase.
+Usage: python benchmarks/bench_crawl.py [--modes sync,sync-workers,async,http] [--schools 5] [--latency-ms 150]
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixture_site import FixtureSite, add_site_arguments, site_config
+from src.playwright_scraper import PlaywrightScraper
+from src.async_playwright_scraper import AsyncPlaywrightScraper
+from src.http_scraper import HttpScraper
+from src.selection import SelectionSpec
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, 'results')
+
+MODES = ['sync', 'sync-workers', 'async', 'http']
+
+
+class DryRunDatabase:
+    """Stands in for SupabaseClient.batch_insert_matches: counts matches, optionally waits."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+        self.matches = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def batch_insert_matches(self, matches, prevalidated: bool = False) -> bool:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        with self._lock:
+            self.calls += 1
+            self.matches += len(matches)
+        return True
+
+
+def build_scraper(mode: str, base_url: str, concurrency: int, results_source: str,
+                  pipeline_depth: int) -> PlaywrightScraper:
+    """The scraper for a benchmark mode, pointed at the fixture site and selecting everything on it."""
+    selection = SelectionSpec(genders=[], schools=[])
+    if mode == 'http':
+        return HttpScraper(concurrency=concurrency, selection=selection, base_url=base_url, retry_delay=0)
+    if mode == 'async':
+        return AsyncPlaywrightScraper(concurrency=concurrency, results_source=results_source,
+                                      selection=selection, base_url=base_url)
+    return PlaywrightScraper(workers=concurrency if mode == 'sync-workers' else 1,
+                             results_source=results_source, selection=selection,
+                             pipeline_depth=pipeline_depth, base_url=base_url)
+
+
+def time_results_loads(scraper: PlaywrightScraper, latencies: List[float]) -> None:
+    """Record how long each wrestler's results take to arrive (select → click → table)."""
+    name = '_fetch_results_html' if isinstance(scraper, HttpScraper) else '_load_wrestler_results'
+    original: Callable = getattr(scraper, name)
+
+    if asyncio.iscoroutinefunction(original):
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                latencies.append((time.perf_counter() - started) * 1000)
+    else:
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                latencies.append((time.perf_counter() - started) * 1000)
+
+    setattr(scraper, name, timed)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))], 1)
+
+
+def run_mode(mode: str, site: FixtureSite, args: argparse.Namespace) -> Dict[str, Any]:
+    """Crawl the whole fixture site with one scraper mode."""
+    scraper = build_scraper(mode, site.url, args.concurrency, args.results_source, args.pipeline_depth)
+    database = DryRunDatabase(args.db_latency_ms)
+    scraper.db_client = database
+
+    latencies: List[float] = []
+    time_results_loads(scraper, latencies)
+    outcomes = {'done': 0, 'failed': 0}
+    outcomes_lock = threading.Lock()
+
+    def on_progress(event: Dict[str, Any]) -> None:
+        if event['event'] == 'wrestler':
+            with outcomes_lock:
+                outcomes[event['status']] += 1
+
+    scraper.progress = on_progress
+    errors_before = site.errors_injected
+
+    started = time.perf_counter()
+    stats = scraper.scrape_all_data()
+    elapsed = time.perf_counter() - started
+
+    return {
+        'mode': mode,
+        'seconds': round(elapsed, 2),
+        'wrestlers_done': outcomes['done'],
+        'wrestlers_failed': outcomes['failed'],
+        'wrestlers_per_minute': round(outcomes['done'] / elapsed * 60, 1) if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50),
+        'p95_ms': percentile(latencies, 0.95),
+        'matches_written': database.matches,
+        'errors': stats.get('errors', 0),
+        'errors_injected': site.errors_injected - errors_before,
+        'readiness': stats.get('readiness', {}),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--modes', default=','.join(MODES), help=f"comma-separated modes from {MODES}")
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help='workers / pages / requests at once for the parallel modes (default: 4)')
+    parser.add_argument('--results-source', default='xhr', choices=['xhr', 'dom', 'evaluate'],
+                        help='results source for the browser modes (default: xhr)')
+    parser.add_argument('--pipeline-depth', type=int, default=16,
+                        help='results pipeline queue size for the sync modes (default: 16, 0 = inline)')
+    parser.add_argument('--db-latency-ms', type=float, default=0.0,
+                        help='simulated database write latency per wrestler (default: 0)')
+    parser.add_argument('--output', help='JSON file for the results (default: benchmarks/results/crawl-<timestamp>.json)')
+    add_site_arguments(parser)
+    parser.set_defaults(schools=5, wrestlers=10, genders='Boys')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    config = site_config(args)
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        raise SystemExit(f"❌ Unknown modes {unknown}, expected some of {MODES}")
+
+    results = []
+    with FixtureSite(config) as site:
+        print(f"🤼 Fixture site {site.url}: {site.total_wrestlers()} wrestlers, "
+              f"{config.latency_ms:.0f}±{config.jitter_ms:.0f} ms latency, {config.error_rate:.0%} errors")
+        print(f"{'mode':<14}{'wrestlers/min':>15}{'p50 ms':>10}{'p95 ms':>10}{'done':>7}{'failed':>8}{'seconds':>9}")
+
+        for mode in modes:
+            try:
+                result = run_mode(mode, site, args)
+            except Exception as e:
+                error = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+                print(f"{mode:<14}  ❌ {error}")
+                results.append({'mode': mode, 'error': error})
+                continue
+            results.append(result)
+            print(f"{mode:<14}{result['wrestlers_per_minute']:>15}{result['p50_ms']:>10}{result['p95_ms']:>10}"
+                  f"{result['wrestlers_done']:>7}{result['wrestlers_failed']:>8}{result['seconds']:>9}")
+        requests = dict(site.requests)
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"crawl-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'site': {**vars(config), 'genders': list(config.genders)},
+            'options': {'concurrency': args.concurrency, 'results_source': args.results_source,
+                        'pipeline_depth': args.pipeline_depth, 'db_latency_ms': args.db_latency_ms},
+            'site_requests': requests,
+            'results': results,
+        }, f, indent=2)
+    print(f"\n💾 Saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
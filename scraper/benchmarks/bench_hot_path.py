@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the parsing and validation hot path.
+Times _parse_results_table, _parse_match_row, _parse_result_column and
+DataValidator.validate_match_data/clean_match_data on the anonymized
+fixture corpus, saves the timings as JSON, and optionally compares them
+with a baseline run.
+Usage: python benchmarks/bench_hot_path.py [--baseline results/before.json] [--output after.json]
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bs4
+import lxml.etree
+from bs4 import BeautifulSoup
+
+from src.playwright_scraper import PlaywrightScraper, decode_result
+from src.data_validator import DataValidator
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCHMARKS_DIR, 'fixtures')
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, 'results')
+
+# A benchmark slower than its baseline by more than this fraction is flagged
+REGRESSION_THRESHOLD = 0.10
+
+
+def load_fixtures() -> Dict[str, Dict[str, Any]]:
+    """Fixture manifest entries with their HTML loaded."""
+    with open(os.path.join(FIXTURES_DIR, 'manifest.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+    for entry in manifest.values():
+        with open(os.path.join(FIXTURES_DIR, entry['file']), encoding='utf-8') as f:
+            entry['html'] = f.read()
+    return manifest
+
+
+def measure(function: Callable[[], Any], items: int, repeat: int, min_time: float) -> Dict[str, Any]:
+    """
+    Time `function`, which handles `items` units of work per call.
+
+    Runs at least `repeat` times and at least `min_time` seconds, and reports
+    per-item microseconds so different fixture sizes are comparable.
+    """
+    function()  # warm up imports, caches and the allocator
+
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < repeat or time.perf_counter() - started < min_time:
+        t0 = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - t0) * 1e6 / items)
+
+    samples.sort()
+    return {
+        'items': items,
+        'runs': len(samples),
+        'mean_us': round(statistics.mean(samples), 3),
+        'p50_us': round(samples[len(samples) // 2], 3),
+        'p95_us': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        'min_us': round(samples[0], 3),
+    }
+
+
+def run_suite(repeat: int, min_time: float, only: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Run every benchmark (or those whose name contains `only`) and return their timings."""
+    scraper = PlaywrightScraper()
+    validator = DataValidator()
+    results = {}
+
+    def bench(name: str, function: Callable[[], Any], items: int) -> None:
+        if only and only not in name:
+            return
+        results[name] = measure(function, items, repeat, min_time)
+        print(f"  {name:<48}{results[name]['p50_us']:>12.2f} us/item  ({results[name]['runs']} runs)")
+
+    for fixture, entry in load_fixtures().items():
+        wrestler, school, page_html = entry['wrestler'], entry['school'], entry['html']
+        soup = BeautifulSoup(page_html, 'lxml')
+        table = soup.select_one('#results-table table') or soup.find('table')
+        rows = table.find_all('tr')[1:]
+        cell_rows = [[cell.get_text().strip() for cell in row.find_all(['td', 'th'])] for row in rows]
+        result_strings = [cells[5] for cells in cell_rows]
+        matches = scraper._parse_results_table(soup, wrestler, school)
+        if len(matches) != entry['rows']:
+            raise SystemExit(f"❌ {fixture}: parsed {len(matches)} matches, manifest says {entry['rows']}")
+
+        # Per wrestler: from received HTML to MatchData, and table selection + rows alone
+        bench(f'{fixture}/parse_results_html', lambda: scraper._parse_results_html(page_html, wrestler, school), 1)
+        bench(f'{fixture}/parse_results_table', lambda: scraper._parse_results_table(soup, wrestler, school), 1)
+
+        # Per row
+        bench(f'{fixture}/parse_match_row[element]',
+              lambda: [scraper._parse_match_row(row, wrestler, school) for row in rows], len(rows))
+        bench(f'{fixture}/parse_match_row[cells]',
+              lambda: [scraper._parse_match_row(cells, wrestler, school) for cells in cell_rows], len(rows))
+
+        def decode_cold():
+            decode_result.cache_clear()
+            return [scraper._parse_result_column(result) for result in result_strings]
+
+        bench(f'{fixture}/parse_result_column[cold]', decode_cold, len(result_strings))
+        bench(f'{fixture}/parse_result_column[warm]',
+              lambda: [scraper._parse_result_column(result) for result in result_strings], len(result_strings))
+
+        # Per match
+        def validate():
+            valid = [validator.validate_match_data(match) for match in matches]
+            validator.clear_validation_errors()
+            return valid
+
+        bench(f'{fixture}/validate_match_data', validate, len(matches))
+        bench(f'{fixture}/clean_match_data', lambda: [validator.clean_match_data(m) for m in matches], len(matches))
+
+    return results
+
+
+def environment() -> Dict[str, Any]:
+    """Where the numbers came from, so runs on different machines are not compared blindly."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=BENCHMARKS_DIR, timeout=5).stdout.strip() or None
+    except Exception:
+        commit = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'bs4': bs4.__version__,
+        'lxml': '.'.join(map(str, lxml.etree.LXML_VERSION)),
+    }
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any]) -> int:
+    """Print p50 changes against a baseline run; returns the number of regressions."""
+    regressions = 0
+    base_results = baseline.get('results', {})
+    base_env = baseline.get('environment', {})
+    print(f"\n📏 Against baseline {base_env.get('commit') or '?'} ({base_env.get('timestamp', '?')}):")
+
+    for name, timing in results.items():
+        base = base_results.get(name)
+        if not base:
+            print(f"  {name:<48}{'new':>12}")
+            continue
+        change = timing['p50_us'] / base['p50_us'] - 1 if base['p50_us'] else 0.0
+        flag = ''
+        if change > REGRESSION_THRESHOLD:
+            flag = '  ⚠️  slower'
+            regressions += 1
+        elif change < -REGRESSION_THRESHOLD:
+            flag = '  🚀 faster'
+        print(f"  {name:<48}{change:>+11.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--output', help='JSON file to save timings to (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--baseline', help='earlier JSON output to compare against')
+    parser.add_argument('--only', help='only run benchmarks whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=30, help='minimum runs per benchmark (default: 30)')
+    parser.add_argument('--min-time', type=float, default=0.5, help='minimum seconds per benchmark (default: 0.5)')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help=f'exit with status 1 if any p50 is >{REGRESSION_THRESHOLD:.0%} slower than the baseline')
+    args = parser.parse_args()
+
+    # Per-table "Found N matches" lines would swamp the report
+    logging.basicConfig(level=logging.ERROR)
+    logging.getLogger('src').setLevel(logging.ERROR)
+
+    print("⏱️  Parsing and validation hot path (p50 per item)")
+    results = run_suite(max(1, args.repeat), max(0.0, args.min_time), args.only)
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"hot_path-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=2)
+    print(f"\n💾 Saved {len(results)} timings to {output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f))
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark for results-table parsing.
+Parses the same wrestler HTML with each parser setup and reports the time
+per wrestler, after checking that every setup produces identical matches.
+Usage: python benchmarks/bench_parser.py [--html page.html | --archive DIR] [--repeat N]
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+import statistics
+from typing import Callable, Dict, List, Tuple
+
+# Run from anywhere: the scraper package lives one directory up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from src.html_archive import HtmlArchive
+from src.playwright_scraper import PlaywrightScraper
+
+
+DEFAULT_HTML = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'debug_html_output.html')
+
+# (wrestler, school, html) samples to parse
+Sample = Tuple[str, str, str]
+
+
+def load_samples(html_path: str, archive_dir: str, limit: int) -> List[Sample]:
+    """Samples from a saved page, or from the newest archived table per wrestler."""
+    if archive_dir:
+        archive = HtmlArchive(archive_dir)
+        try:
+            records = list(archive.records())[:limit]
+            return [(record.wrestler, record.school, archive.read(record)) for record in records]
+        finally:
+            archive.close()
+
+    with open(html_path, encoding='utf-8') as f:
+        return [('Benchmark Wrestler', 'Benchmark School', f.read())]
+
+
+def setups(scraper: PlaywrightScraper) -> Dict[str, Callable[[str], BeautifulSoup]]:
+    """Ways of turning results HTML into a soup, from the old default to the current one."""
+    return {
+        'html.parser, full page': lambda html: BeautifulSoup(html, 'html.parser'),
+        'lxml, full page': lambda html: BeautifulSoup(html, 'lxml'),
+        'html.parser, tables only': lambda html: BeautifulSoup(scraper._table_scope(html), 'html.parser'),
+        'lxml, tables only': lambda html: BeautifulSoup(scraper._table_scope(html), 'lxml'),
+    }
+
+
+def run(samples: List[Sample], repeat: int) -> None:
+    scraper = PlaywrightScraper()
+    baseline = None
+
+    print(f"{'setup':<28}{'ms/wrestler':>14}{'p95 ms':>10}{'speedup':>10}")
+    for name, make_soup in setups(scraper).items():
+        timings = []
+        parsed = []
+        for _ in range(repeat):
+            parsed = []
+            for wrestler, school, html in samples:
+                started = time.perf_counter()
+                parsed.append(scraper._parse_results_table(make_soup(html), wrestler, school))
+                timings.append((time.perf_counter() - started) * 1000)
+
+        if baseline is None:
+            baseline = (parsed, statistics.mean(timings))
+        elif parsed != baseline[0]:
+            raise SystemExit(f"❌ '{name}' produced different matches than '{next(iter(setups(scraper)))}'")
+
+        mean = statistics.mean(timings)
+        p95 = sorted(timings)[int(len(timings) * 0.95) - 1] if len(timings) > 1 else mean
+        print(f"{name:<28}{mean:>14.2f}{p95:>10.2f}{baseline[1] / mean:>9.1f}x")
+
+    print(f"\n✅ {len(samples)} wrestler page(s), {sum(len(m) for m in baseline[0])} matches, "
+          f"identical across all setups")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--html', default=DEFAULT_HTML, help='saved wrestler page (default: debug_html_output.html)')
+    parser.add_argument('--archive', help='HtmlArchive directory to sample wrestler tables from instead')
+    parser.add_argument('--limit', type=int, default=200, help='archived tables to sample (default: 200)')
+    parser.add_argument('--repeat', type=int, default=20, help='passes over the samples (default: 20)')
+    args = parser.parse_args()
+
+    # Per-table "Found N matches" lines would swamp the report
+    logging.basicConfig(level=logging.WARNING)
+
+    samples = load_samples(args.html, args.archive, args.limit)
+    if not samples:
+        raise SystemExit("❌ No samples to parse")
+    run(samples, max(1, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
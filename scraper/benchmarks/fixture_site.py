@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the DubStat database page, for offline crawl benchmarks.
+Serves the same #gender → #school → #wrestler → #get-results form, wired to
+an admin-ajax.php endpoint with the fetch_schools / fetch_wrestlers /
+fetch_results actions, so every scraper engine can crawl it unchanged.
+Roster sizes, response latency and injected errors are configurable.
+Usage: python benchmarks/fixture_site.py [--port 8766] [--schools 20] [--wrestlers 30] [--latency-ms 150]
+"""
+import os
+import sys
+import html
+import time
+import zlib
+import random
+import argparse
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from make_fixtures import FIXTURES_DIR, make_table, pseudonym
+
+
+AJAX_PATH = '/wp-admin/admin-ajax.php'
+JQUERY_PATH = '/wp-includes/js/jquery/jquery.min.js'
+
+# Just enough of jQuery for DubStat's inline script and the scraper's readiness check
+JQUERY_STANDIN = r'''
+(function (window, document) {
+    function Wrapped(elements) { this.elements = elements; }
+    Wrapped.prototype.each = function (fn) { this.elements.forEach(fn); return this; };
+    Wrapped.prototype.on = function (event, handler) {
+        return this.each(function (el) { el.addEventListener(event, function (e) { handler.call(el, e); }); });
+    };
+    Wrapped.prototype.val = function () { return this.elements.length ? this.elements[0].value : undefined; };
+    Wrapped.prototype.html = function (value) { return this.each(function (el) { el.innerHTML = value; }); };
+    Wrapped.prototype.text = function (value) { return this.each(function (el) { el.textContent = value; }); };
+    Wrapped.prototype.prop = function (name, value) { return this.each(function (el) { el[name] = value; }); };
+    Wrapped.prototype.show = function () { return this.each(function (el) { el.style.display = ''; }); };
+    Wrapped.prototype.ready = function (fn) { jQuery(fn); return this; };
+
+    var readyCallbacks = [];
+    function jQuery(target) {
+        if (typeof target === 'function') {
+            if (jQuery.isReady) { setTimeout(target, 0, jQuery); } else { readyCallbacks.push(target); }
+            return undefined;
+        }
+        if (typeof target === 'string') { return new Wrapped(Array.from(document.querySelectorAll(target))); }
+        return new Wrapped([target]);
+    }
+    jQuery.isReady = false;
+    jQuery.post = function (url, data, success) {
+        return fetch(url, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8'},
+            body: new URLSearchParams(data).toString()
+        }).then(function (response) {
+            if (!response.ok) { throw new Error('HTTP ' + response.status); }
+            return response.text();
+        }).then(function (text) {
+            if (success) { success(text); }
+        }).catch(function (error) { console.warn('$.post failed: ' + error.message); });
+    };
+    document.addEventListener('DOMContentLoaded', function () {
+        jQuery.isReady = true;
+        readyCallbacks.splice(0).forEach(function (fn) { fn(jQuery); });
+    });
+    window.jQuery = window.$ = jQuery;
+})(window, document);
+'''
+
+# The database page, reduced to the search form and DubStat's own inline script
+PAGE_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en-US">
+<head>
+<meta charset="UTF-8">
+<title>DubStat Database (local fixture)</title>
+<script type="text/javascript" src="{jquery}" id="jquery-core-js"></script>
+</head>
+<body>
+    <form id="wrestling-results-form">
+        <div class="filter-group">
+            <label for="gender">Boys/Girls:</label>
+            <select id="gender" name="gender">
+                <option value="">Select</option>
+{gender_options}
+            </select>
+        </div>
+        <div class="filter-group">
+            <label for="school">School:</label>
+            <select id="school" name="school" disabled><option value="">Select</option></select>
+        </div>
+        <div class="filter-group">
+            <label for="wrestler">Wrestler:</label>
+            <select id="wrestler" name="wrestler" disabled><option value="">Select</option></select>
+        </div>
+        <button type="button" id="get-results">Get Results</button>
+    </form>
+
+    <h2 id="wrestler-header" style="margin-top: 30px;"></h2>
+
+    <div id="results-table"></div>
+
+    <script>
+        var ajax_object = {{ ajaxurl: "{ajax_url}" }};
+
+        (function($) {{
+            $(document).ready(function() {{
+                $('#gender').on('change', function() {{
+                    const gender = $(this).val();
+                    if (gender) {{
+                        $.post(ajax_object.ajaxurl, {{
+                            action: 'fetch_schools',
+                            gender: gender
+                        }}, function(data) {{
+                            $('#school').html(data).prop('disabled', false);
+                            $('#wrestler').html('<option value="">Select</option>').prop('disabled', true);
+                        }});
+                    }}
+                }});
+
+                $('#school').on('change', function() {{
+                    const school = $(this).val();
+                    const gender = $('#gender').val();
+                    if (school && gender) {{
+                        $.post(ajax_object.ajaxurl, {{
+                            action: 'fetch_wrestlers',
+                            school: school,
+                            gender: gender
+                        }}, function(data) {{
+                            $('#wrestler').html(data).prop('disabled', false);
+                        }});
+                    }}
+                }});
+
+                $('#get-results').on('click', function() {{
+                    const gender = $('#gender').val();
+                    const school = $('#school').val();
+                    const wrestler = $('#wrestler').val();
+                    if (!gender || !school || !wrestler) {{
+                        return;
+                    }}
+                    $('#wrestler-header').text(wrestler + ' - ' + school).show();
+                    $.post(ajax_object.ajaxurl, {{
+                        action: 'fetch_results',
+                        gender: gender,
+                        school: school,
+                        wrestler: wrestler
+                    }}, function(data) {{
+                        $('#results-table').html(data);
+                    }});
+                }});
+            }});
+        }})(jQuery);
+    </script>
+</body>
+</html>
+'''
+
+EVENTS = [
+    'Millhaven Holiday Tournament', 'Foxmere Holiday Tournament', 'League Duals',
+    'Holiday Invitational', 'Sectional Championship', 'District Championship',
+]
+
+
+@dataclass
+class SiteConfig:
+    """Shape and behaviour of the fixture site."""
+    genders: tuple = ('Boys', 'Girls')
+    schools: int = 20
+    wrestlers: int = 30
+    min_rows: int = 5
+    max_rows: int = 40
+    latency_ms: float = 150.0
+    jitter_ms: float = 50.0
+    error_rate: float = 0.0
+    seed: int = 2025
+
+
+def _school_names() -> List[str]:
+    """Real school names from the fixture page's #school dropdown (public data)."""
+    from bs4 import BeautifulSoup
+    with open(os.path.join(FIXTURES_DIR, 'page_full.html'), encoding='utf-8') as f:
+        soup = BeautifulSoup(f.read(), 'lxml')
+    return [option.get_text() for option in soup.select('#school option') if option.get('value')]
+
+
+class FixtureSite:
+    """A threaded HTTP server playing the DubStat database page and its AJAX endpoint."""
+
+    def __init__(self, config: Optional[SiteConfig] = None, host: str = '127.0.0.1', port: int = 0):
+        """
+        Args:
+            config: Roster sizes, latency and error injection
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+        """
+        self.config = config or SiteConfig()
+        self._all_schools = _school_names()
+        self._rosters: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.errors_injected = 0
+
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                site._handle_get(self)
+
+            def do_POST(self):
+                site._handle_post(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Database page URL to hand to a scraper as base_url."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> 'FixtureSite':
+        self._thread = threading.Thread(target=self.server.serve_forever, name='fixture-site', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> 'FixtureSite':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def schools(self, gender: str) -> List[str]:
+        offset = self.config.genders.index(gender) * 7 if gender in self.config.genders else 0
+        return self._all_schools[offset:offset + self.config.schools]
+
+    def wrestlers(self, gender: str, school: str) -> List[str]:
+        """A school's roster: stable, unique pseudonyms."""
+        key = f"{gender}|{school}"
+        with self._lock:
+            if key not in self._rosters:
+                names, n = [], 0
+                while len(names) < self.config.wrestlers:
+                    name = pseudonym(f"{key}|{n}")
+                    if name not in names:
+                        names.append(name)
+                    n += 1
+                self._rosters[key] = names
+            return self._rosters[key]
+
+    def results_table(self, gender: str, school: str, wrestler: str) -> str:
+        """A wrestler's results table; the same wrestler always gets the same table."""
+        rng = random.Random(zlib.crc32(f"{self.config.seed}|{gender}|{school}|{wrestler}".encode('utf-8')))
+        rows = rng.randint(self.config.min_rows, self.config.max_rows)
+        return make_table(rng, rows, EVENTS, self._all_schools)
+
+    def total_wrestlers(self) -> int:
+        return len(self.config.genders) * self.config.schools * self.config.wrestlers
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    def _respond(self, handler: BaseHTTPRequestHandler, status: int, body: str,
+                 content_type: str = 'text/html; charset=UTF-8') -> None:
+        data = body.encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _handle_get(self, handler: BaseHTTPRequestHandler) -> None:
+        path = urlparse(handler.path).path
+        self._count(f"GET {path}")
+        if path == JQUERY_PATH:
+            self._respond(handler, 200, JQUERY_STANDIN, 'application/javascript; charset=UTF-8')
+            return
+        if path != '/':
+            self._respond(handler, 404, 'Not found', 'text/plain; charset=UTF-8')
+            return
+
+        gender_options = '\n'.join(
+            f'                <option value="{html.escape(g)}">{html.escape(g)}</option>' for g in self.config.genders
+        )
+        page = PAGE_TEMPLATE.format(jquery=JQUERY_PATH, gender_options=gender_options,
+                                    ajax_url=self.url.rstrip('/') + AJAX_PATH)
+        self._respond(handler, 200, page)
+
+    def _handle_post(self, handler: BaseHTTPRequestHandler) -> None:
+        if urlparse(handler.path).path != AJAX_PATH:
+            self._respond(handler, 404, '0', 'text/plain; charset=UTF-8')
+            return
+
+        length = int(handler.headers.get('Content-Length') or 0)
+        form = {k: v[0] for k, v in parse_qs(handler.rfile.read(length).decode('utf-8')).items()}
+        action = form.get('action', '')
+        self._count(action)
+
+        delay = self.config.latency_ms + random.uniform(-1, 1) * self.config.jitter_ms
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        gender, school = form.get('gender', ''), form.get('school', '')
+        if action == 'fetch_schools':
+            body = self._options(self.schools(gender))
+        elif action == 'fetch_wrestlers':
+            body = self._options(self.wrestlers(gender, school))
+        elif action == 'fetch_results':
+            # Errors are injected on the per-wrestler request, the one a crawl makes most
+            if random.random() < self.config.error_rate:
+                with self._lock:
+                    self.errors_injected += 1
+                self._respond(handler, 500, 'Internal Server Error', 'text/plain; charset=UTF-8')
+                return
+            body = self.results_table(gender, school, form.get('wrestler', ''))
+        else:
+            # WordPress answers unknown admin-ajax actions with "0"
+            body = '0'
+        self._respond(handler, 200, body)
+
+    @staticmethod
+    def _options(values: List[str]) -> str:
+        options = ['<option value="">Select</option>']
+        options += [f'<option value="{html.escape(v)}">{html.escape(v)}</option>' for v in values]
+        return ''.join(options)
+
+
+def add_site_arguments(parser: argparse.ArgumentParser) -> None:
+    """Fixture site options shared by this script and the crawl benchmark."""
+    defaults = SiteConfig()
+    parser.add_argument('--genders', default=','.join(defaults.genders), help='comma-separated genders')
+    parser.add_argument('--schools', type=int, default=defaults.schools, help='schools per gender')
+    parser.add_argument('--wrestlers', type=int, default=defaults.wrestlers, help='wrestlers per school')
+    parser.add_argument('--rows', default=f'{defaults.min_rows}-{defaults.max_rows}',
+                        help='results rows per wrestler, as MIN-MAX')
+    parser.add_argument('--latency-ms', type=float, default=defaults.latency_ms, help='AJAX response latency')
+    parser.add_argument('--jitter-ms', type=float, default=defaults.jitter_ms, help='+/- random latency')
+    parser.add_argument('--error-rate', type=float, default=defaults.error_rate,
+                        help='fraction of fetch_results requests answered with HTTP 500')
+    parser.add_argument('--seed', type=int, default=defaults.seed, help='seed for generated results')
+
+
+def site_config(args: argparse.Namespace) -> SiteConfig:
+    min_rows, _, max_rows = args.rows.partition('-')
+    return SiteConfig(
+        genders=tuple(g.strip() for g in args.genders.split(',') if g.strip()),
+        schools=args.schools,
+        wrestlers=args.wrestlers,
+        min_rows=int(min_rows),
+        max_rows=int(max_rows or min_rows),
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--host', default='127.0.0.1', help='interface to listen on')
+    parser.add_argument('--port', type=int, default=8766, help='port to listen on (default: 8766)')
+    add_site_arguments(parser)
+    args = parser.parse_args()
+
+    site = FixtureSite(site_config(args), host=args.host, port=args.port)
+    print(f"🤼 Fixture site: {site.url} ({site.total_wrestlers()} wrestlers)")
+    print(f"   Scrape it with DUBSTAT_BASE_URL={site.url}")
+    try:
+        site.server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️  Stopped")
+        site.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
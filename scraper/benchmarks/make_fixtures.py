@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Build the anonymized benchmark fixture corpus.
+Replaces every wrestler name, the results header and the results table's
+opponent schools and events in a saved DubStat page with stable
+pseudonyms, checks that none of the original names survive, then writes
+the page plus results tables of realistic sizes to benchmarks/fixtures/
+together with a manifest.
+Usage: python benchmarks/make_fixtures.py [--html debug_html_output.html]
+"""
+import os
+import sys
+import json
+import html
+import zlib
+import random
+import argparse
+from typing import Dict, List, Set
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from src.playwright_scraper import RESULT_COLUMNS
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCHMARKS_DIR, 'fixtures')
+DEFAULT_HTML = os.path.join(os.path.dirname(BENCHMARKS_DIR), 'debug_html_output.html')
+
+FIRST_NAMES = [
+    'Aaron', 'Blake', 'Caleb', 'Dylan', 'Ethan', 'Finn', 'Gavin', 'Hunter', 'Isaac', 'Jacob',
+    'Kyle', 'Logan', 'Mason', 'Nolan', 'Owen', 'Parker', 'Quinn', 'Ryan', 'Seth', 'Tyler',
+    'Victor', 'Wyatt', 'Xavier', 'Zane', 'Maya', 'Ella', 'Nora', 'Ava',
+]
+LAST_NAMES = [
+    'Abbott', 'Barker', 'Carver', 'Dalton', 'Ellis', 'Fowler', 'Garner', 'Hayes', 'Irwin',
+    'Jensen', 'Keller', 'Lawson', 'Mercer', 'Norris', "O'Neal", 'Porter', 'Quincy', 'Reyes',
+    'Sutton', 'Tucker', 'Underwood', 'Vaughn', 'Walsh', 'Yates', 'Zimmer', 'Smith-Cole',
+]
+
+# Fictional places for school and event pseudonyms
+PLACES = [
+    'Ashgrove', 'Brambleton', 'Cedarcrest', 'Dunmore', 'Elderbank', 'Foxmere', 'Glenhollow',
+    'Hartwell', 'Ivydale', 'Juniper Falls', 'Kestrel Bay', 'Larkspur', 'Millhaven', 'Northcott',
+    'Oakhurst', 'Pinecrest Valley', 'Quarry Hill', 'Rosemoor', 'Stillwater Bend', 'Thornbury',
+]
+SCHOOL_SUFFIXES = ['', ' North', ' South', ' Central', ' Valley', ' Heights']
+EVENT_KINDS = ['Invitational', 'Classic', 'Duals', 'Open', 'Freshman Tournament', 'Holiday Tournament']
+
+# Result column values in roughly the mix DubStat tables show
+RESULT_MIX = [
+    ('D ({w}-{l})', 30), ('F ({m}:{s:02d})', 30), ('MD ({w}-{l})', 12), ('TF ({w}-{l})', 10),
+    ('FF', 6), ('DQ', 1), ('SV-1 ({w}-{l})', 3), ('UTB ({w}-{l})', 2), ('Inj.', 1), ('{w}-{l}', 5),
+]
+
+# Rows per results table: a short season, a typical season, a state qualifier's season
+TABLE_SIZES = {'results_small': 9, 'results_typical': 32, 'results_large': 64}
+
+
+def _key(name: str) -> int:
+    return zlib.crc32(name.strip().lower().encode('utf-8'))
+
+
+def pseudonym(name: str) -> str:
+    """Stable fake name for a real one (the same person always gets the same pseudonym)."""
+    key = _key(name)
+    return f"{FIRST_NAMES[key % len(FIRST_NAMES)]} {LAST_NAMES[(key // len(FIRST_NAMES)) % len(LAST_NAMES)]}"
+
+
+def school_pseudonym(name: str) -> str:
+    """Stable fictional school name for a real one."""
+    key = _key(name)
+    return f"{PLACES[key % len(PLACES)]}{SCHOOL_SUFFIXES[(key // len(PLACES)) % len(SCHOOL_SUFFIXES)]}"
+
+
+def event_pseudonym(name: str) -> str:
+    """Stable fictional event name for a real one."""
+    key = _key(name)
+    return f"{PLACES[key % len(PLACES)]} {EVENT_KINDS[(key // len(PLACES)) % len(EVENT_KINDS)]}"
+
+
+def real_names(soup: BeautifulSoup) -> Dict[str, Set[str]]:
+    """Names in the source page that must not survive anonymization."""
+    columns = {name: RESULT_COLUMNS.index(name) for name in ('Event', 'Opponent', 'Opponent School')}
+    rows = [row.find_all('td') for row in soup.select('#results-table tr')]
+    rows = [cells for cells in rows if len(cells) == len(RESULT_COLUMNS)]
+    people = {option.get_text().strip() for option in soup.select('#wrestler option')
+              if option.get('value') not in (None, '', '0')}
+    people |= {cells[columns['Opponent']].get_text().strip() for cells in rows}
+
+    header = soup.select_one('#wrestler-header')
+    school = None
+    if header and ' - ' in header.get_text():
+        wrestler, school = header.get_text().strip().rsplit(' - ', 1)
+        people.add(wrestler.strip())
+    return {
+        'people': {name for name in people if name},
+        # Schools are public (the #school dropdown lists them all); only the ones tied
+        # to this wrestler's matches are identifying
+        'schools': {cells[columns['Opponent School']].get_text().strip() for cells in rows} | ({school} if school else set()),
+        'events': {cells[columns['Event']].get_text().strip() for cells in rows},
+    }
+
+
+def anonymize_page(page_html: str) -> BeautifulSoup:
+    """Replace wrestler names, the results header, and the results table's opponents,
+    opponent schools and events with pseudonyms."""
+    soup = BeautifulSoup(page_html, 'lxml')
+
+    for option in soup.select('#wrestler option'):
+        if option.get('value') not in (None, '', '0'):
+            fake = pseudonym(option.get_text())
+            option['value'] = fake
+            option.string = fake
+
+    header = soup.select_one('#wrestler-header')
+    if header and header.get_text().strip():
+        wrestler, _, school = header.get_text().strip().rpartition(' - ')
+        header.string = f"{pseudonym(wrestler or school)} - {school_pseudonym(school)}"
+
+    replacements = {
+        RESULT_COLUMNS.index('Event'): event_pseudonym,
+        RESULT_COLUMNS.index('Opponent'): pseudonym,
+        RESULT_COLUMNS.index('Opponent School'): school_pseudonym,
+    }
+    for row in soup.select('#results-table tr'):
+        cells = row.find_all('td')
+        for column, replace in replacements.items():
+            if len(cells) > column:
+                cells[column].string = replace(cells[column].get_text())
+    return soup
+
+
+def check_anonymized(names: Dict[str, Set[str]], page_html: str, tables: List[str]) -> None:
+    """Fail if any real name from the source page is still in the output."""
+    leaks = sorted(name for name in names['people'] if name in page_html)
+    # School names are short and common ("Mason", "Kings"), so compare whole cells and the header
+    cells = {td.get_text().strip() for table in tables for td in BeautifulSoup(table, 'lxml').find_all('td')}
+    header = BeautifulSoup(page_html, 'lxml').select_one('#wrestler-header')
+    if header:
+        cells.update(part.strip() for part in header.get_text().split(' - '))
+    leaks += sorted(cells & (names['schools'] | names['events']))
+    if leaks:
+        raise SystemExit(f"❌ Fixtures still contain real names: {leaks}")
+
+
+def make_result(rng: random.Random) -> str:
+    template = rng.choices([t for t, _ in RESULT_MIX], weights=[w for _, w in RESULT_MIX])[0]
+    loser = rng.randint(0, 9)
+    return template.format(w=loser + rng.randint(1, 17), l=loser, m=rng.randint(0, 5), s=rng.randint(0, 59))
+
+
+def make_table(rng: random.Random, rows: int, events: List[str], schools: List[str]) -> str:
+    """A results table in DubStat's markup with `rows` generated matches."""
+    body = []
+    for _ in range(rows):
+        cells = [
+            f"2025-{rng.randint(11, 12)}-{rng.randint(1, 28):02d}" if rng.random() < 0.5
+            else f"2026-0{rng.randint(1, 2)}-{rng.randint(1, 28):02d}",
+            rng.choice(events),
+            rng.choice(['Round 1', 'Round 2', 'Round 3', 'Quarterfinal', 'Semifinal', 'Final',
+                        'Cons. Round 2', '3rd Place', 'Round', 'Dual']),
+            rng.choice(['175', '190']),
+            rng.choice(['W', 'W', 'L']),
+            make_result(rng),
+            pseudonym(f"opponent-{rng.randint(0, 400)}"),
+            rng.choice(schools),
+        ]
+        body.append('<tr>' + ''.join(f'<td>{html.escape(cell)}</td>' for cell in cells) + '</tr>')
+
+    header = '<tr>\n' + ''.join(f'<th>{html.escape(name)}</th>\n' for name in RESULT_COLUMNS) + '</tr>'
+    return f"<table><thead>{header}</thead><tbody>{''.join(body)}</tbody></table>"
+
+
+def build(page_html: str, seed: int) -> Dict[str, dict]:
+    """Write the fixtures and return the manifest entries."""
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    names = real_names(BeautifulSoup(page_html, 'lxml'))
+    soup = anonymize_page(page_html)
+    rng = random.Random(seed)
+
+    table = soup.select_one('#results-table table')
+    real_rows = [[td.get_text() for td in tr.find_all('td')] for tr in table.find_all('tr')[1:]]
+    events = sorted({row[1] for row in real_rows}) + [
+        'League Duals', 'Sectional Championship', 'District Championship', 'Holiday Invitational',
+    ]
+    schools = sorted({school_pseudonym(f"school-{n}") for n in range(60)})
+
+    wrestler = pseudonym('fixture wrestler')
+    school = school_pseudonym('fixture school')
+    fixtures = {
+        # Full page as the DOM fallback sees it, and its table as fetch_results returns it
+        'page_full': (str(soup), 'page', len(real_rows)),
+        'results_page_table': (str(table), 'table', len(real_rows)),
+    }
+    for name, rows in TABLE_SIZES.items():
+        fixtures[name] = (make_table(rng, rows, events, schools), 'table', rows)
+
+    check_anonymized(names, fixtures['page_full'][0],
+                     [content for name, (content, kind, _) in fixtures.items() if kind == 'table'])
+
+    manifest = {}
+    for name, (content, kind, rows) in fixtures.items():
+        with open(os.path.join(FIXTURES_DIR, f'{name}.html'), 'w', encoding='utf-8') as f:
+            f.write(content)
+        manifest[name] = {'file': f'{name}.html', 'kind': kind, 'rows': rows,
+                          'wrestler': wrestler, 'school': school}
+
+    with open(os.path.join(FIXTURES_DIR, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--html', default=DEFAULT_HTML, help='saved DubStat page (default: debug_html_output.html)')
+    parser.add_argument('--seed', type=int, default=2025, help='seed for generated tables (default: 2025)')
+    args = parser.parse_args()
+
+    with open(args.html, encoding='utf-8') as f:
+        manifest = build(f.read(), args.seed)
+    for name, entry in manifest.items():
+        print(f"📄 {entry['file']}: {entry['rows']} rows ({entry['kind']})")
+    print(f"✅ Wrote {len(manifest)} fixtures to {FIXTURES_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,16 +17,70 @@ class Settings:
     SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
     SUPABASE_ANON_KEY: str = os.getenv("SUPABASE_ANON_KEY", "")
     SUPABASE_SERVICE_ROLE_KEY: str = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
+    # Load every wrestler and tournament id when the client starts, so lookups by name are local
+    SUPABASE_PRELOAD_IDS: bool = os.getenv("SUPABASE_PRELOAD_IDS", "true").lower() == "true"
+    
+    # Pooled PostgREST sessions per Supabase project, shared by every SupabaseClient in the process
+    SUPABASE_HTTP_POOL_SIZE: int = int(os.getenv("SUPABASE_HTTP_POOL_SIZE", "10"))
     
     # Database Configuration
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    # psycopg2 connections per DATABASE_URL (COPY loader)
+    DATABASE_POOL_SIZE: int = int(os.getenv("DATABASE_POOL_SIZE", "4"))
+    # Pooled connections idle longer than this many seconds are tested before reuse
+    DATABASE_POOL_HEALTH_CHECK: float = float(os.getenv("DATABASE_POOL_HEALTH_CHECK", "30"))
     
     # Scraper Configuration
     SCRAPER_USER_AGENT: str = os.getenv("SCRAPER_USER_AGENT", "Mozilla/5.0 (compatible; WrestlingAnalytics/1.0)")
     SCRAPER_REQUEST_TIMEOUT: int = int(os.getenv("SCRAPER_REQUEST_TIMEOUT", "30"))
     SCRAPER_MAX_RETRIES: int = int(os.getenv("SCRAPER_MAX_RETRIES", "3"))
     SCRAPER_RETRY_DELAY: int = int(os.getenv("SCRAPER_RETRY_DELAY", "1"))
+    # Matches per write-behind database batch (0 writes each wrestler's matches as its own batch)
     SCRAPER_BATCH_SIZE: int = int(os.getenv("SCRAPER_BATCH_SIZE", "100"))
+    # Seconds a queued match may wait before a partial write-behind batch is written
+    SCRAPER_WRITE_DELAY: float = float(os.getenv("SCRAPER_WRITE_DELAY", "2"))
+    # Where write-behind batches go: rest (Supabase/PostgREST) or copy (COPY loader over DATABASE_URL)
+    SCRAPER_WRITE_SINK: str = os.getenv("SCRAPER_WRITE_SINK", "rest")
+    SCRAPER_WORKERS: int = int(os.getenv("SCRAPER_WORKERS", "1"))
+    SCRAPER_ENGINE: str = os.getenv("SCRAPER_ENGINE", "sync")
+    SCRAPER_CONCURRENCY: int = int(os.getenv("SCRAPER_CONCURRENCY", "4"))
+    # Where browser engines read results from: xhr (intercepted response), dom or evaluate (in-page rows)
+    SCRAPER_RESULTS_SOURCE: str = os.getenv("SCRAPER_RESULTS_SOURCE", "xhr")
+    # Queue size between the sync engine's parse, validate and write stages (0 = inline)
+    SCRAPER_PIPELINE_DEPTH: int = int(os.getenv("SCRAPER_PIPELINE_DEPTH", "16"))
+    # BeautifulSoup backend for results tables: lxml (fast, C-backed) or html.parser
+    SCRAPER_HTML_PARSER: str = os.getenv("SCRAPER_HTML_PARSER", "lxml")
+    # Block images, fonts, stylesheets, media and third-party requests in the browser
+    SCRAPER_LEAN_PROFILE: bool = os.getenv("SCRAPER_LEAN_PROFILE", "false").lower() == "true"
+    # SQLite crawl frontier used to resume interrupted runs (empty disables it)
+    SCRAPER_FRONTIER_PATH: str = os.getenv("SCRAPER_FRONTIER_PATH", "scraper_state/frontier.sqlite")
+    # Hours after which an unfinished frontier run is abandoned instead of resumed (0 = always resume)
+    SCRAPER_FRONTIER_MAX_AGE: float = float(os.getenv("SCRAPER_FRONTIER_MAX_AGE", "12"))
+    # SQLite cache of results-table fingerprints used to skip unchanged wrestlers (empty disables it)
+    SCRAPER_RESULTS_CACHE_PATH: str = os.getenv("SCRAPER_RESULTS_CACHE_PATH", "scraper_state/results_cache.sqlite")
+    # Compressed archive of every received results table (empty disables it); gzip or zstd
+    SCRAPER_ARCHIVE_DIR: str = os.getenv("SCRAPER_ARCHIVE_DIR", "scraper_state/html_archive")
+    SCRAPER_ARCHIVE_COMPRESSION: str = os.getenv("SCRAPER_ARCHIVE_COMPRESSION", "gzip")
+    
+    # Crawl selection: comma-separated lists, "all" selects every option
+    SCRAPER_GENDERS: str = os.getenv("SCRAPER_GENDERS", "boys")
+    SCRAPER_SCHOOLS: str = os.getenv("SCRAPER_SCHOOLS", "Olentangy Liberty")
+    SCRAPER_EXCLUDE_SCHOOLS: str = os.getenv("SCRAPER_EXCLUDE_SCHOOLS", "")
+    SCRAPER_SCHOOL_PATTERN: str = os.getenv("SCRAPER_SCHOOL_PATTERN", "")
+    SCRAPER_SCHOOLS_FILE: str = os.getenv("SCRAPER_SCHOOLS_FILE", "")
+    # Deterministic partition of the selected schools (index is 0-based)
+    SCRAPER_SHARD_INDEX: int = int(os.getenv("SCRAPER_SHARD_INDEX", "0"))
+    SCRAPER_SHARD_COUNT: int = int(os.getenv("SCRAPER_SHARD_COUNT", "1"))
+    # Shard processes started by run_coordinator.py
+    SCRAPER_PROCESSES: int = int(os.getenv("SCRAPER_PROCESSES", "4"))
+    # Resident scraper service (scraper_service.py) used by the dashboard
+    SCRAPER_SERVICE_HOST: str = os.getenv("SCRAPER_SERVICE_HOST", "127.0.0.1")
+    SCRAPER_SERVICE_PORT: int = int(os.getenv("SCRAPER_SERVICE_PORT", "8765"))
+    SCRAPER_SERVICE_PAGE_TTL: int = int(os.getenv("SCRAPER_SERVICE_PAGE_TTL", "1800"))
+    # Database page to scrape; empty means DubStat's own (point at a local fixture site to test)
+    DUBSTAT_BASE_URL: str = os.getenv("DUBSTAT_BASE_URL", "")
+    # admin-ajax.php endpoint for the HTTP engine; discovered from the page when empty
+    DUBSTAT_AJAX_URL: str = os.getenv("DUBSTAT_AJAX_URL", "")
     
     # API Configuration
     API_HOST: str = os.getenv("API_HOST", "localhost")
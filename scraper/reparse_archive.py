@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Offline reparse of the raw results HTML archive.
+Runs every archived results table through the scraper's parser, validation
+and cleaning on all CPU cores, and writes the matches to the database (through
+SupabaseClient, or COPY over DATABASE_URL) or to a JSON Lines file. No browser
+and no network access to DubStat is needed.
+Usage: python reparse_archive.py [--output db|copy|matches.jsonl] [--processes N]
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from run_scraper import setup_logging, settings, PlaywrightScraper
+from src.html_archive import HtmlArchive, ArchiveRecord
+from src.models import MatchData
+from src.supabase_client import SupabaseClient
+from src.copy_loader import CopyLoader, CopyLoaderError
+from src.connections import close_all
+
+
+# Per-process parser state, set up once by _init_worker
+_archive: Optional[HtmlArchive] = None
+_parser: Optional[PlaywrightScraper] = None
+
+
+def _init_worker(archive_dir: str) -> None:
+    """Open the archive and build a parser once per worker process."""
+    global _archive, _parser
+    _archive = HtmlArchive(archive_dir)
+    _parser = PlaywrightScraper(html_parser=settings.SCRAPER_HTML_PARSER)
+    # Per-table "Found N matches" lines would drown out the progress log
+    logging.getLogger('src.playwright_scraper').setLevel(logging.WARNING)
+    logging.getLogger('src.data_validator').setLevel(logging.ERROR)
+
+
+def _parse_chunk(records: List[ArchiveRecord]) -> List[Tuple[ArchiveRecord, List[MatchData], int, Optional[str]]]:
+    """
+    Parse, validate and clean a chunk of archived results tables.
+
+    Matches go through the same validate → clean steps as
+    SupabaseClient.batch_insert_matches, so the output is what a live run
+    would have written.
+
+    Returns:
+        (record, cleaned matches, invalid match count, error) per record
+    """
+    results = []
+    for record in records:
+        try:
+            html = _archive.read(record)
+            matches = _parser._parse_results_html(html, record.wrestler, record.school)
+
+            cleaned = []
+            for match in matches:
+                if _parser.validator.validate_match_data(match):
+                    cleaned.append(_parser.validator.clean_match_data(match))
+            _parser.validator.clear_validation_errors()
+
+            results.append((record, cleaned, len(matches) - len(cleaned), None))
+        except Exception as e:
+            results.append((record, [], 0, str(e)))
+    return results
+
+
+def match_to_dict(match: MatchData) -> Dict[str, Any]:
+    """JSON-ready form of a MatchData (enums as values, dates as ISO strings)."""
+    data = asdict(match)
+    data['match_type'] = match.match_type.value
+    data['date'] = match.date.isoformat() if match.date else None
+    return data
+
+
+def chunked(records: List[ArchiveRecord], size: int) -> List[List[ArchiveRecord]]:
+    return [records[i:i + size] for i in range(0, len(records), size)]
+
+
+def reparse(archive_dir: str, output: str, processes: int, chunk_size: int,
+            all_versions: bool = False, copy_batch: int = 20000) -> Dict[str, Any]:
+    """
+    Reparse the archive and send the matches to `output`.
+
+    Args:
+        archive_dir: HtmlArchive directory
+        output: 'db' for the normal database writer, 'copy' for CopyLoader,
+            otherwise a .jsonl path
+        processes: Parser processes
+        chunk_size: Records handed to a process at a time
+        all_versions: Reparse every archived version, not just the newest per wrestler
+        copy_batch: Matches per COPY transaction when output is 'copy'
+
+    Returns:
+        Summary statistics
+    """
+    logger = logging.getLogger(__name__)
+
+    archive = HtmlArchive(archive_dir)
+    records = list(archive.records(latest_only=not all_versions))
+    archive.close()
+    logger.info(f"Reparsing {len(records)} archived results tables with {processes} processes")
+
+    stats = {
+        'records': len(records),
+        'matches': 0,
+        'invalid_matches': 0,
+        'parse_errors': 0,
+        'successful_inserts': 0,
+        'write_errors': 0,
+        'start_time': datetime.now(),
+        'end_time': None,
+    }
+
+    db_client = SupabaseClient() if output == 'db' else None
+    loader = CopyLoader(settings.DATABASE_URL, validate=False) if output == 'copy' else None
+    out_file = open(output, 'w', encoding='utf-8') if output not in ('db', 'copy') else None
+    pending: List[MatchData] = []
+
+    def flush_copy() -> None:
+        try:
+            loader.load_matches(pending)
+            stats['successful_inserts'] += len(pending)
+        except CopyLoaderError as e:
+            logger.error(str(e))
+            stats['write_errors'] += len(pending)
+        pending.clear()
+
+    try:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                 initargs=(archive_dir,)) as pool:
+            futures = [pool.submit(_parse_chunk, chunk) for chunk in chunked(records, chunk_size)]
+
+            # Parsing fans out; writing stays in this process, like the live scraper
+            for done, future in enumerate(as_completed(futures), 1):
+                for record, matches, invalid, error in future.result():
+                    if error:
+                        logger.error(f"Could not reparse {record.wrestler} ({record.school}): {error}")
+                        stats['parse_errors'] += 1
+                        continue
+
+                    stats['matches'] += len(matches)
+                    stats['invalid_matches'] += invalid
+                    if not matches:
+                        continue
+
+                    if out_file:
+                        for match in matches:
+                            line = {'gender': record.gender, 'school': record.school,
+                                    'wrestler': record.wrestler, 'archive_record': record.id,
+                                    **match_to_dict(match)}
+                            out_file.write(json.dumps(line) + '\n')
+                        stats['successful_inserts'] += len(matches)
+                    elif loader:
+                        pending.extend(matches)
+                        if len(pending) >= copy_batch:
+                            flush_copy()
+                    elif db_client.batch_insert_matches(matches, prevalidated=True):
+                        stats['successful_inserts'] += len(matches)
+                    else:
+                        stats['write_errors'] += len(matches)
+
+                logger.info(f"Chunk {done}/{len(futures)} done ({stats['matches']} matches so far)")
+
+            if pending:
+                flush_copy()
+    finally:
+        if out_file:
+            out_file.close()
+        close_all()
+        stats['end_time'] = datetime.now()
+
+    return stats
+
+
+def main():
+    """Main function to reparse the archive."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--archive', default=settings.SCRAPER_ARCHIVE_DIR,
+                        help='HTML archive directory (default: SCRAPER_ARCHIVE_DIR)')
+    parser.add_argument('--output', default='db',
+                        help="'db' to write through SupabaseClient, 'copy' to COPY over DATABASE_URL, "
+                             "or a .jsonl file path (default: db)")
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                        help='parser processes (default: all CPU cores)')
+    parser.add_argument('--chunk-size', type=int, default=200,
+                        help='archived tables per work item (default: 200)')
+    parser.add_argument('--copy-batch', type=int, default=20000,
+                        help='matches per COPY transaction with --output copy (default: 20000)')
+    parser.add_argument('--all-versions', action='store_true',
+                        help='reparse every archived version, not only the newest per wrestler')
+    args = parser.parse_args()
+
+    if not args.archive or not os.path.isdir(args.archive):
+        print(f"❌ Archive directory not found: {args.archive!r}")
+        sys.exit(1)
+
+    print(f"🗄️  Reparsing archive: {args.archive}")
+    print(f"📅 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-" * 60)
+
+    setup_logging(log_prefix='reparse')
+
+    started = time.perf_counter()
+    stats = reparse(args.archive, args.output, max(1, args.processes), max(1, args.chunk_size),
+                    all_versions=args.all_versions, copy_batch=max(1, args.copy_batch))
+    elapsed = time.perf_counter() - started
+
+    print("-" * 60)
+    print("📊 REPARSE SUMMARY:")
+    print(f"  🗄️  Archived tables: {stats['records']}")
+    print(f"  🥊 Valid matches: {stats['matches']}")
+    print(f"  ⚠️  Invalid matches skipped: {stats['invalid_matches']}")
+    print(f"  ❌ Parse errors: {stats['parse_errors']}")
+    print(f"  ✅ Written to {args.output}: {stats['successful_inserts']}")
+    if stats['write_errors']:
+        print(f"  ❌ Write errors: {stats['write_errors']}")
+    print(f"  ⏱️  Total time: {elapsed:.1f}s ({stats['records'] / max(elapsed, 1e-9):.0f} tables/s)")
+
+
+if __name__ == "__main__":
+    main()
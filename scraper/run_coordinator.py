@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Multi-process sharded crawl coordinator.
+Splits the selected schools into shards and runs each shard in its own
+process (with its own browser), then merges the per-shard statistics.
+Usage: python run_coordinator.py
+"""
+import os
+import sys
+import queue
+import logging
+import multiprocessing
+from datetime import datetime
+from typing import Any, Dict, List
+
+from run_scraper import setup_logging, create_scraper, print_summary, settings, SelectionSpec
+
+
+# Counters that are simply added up across shards
+SUMMED_STATS = [
+    'total_matches',
+    'total_wrestlers',
+    'total_schools',
+    'successful_inserts',
+    'errors',
+    'skipped_done',
+    'cache_hits',
+    'cache_misses',
+    'archived',
+]
+
+
+def shard_selection(shard: int, processes: int) -> SelectionSpec:
+    """
+    Selection for one process of this coordinator.
+
+    If SCRAPER_SHARD_INDEX/COUNT already split the crawl across machines, each
+    process takes a sub-shard of this machine's shard: with M machines and P
+    processes, process j of machine i scrapes shard i + M*j of M*P, which is
+    always a subset of shard i of M.
+    """
+    base = SelectionSpec.from_settings(settings)
+    return base.with_shard(base.shard_index + base.shard_count * shard, base.shard_count * processes)
+
+
+def shard_frontier_path(shard: int, processes: int) -> str:
+    """Per-shard frontier file, so shards resume independently of each other."""
+    if not settings.SCRAPER_FRONTIER_PATH:
+        return ''
+    root, ext = os.path.splitext(settings.SCRAPER_FRONTIER_PATH)
+    return f"{root}.shard-{shard + 1}-of-{processes}{ext}"
+
+
+def run_shard(shard: int, processes: int, results: multiprocessing.Queue) -> None:
+    """Process entry point: scrape one shard and report its stats."""
+    setup_logging(
+        log_prefix=f'scraper_shard{shard + 1}',
+        log_format=f'%(asctime)s - shard {shard + 1}/{processes} - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger = logging.getLogger(__name__)
+
+    selection = shard_selection(shard, processes)
+    logger.info(f"Starting shard {shard + 1}/{processes}: {selection.describe()}")
+
+    scraper = create_scraper(selection=selection, frontier_path=shard_frontier_path(shard, processes))
+    stats = scraper.scrape_all_data()
+    results.put((shard, stats))
+
+
+def merge_stats(shard_stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine per-shard stats into one report in the same shape as a single run."""
+    merged: Dict[str, Any] = {key: 0 for key in SUMMED_STATS}
+    readiness: Dict[str, Dict[str, Any]] = {}
+    lean: Dict[str, Any] = {}
+    frontier: Dict[str, int] = {}
+    pipeline: Dict[str, Any] = {}
+    write_behind: Dict[str, Any] = {}
+
+    for stats in shard_stats:
+        for key in SUMMED_STATS:
+            merged[key] += stats.get(key, 0)
+
+        for label, timing in stats.get('readiness', {}).items():
+            entry = readiness.setdefault(label, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'fallbacks': 0})
+            entry['count'] += timing['count']
+            entry['total_ms'] += timing['avg_ms'] * timing['count']
+            entry['max_ms'] = max(entry['max_ms'], timing['max_ms'])
+            entry['fallbacks'] += timing['fallbacks']
+
+        for key, value in stats.get('lean_profile', {}).items():
+            if isinstance(value, dict):
+                counts = lean.setdefault(key, {})
+                for name, count in value.items():
+                    counts[name] = counts.get(name, 0) + count
+            else:
+                lean[key] = lean.get(key, 0) + value
+
+        for status, count in stats.get('frontier', {}).items():
+            frontier[status] = frontier.get(status, 0) + count
+
+        if stats.get('pipeline'):
+            shard_pipeline = stats['pipeline']
+            pipeline['depth'] = shard_pipeline['depth']
+            pipeline['submit_wait_s'] = round(pipeline.get('submit_wait_s', 0) + shard_pipeline['submit_wait_s'], 2)
+            items = pipeline.setdefault('items', {})
+            for stage, count in shard_pipeline['items'].items():
+                items[stage] = items.get(stage, 0) + count
+
+        if stats.get('write_behind'):
+            shard_writes = stats['write_behind']
+            for key in ('batches', 'matches', 'failed_batches', 'put_wait_s'):
+                write_behind[key] = round(write_behind.get(key, 0) + shard_writes[key], 2)
+            # Latency percentiles cannot be combined exactly; report the worst shard
+            for key in ('max_batch', 'max_backlog', 'flush_latency_p50_ms', 'flush_latency_p95_ms', 'flush_latency_max_ms'):
+                write_behind[key] = max(write_behind.get(key, 0), shard_writes[key])
+            reasons = write_behind.setdefault('flush_reasons', {})
+            for reason, count in shard_writes['flush_reasons'].items():
+                reasons[reason] = reasons.get(reason, 0) + count
+            write_behind['batch_size'] = shard_writes['batch_size']
+            write_behind['max_delay_s'] = shard_writes['max_delay_s']
+
+    merged['readiness'] = {
+        label: {
+            'count': entry['count'],
+            'avg_ms': round(entry['total_ms'] / max(entry['count'], 1), 1),
+            'max_ms': entry['max_ms'],
+            'fallbacks': entry['fallbacks'],
+        }
+        for label, entry in readiness.items()
+    }
+    if lean:
+        merged['lean_profile'] = lean
+    if frontier:
+        merged['frontier'] = frontier
+    if pipeline:
+        merged['pipeline'] = pipeline
+    if write_behind:
+        write_behind['avg_batch'] = round(write_behind['matches'] / max(write_behind['batches'], 1), 1)
+        merged['write_behind'] = write_behind
+    if not any('cache_hits' in stats for stats in shard_stats):
+        del merged['cache_hits'], merged['cache_misses']
+    if not any('archived' in stats for stats in shard_stats):
+        del merged['archived']
+
+    start_times = [s['start_time'] for s in shard_stats if s.get('start_time')]
+    end_times = [s['end_time'] for s in shard_stats if s.get('end_time')]
+    merged['start_time'] = min(start_times) if start_times else None
+    merged['end_time'] = max(end_times) if end_times else None
+    merged['resumed'] = any(s.get('resumed') for s in shard_stats)
+    return merged
+
+
+def run_shards(processes: int, max_restarts: int) -> Dict[int, Dict[str, Any]]:
+    """
+    Run every shard in its own process, restarting shards that crash.
+
+    A restarted shard resumes from its own frontier file; shards that are
+    still running or already finished are not affected.
+
+    Returns:
+        Stats per shard index, for the shards that completed
+    """
+    logger = logging.getLogger(__name__)
+
+    # Playwright is not fork-safe: every shard gets a fresh interpreter
+    ctx = multiprocessing.get_context('spawn')
+    results = ctx.Queue()
+
+    def start(shard: int):
+        process = ctx.Process(target=run_shard, args=(shard, processes, results), name=f'shard-{shard + 1}')
+        process.start()
+        return process
+
+    running = {shard: start(shard) for shard in range(processes)}
+    restarts = {shard: 0 for shard in range(processes)}
+    completed: Dict[int, Dict[str, Any]] = {}
+
+    def collect(timeout: float) -> None:
+        try:
+            while True:
+                shard, stats = results.get(timeout=timeout)
+                completed[shard] = stats
+        except queue.Empty:
+            pass
+
+    while running:
+        collect(timeout=1)
+
+        for shard, process in list(running.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            del running[shard]
+
+            if shard not in completed:
+                # The result may still be in flight from a process that just exited
+                collect(timeout=1)
+            if shard in completed:
+                logger.info(f"✅ Shard {shard + 1}/{processes} finished")
+                continue
+
+            if restarts[shard] < max_restarts:
+                restarts[shard] += 1
+                logger.warning(f"💥 Shard {shard + 1}/{processes} exited with code {process.exitcode}, "
+                               f"restarting ({restarts[shard]}/{max_restarts})")
+                running[shard] = start(shard)
+            else:
+                logger.error(f"❌ Shard {shard + 1}/{processes} failed after {max_restarts} restarts")
+
+    return completed
+
+
+def main():
+    """Main function to run the sharded crawl."""
+    processes = max(1, settings.SCRAPER_PROCESSES)
+
+    print(f"🏆 Wrestling Analytics Scraper (sharded, {processes} processes)")
+    print(f"📅 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-" * 60)
+
+    setup_logging(log_prefix='coordinator')
+    logger = logging.getLogger(__name__)
+
+    try:
+        completed = run_shards(processes, max_restarts=settings.SCRAPER_MAX_RETRIES)
+
+        print("-" * 60)
+        for shard in range(processes):
+            stats = completed.get(shard)
+            if stats is None:
+                print(f"  ❌ Shard {shard + 1}/{processes}: failed (progress kept in its frontier)")
+            else:
+                print(f"  ✅ Shard {shard + 1}/{processes}: {stats['total_schools']} schools, "
+                      f"{stats['total_wrestlers']} wrestlers, {stats['total_matches']} matches, "
+                      f"{stats['errors']} errors")
+
+        stats = merge_stats(list(completed.values()))
+        print_summary(stats)
+
+        if len(completed) < processes:
+            print()
+            print("⚠️  Some shards failed. Re-run the coordinator to resume them.")
+            sys.exit(1)
+
+        print()
+        print("✅ Sharded scraping completed!")
+
+    except KeyboardInterrupt:
+        print("\n⏹️  Scraping interrupted by user")
+        logger.info("Scraping interrupted by user")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
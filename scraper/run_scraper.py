@@ -17,6 +17,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 try:
     from src.playwright_scraper import PlaywrightScraper
+    from src.async_playwright_scraper import AsyncPlaywrightScraper
+    from src.http_scraper import HttpScraper
+    from src.frontier import CrawlFrontier
+    from src.results_cache import ResultsCache
+    from src.selection import SelectionSpec
+    from src.html_archive import HtmlArchive
+    from src.copy_loader import CopyLoader
+    from config.settings import settings
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("Make sure you're in the scraper directory and have installed dependencies:")
@@ -26,18 +34,181 @@ except ImportError as e:
     sys.exit(1)
 
 
-def setup_logging():
+def setup_logging(log_prefix: str = 'scraper',
+                  log_format: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'):
     """Set up logging configuration."""
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler(f'scraper_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+            logging.FileHandler(f'{log_prefix}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
         ]
     )
 
 
+def create_frontier(path: str = None):
+    """Open the durable crawl frontier, or return None if it is disabled."""
+    path = settings.SCRAPER_FRONTIER_PATH if path is None else path
+    if not path:
+        return None
+    return CrawlFrontier(path, max_attempts=settings.SCRAPER_MAX_RETRIES,
+                         max_age_hours=settings.SCRAPER_FRONTIER_MAX_AGE)
+
+
+def create_results_cache():
+    """Open the results fingerprint cache, or return None if it is disabled."""
+    if not settings.SCRAPER_RESULTS_CACHE_PATH:
+        return None
+    return ResultsCache(settings.SCRAPER_RESULTS_CACHE_PATH)
+
+
+def create_archive():
+    """Open the raw results HTML archive, or return None if it is disabled."""
+    if not settings.SCRAPER_ARCHIVE_DIR:
+        return None
+    return HtmlArchive(settings.SCRAPER_ARCHIVE_DIR, compression=settings.SCRAPER_ARCHIVE_COMPRESSION)
+
+
+def create_copy_loader():
+    """Open the COPY loader when SCRAPER_WRITE_SINK=copy, or return None to write through the REST API."""
+    sink = settings.SCRAPER_WRITE_SINK.lower()
+    if sink == 'rest':
+        return None
+    if sink != 'copy':
+        raise ValueError(f"Unknown SCRAPER_WRITE_SINK {settings.SCRAPER_WRITE_SINK!r}, expected 'rest' or 'copy'")
+    if settings.SCRAPER_BATCH_SIZE <= 0:
+        raise ValueError("SCRAPER_WRITE_SINK=copy loads write-behind batches; set SCRAPER_BATCH_SIZE above 0")
+    # Matches are validated and cleaned before they are queued
+    return CopyLoader(settings.DATABASE_URL, validate=False)
+
+
+def create_scraper(selection: SelectionSpec = None, frontier_path: str = None):
+    """
+    Build the scraper engine selected by SCRAPER_ENGINE from settings.
+    
+    Args:
+        selection: Overrides the selection built from settings (e.g. one shard)
+        frontier_path: Overrides SCRAPER_FRONTIER_PATH
+    """
+    engine = settings.SCRAPER_ENGINE.lower()
+    frontier = create_frontier(frontier_path)
+    results_cache = create_results_cache()
+    archive = create_archive()
+    copy_loader = create_copy_loader()
+    if copy_loader:
+        print(f"🚚 Writing matches with the COPY loader in batches of {settings.SCRAPER_BATCH_SIZE}")
+    selection = selection or SelectionSpec.from_settings(settings)
+    print(f"🎯 Selection: {selection.describe()}")
+    
+    if engine == 'http':
+        print(f"🌐 Using browserless HTTP engine with {settings.SCRAPER_CONCURRENCY} concurrent requests")
+        return HttpScraper(
+            concurrency=settings.SCRAPER_CONCURRENCY,
+            ajax_url=settings.DUBSTAT_AJAX_URL or None,
+            user_agent=settings.SCRAPER_USER_AGENT,
+            timeout=settings.SCRAPER_REQUEST_TIMEOUT,
+            max_retries=settings.SCRAPER_MAX_RETRIES,
+            retry_delay=settings.SCRAPER_RETRY_DELAY,
+            frontier=frontier,
+            results_cache=results_cache,
+            selection=selection,
+            archive=archive,
+            html_parser=settings.SCRAPER_HTML_PARSER,
+            base_url=settings.DUBSTAT_BASE_URL or None,
+            write_batch_size=settings.SCRAPER_BATCH_SIZE,
+            write_delay=settings.SCRAPER_WRITE_DELAY,
+            copy_loader=copy_loader
+        )
+    
+    if engine == 'async':
+        print(f"⚡ Using async engine with {settings.SCRAPER_CONCURRENCY} concurrent pages")
+        return AsyncPlaywrightScraper(
+            headless=True,
+            concurrency=settings.SCRAPER_CONCURRENCY,
+            results_source=settings.SCRAPER_RESULTS_SOURCE,
+            lean=settings.SCRAPER_LEAN_PROFILE,
+            frontier=frontier,
+            results_cache=results_cache,
+            selection=selection,
+            archive=archive,
+            html_parser=settings.SCRAPER_HTML_PARSER,
+            base_url=settings.DUBSTAT_BASE_URL or None,
+            write_batch_size=settings.SCRAPER_BATCH_SIZE,
+            write_delay=settings.SCRAPER_WRITE_DELAY,
+            copy_loader=copy_loader
+        )
+    
+    if settings.SCRAPER_WORKERS > 1:
+        print(f"👷 Using {settings.SCRAPER_WORKERS} parallel browser workers")
+    return PlaywrightScraper(
+        headless=True,  # Set to False for debugging
+        workers=settings.SCRAPER_WORKERS,
+        results_source=settings.SCRAPER_RESULTS_SOURCE,
+        lean=settings.SCRAPER_LEAN_PROFILE,
+        frontier=frontier,
+        results_cache=results_cache,
+        selection=selection,
+        archive=archive,
+        html_parser=settings.SCRAPER_HTML_PARSER,
+        pipeline_depth=settings.SCRAPER_PIPELINE_DEPTH,
+        base_url=settings.DUBSTAT_BASE_URL or None,
+        write_batch_size=settings.SCRAPER_BATCH_SIZE,
+        write_delay=settings.SCRAPER_WRITE_DELAY,
+        copy_loader=copy_loader
+    )
+
+
+def print_summary(stats):
+    """Print the run statistics returned by scrape_all_data."""
+    print("-" * 60)
+    print("📊 SCRAPING SUMMARY:")
+    print(f"  🏫 Total schools processed: {stats['total_schools']}")
+    print(f"  🤼 Total wrestlers processed: {stats['total_wrestlers']}")
+    print(f"  🥊 Total matches found: {stats['total_matches']}")
+    print(f"  ✅ Successfully stored: {stats['successful_inserts']}")
+    print(f"  ❌ Errors encountered: {stats['errors']}")
+    
+    if stats['start_time'] and stats['end_time']:
+        duration = stats['end_time'] - stats['start_time']
+        print(f"  ⏱️  Total time: {duration}")
+    
+    for label, timing in stats.get('readiness', {}).items():
+        print(f"  ⏳ {label} wait: avg {timing['avg_ms']}ms, max {timing['max_ms']}ms "
+              f"({timing['fallbacks']} fallbacks / {timing['count']})")
+    
+    lean = stats.get('lean_profile')
+    if lean:
+        print(f"  🪶 Lean profile: blocked {lean['requests_blocked']} requests "
+              f"(~{lean['bytes_saved_estimate'] / 1_000_000:.1f} MB saved), "
+              f"loaded {lean['bytes_loaded'] / 1_000_000:.1f} MB")
+    
+    if 'cache_hits' in stats:
+        print(f"  💾 Results cache: {stats['cache_hits']} unchanged, {stats['cache_misses']} changed or new")
+    
+    if 'archived' in stats:
+        print(f"  🗄️  Archived results tables: {stats['archived']}")
+    
+    pipeline = stats.get('pipeline')
+    if pipeline:
+        print(f"  🚰 Results pipeline: {pipeline['items'].get('write', 0)} written, "
+              f"browser waited {pipeline['submit_wait_s']}s on a full queue (depth {pipeline['depth']})")
+    
+    write_behind = stats.get('write_behind')
+    if write_behind:
+        print(f"  📦 Write-behind: {write_behind['matches']} matches in {write_behind['batches']} batches "
+              f"(avg {write_behind['avg_batch']}, {write_behind['failed_batches']} failed), flush latency "
+              f"p50 {write_behind['flush_latency_p50_ms']}ms / p95 {write_behind['flush_latency_p95_ms']}ms, "
+              f"producers waited {write_behind['put_wait_s']}s on a full queue")
+    
+    frontier = stats.get('frontier')
+    if frontier:
+        print(f"  🗂️  Frontier: {frontier['done']} done, {frontier['failed']} failed, {frontier['pending']} pending")
+    
+    success_rate = (stats['successful_inserts'] / max(stats['total_matches'], 1)) * 100
+    print(f"  📈 Success rate: {success_rate:.1f}%")
+
+
 def main():
     """Main function to run the Playwright scraper."""
     
@@ -51,7 +222,7 @@ def main():
     try:
         # Initialize scraper
         print("🔧 Initializing Playwright scraper...")
-        scraper = PlaywrightScraper(headless=True)  # Set to False for debugging
+        scraper = create_scraper()
         
         # Run complete scraping process
         print("🕷️  Starting complete data scraping...")
@@ -61,21 +232,10 @@ def main():
         
         stats = scraper.scrape_all_data()
         
-        # Print summary
-        print("-" * 60)
-        print("📊 SCRAPING SUMMARY:")
-        print(f"  🏫 Total schools processed: {stats['total_schools']}")
-        print(f"  🤼 Total wrestlers processed: {stats['total_wrestlers']}")
-        print(f"  🥊 Total matches found: {stats['total_matches']}")
-        print(f"  ✅ Successfully stored: {stats['successful_inserts']}")
-        print(f"  ❌ Errors encountered: {stats['errors']}")
-        
-        if stats['start_time'] and stats['end_time']:
-            duration = stats['end_time'] - stats['start_time']
-            print(f"  ⏱️  Total time: {duration}")
+        if stats.get('resumed'):
+            print(f"♻️  Resumed an interrupted run ({stats['skipped_done']} wrestlers already done)")
         
-        success_rate = (stats['successful_inserts'] / max(stats['total_matches'], 1)) * 100
-        print(f"  📈 Success rate: {success_rate:.1f}%")
+        print_summary(stats)
         
         if stats['successful_inserts'] > 0:
             print()
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Long-lived scraper service.
+Keeps Chromium running with the DubStat database page loaded, and accepts
+scrape jobs over local HTTP so the dashboard does not pay interpreter start,
+client setup, browser launch and first page load on every run.
+Usage: python scraper_service.py
+
+Endpoints:
+    GET  /health              Service and browser status
+    POST /jobs                Queue a job; body: {"genders": [...], "schools": [...],
+                              "exclude_schools": [...], "school_pattern": "..."}.
+                              Add ?stream=1 to receive its progress as NDJSON
+    GET  /jobs/<id>           Job status and stats
+    GET  /jobs/<id>/events    Job progress as NDJSON, streamed until the job ends
+"""
+import json
+import time
+import queue
+import uuid
+import logging
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from playwright.sync_api import sync_playwright
+
+from run_scraper import (
+    setup_logging, create_results_cache, create_archive, create_copy_loader, settings, SelectionSpec,
+    PlaywrightScraper
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeJob:
+    """One queued scrape and the progress events it has produced so far."""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self, selection: SelectionSpec, request: Dict[str, Any]):
+        self.id = uuid.uuid4().hex[:12]
+        self.selection = selection
+        self.request = request
+        self.status = self.QUEUED
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.stats: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.events: List[Dict[str, Any]] = []
+        self._changed = threading.Condition()
+        self.emit({'event': 'queued'})
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (self.DONE, self.FAILED)
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        """Append a progress event and wake up every streaming reader."""
+        with self._changed:
+            self.events.append({'job_id': self.id, 'time': datetime.now().isoformat(), **event})
+            self._changed.notify_all()
+
+    def start(self) -> None:
+        self.status = self.RUNNING
+        self.started_at = datetime.now()
+        self.emit({'event': 'started'})
+
+    def complete(self, stats: Dict[str, Any]) -> None:
+        self.stats = _jsonable(stats)
+        self.finished_at = datetime.now()
+        self.status = self.DONE
+        self.emit({'event': 'done', 'stats': self.stats})
+
+    def fail(self, error: str) -> None:
+        self.error = error
+        self.finished_at = datetime.now()
+        self.status = self.FAILED
+        self.emit({'event': 'failed', 'error': error})
+
+    def wait_for_events(self, cursor: int, timeout: float) -> List[Dict[str, Any]]:
+        """Events after `cursor`, blocking up to `timeout` seconds for new ones."""
+        with self._changed:
+            if len(self.events) <= cursor and not self.finished:
+                self._changed.wait(timeout)
+            return self.events[cursor:]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'selection': self.selection.describe(),
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'stats': self.stats,
+            'error': self.error,
+        }
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert run stats (datetimes, timedeltas, nested dicts) into JSON-safe values."""
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+class ScraperService:
+    """Job queue plus one worker thread that owns a warm browser and page.
+
+    Sync Playwright objects belong to the thread that created them, so the
+    browser, page and scraper all live on the worker thread and jobs run one
+    at a time on it.
+    """
+
+    MAX_FINISHED_JOBS = 100
+
+    def __init__(self, page_ttl: int = 1800):
+        """
+        Args:
+            page_ttl: Reload the database page before a job if it was loaded
+                more than this many seconds ago
+        """
+        self.page_ttl = page_ttl
+        self.jobs: Dict[str, ScrapeJob] = {}
+        self.current_job: Optional[ScrapeJob] = None
+        self.browser_ready = False
+        self._jobs_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run_worker, name='scraper-service-worker', daemon=True)
+
+    def start(self) -> None:
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Let the current job finish, then close the browser."""
+        self._queue.put(None)
+        self._worker.join()
+
+    def submit(self, request: Dict[str, Any]) -> ScrapeJob:
+        """
+        Queue a scrape job.
+
+        Raises:
+            ValueError: If the request's selection fields are invalid
+        """
+        job = ScrapeJob(self._selection_for(request), request)
+        with self._jobs_lock:
+            self.jobs[job.id] = job
+            self._prune_jobs()
+        self._queue.put(job)
+        logger.info(f"📥 Queued job {job.id}: {job.selection.describe()}")
+        return job
+
+    def get_job(self, job_id: str) -> Optional[ScrapeJob]:
+        with self._jobs_lock:
+            return self.jobs.get(job_id)
+
+    def health(self) -> Dict[str, Any]:
+        current = self.current_job
+        return {
+            'status': 'ok',
+            'browser_ready': self.browser_ready,
+            'queued_jobs': self._queue.qsize(),
+            'current_job': current.id if current else None,
+        }
+
+    def _selection_for(self, request: Dict[str, Any]) -> SelectionSpec:
+        """Selection from settings, overridden by the fields given in the job request."""
+        base = SelectionSpec.from_settings(settings)
+        fields = {
+            'genders': base.genders,
+            'schools': base.schools,
+            'exclude_schools': base.exclude_schools,
+        }
+        for key in fields:
+            if key in request:
+                value = request[key]
+                if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                    raise ValueError(f"'{key}' must be a list of strings")
+                fields[key] = value
+
+        school_pattern = request.get('school_pattern', base.school_pattern)
+        if school_pattern is not None and not isinstance(school_pattern, str):
+            raise ValueError("'school_pattern' must be a string")
+
+        return SelectionSpec(
+            school_pattern=school_pattern or None,
+            schools_file=None if 'schools' in request else base.schools_file,
+            **fields
+        )
+
+    def _prune_jobs(self) -> None:
+        finished = sorted((job for job in self.jobs.values() if job.finished), key=lambda j: j.created_at)
+        excess = len(finished) - self.MAX_FINISHED_JOBS
+        for job in finished[:max(excess, 0)]:
+            del self.jobs[job.id]
+
+    def _run_worker(self) -> None:
+        """Worker thread: keep the browser warm and run queued jobs in order."""
+        scraper = PlaywrightScraper(
+            headless=True,
+            results_source=settings.SCRAPER_RESULTS_SOURCE,
+            lean=settings.SCRAPER_LEAN_PROFILE,
+            results_cache=create_results_cache(),
+            archive=create_archive(),
+            html_parser=settings.SCRAPER_HTML_PARSER,
+            pipeline_depth=settings.SCRAPER_PIPELINE_DEPTH,
+            base_url=settings.DUBSTAT_BASE_URL or None,
+            write_batch_size=settings.SCRAPER_BATCH_SIZE,
+            write_delay=settings.SCRAPER_WRITE_DELAY,
+            copy_loader=create_copy_loader()
+        )
+
+        with sync_playwright() as p:
+            browser = None
+            page = None
+            loaded_at = 0.0
+
+            while True:
+                try:
+                    # Warm up before the first job arrives, and recover after a crash
+                    if browser is None or not browser.is_connected():
+                        self.browser_ready = False
+                        browser = p.chromium.launch(headless=True)
+                        page = None
+                    if page is None or page.is_closed():
+                        page = scraper._new_context(browser).new_page()
+                        loaded_at = 0.0
+                    if time.monotonic() - loaded_at > self.page_ttl:
+                        scraper._load_page(page)
+                        loaded_at = time.monotonic()
+                    self.browser_ready = True
+                except Exception as e:
+                    logger.error(f"Could not prepare browser: {e}")
+                    self.browser_ready = False
+                    browser = page = None
+
+                job = self._queue.get()
+                if job is None:
+                    break
+
+                self.current_job = job
+                job.start()
+                try:
+                    if not self.browser_ready:
+                        raise RuntimeError("Browser is not available")
+                    scraper.selection = job.selection
+                    scraper.progress = job.emit
+                    stats = scraper.scrape_page(page)
+                    job.complete(stats)
+                    logger.info(f"✅ Job {job.id} finished: {stats['total_matches']} matches, "
+                                f"{stats['errors']} errors")
+                except Exception as e:
+                    logger.error(f"❌ Job {job.id} failed: {e}")
+                    job.fail(str(e))
+                    # Start the next job from a freshly loaded page
+                    loaded_at = 0.0
+                finally:
+                    scraper.progress = None
+                    self.current_job = None
+
+            if browser is not None:
+                browser.close()
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for ScraperService (JSON in, JSON or NDJSON out)."""
+
+    service: ScraperService = None
+    STREAM_POLL_SECONDS = 15
+
+    def do_GET(self):
+        path = urlparse(self.path).path.rstrip('/')
+        parts = path.strip('/').split('/')
+
+        if path == '/health':
+            self._send_json(200, self.service.health())
+        elif len(parts) in (2, 3) and parts[0] == 'jobs':
+            job = self.service.get_job(parts[1])
+            if job is None:
+                self._send_json(404, {'error': 'Job not found'})
+            elif len(parts) == 2:
+                self._send_json(200, job.to_dict())
+            elif parts[2] == 'events':
+                self._stream_events(job)
+            else:
+                self._send_json(404, {'error': 'Not found'})
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path.rstrip('/') != '/jobs':
+            self._send_json(404, {'error': 'Not found'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            request = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(request, dict):
+                raise ValueError("Request body must be a JSON object")
+            job = self.service.submit(request)
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        if parse_qs(url.query).get('stream') == ['1']:
+            self._stream_events(job)
+        else:
+            self._send_json(202, job.to_dict())
+
+    def _stream_events(self, job: ScrapeJob) -> None:
+        """Write the job's events as NDJSON until it finishes or the client goes away."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        cursor = 0
+        try:
+            while True:
+                events = job.wait_for_events(cursor, timeout=self.STREAM_POLL_SECONDS)
+                for event in events:
+                    self.wfile.write(json.dumps(event).encode('utf-8') + b'\n')
+                self.wfile.flush()
+                cursor += len(events)
+                if job.finished and cursor >= len(job.events):
+                    break
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug(f"Progress stream for job {job.id} closed by client")
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def main():
+    """Main function to run the scraper service."""
+    host, port = settings.SCRAPER_SERVICE_HOST, settings.SCRAPER_SERVICE_PORT
+
+    print(f"🏆 Wrestling Analytics Scraper Service")
+    print(f"📅 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-" * 60)
+
+    setup_logging(log_prefix='scraper_service')
+
+    service = ScraperService(page_ttl=settings.SCRAPER_SERVICE_PAGE_TTL)
+    service.start()
+
+    ServiceRequestHandler.service = service
+    server = ThreadingHTTPServer((host, port), ServiceRequestHandler)
+    server.daemon_threads = True
+    print(f"🌐 Listening on http://{host}:{port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️  Stopping scraper service...")
+    finally:
+        server.server_close()
+        service.stop()
+
+
+if __name__ == "__main__":
+    main()
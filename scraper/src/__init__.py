@@ -2,6 +2,8 @@
 
 from .models import WrestlerData, MatchData, TournamentData, MatchType
 from .playwright_scraper import PlaywrightScraper
+from .async_playwright_scraper import AsyncPlaywrightScraper
+from .http_scraper import HttpScraper
 from .data_validator import DataValidator, ValidationError
 
 # Optional imports that require external dependencies
@@ -13,6 +15,8 @@ try:
         'TournamentData',
         'MatchType',
         'PlaywrightScraper',
+        'AsyncPlaywrightScraper',
+        'HttpScraper',
         'DataValidator',
         'ValidationError',
         'SupabaseClient',
@@ -26,6 +30,8 @@ except ImportError:
         'TournamentData',
         'MatchType',
         'PlaywrightScraper',
+        'AsyncPlaywrightScraper',
+        'HttpScraper',
         'DataValidator',
         'ValidationError'
     ]
\ No newline at end of file
@@ -0,0 +1,361 @@
+"""
+Asyncio-based DubStat scraper for wrestling analytics.
+Implements the same Gender → School → Wrestler → Results loop as
+PlaywrightScraper, but drives many pages concurrently on one event loop.
+"""
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional
+from playwright.async_api import async_playwright, Page, BrowserContext
+
+from .models import MatchData
+from .playwright_scraper import (
+    PlaywrightScraper, ScraperError, Results, TABLES_OUTER_HTML_JS, RESULTS_ROWS_JS
+)
+from .readiness import AsyncReadinessWaiter
+from .frontier import CrawlFrontier
+from .results_cache import ResultsCache
+from .selection import SelectionSpec
+from .html_archive import HtmlArchive
+from .copy_loader import CopyLoader
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPlaywrightScraper(PlaywrightScraper):
+    """Async Playwright scraper that scrapes wrestlers on a bounded pool of pages.
+
+    Parsing is inherited from PlaywrightScraper; only the browser-facing
+    methods are re-implemented as coroutines.
+    """
+
+    def __init__(self, headless: bool = True, concurrency: int = 4, results_source: str = 'xhr',
+                 lean: bool = False, frontier: Optional[CrawlFrontier] = None,
+                 results_cache: Optional[ResultsCache] = None,
+                 selection: Optional[SelectionSpec] = None, archive: Optional[HtmlArchive] = None,
+                 html_parser: str = 'lxml', base_url: Optional[str] = None,
+                 write_batch_size: int = 0, write_delay: float = 2.0,
+                 copy_loader: Optional[CopyLoader] = None):
+        """
+        Initialize the scraper.
+
+        Args:
+            headless: Run the browser without a window
+            concurrency: Maximum number of pages scraping wrestlers at once
+            results_source: 'xhr' (intercepted fetch_results response), 'dom' or
+                'evaluate' (row text extracted inside the page)
+            lean: Block resources the scraper never reads (see LeanProfile)
+            frontier: Durable task list used to skip completed wrestlers and resume
+            results_cache: Fingerprint cache used to skip unchanged results tables
+            selection: Genders, schools and shard to scrape
+            archive: Compressed store every received results table is appended to
+            html_parser: BeautifulSoup backend for results tables ('lxml' or 'html.parser')
+            base_url: Database page to scrape (defaults to DubStat's)
+            write_batch_size: Batch size for write-behind database writes (0 = one write per wrestler)
+            write_delay: Seconds before a partial write-behind batch is written
+            copy_loader: Write write-behind batches with this COPY loader instead of the REST API
+        """
+        super().__init__(headless=headless, results_source=results_source, lean=lean,
+                         frontier=frontier, results_cache=results_cache, selection=selection,
+                         archive=archive, html_parser=html_parser, base_url=base_url,
+                         write_batch_size=write_batch_size, write_delay=write_delay,
+                         copy_loader=copy_loader)
+        self.concurrency = max(1, concurrency)
+        self.readiness = AsyncReadinessWaiter()
+
+    def scrape_all_data(self) -> Dict[str, Any]:
+        """Run the async scrape to completion and return summary statistics."""
+        return asyncio.run(self.scrape_all_data_async())
+
+    async def scrape_all_data_async(self) -> Dict[str, Any]:
+        """
+        Main scraping coroutine that loops through all data.
+        Returns summary statistics.
+        """
+        logger.info("🏆 Starting complete DubStat scraping (async)...")
+
+        stats = self._new_stats(concurrency=self.concurrency)
+        self._start_writer()
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=self.headless)
+            context = await browser.new_context()
+            if self.lean_profile:
+                await self.lean_profile.attach_async(context)
+            page = await context.new_page()
+
+            # Each slot is a page plus the gender/school currently selected on it.
+            # The semaphore guarantees a free slot whenever a task gets through.
+            semaphore = asyncio.Semaphore(self.concurrency)
+            slots: asyncio.Queue = asyncio.Queue()
+            for _ in range(self.concurrency):
+                slots.put_nowait({'page': None, 'gender': None, 'school': None})
+
+            wrestler_tasks: List[asyncio.Task] = []
+            writes: List[asyncio.Task] = []
+
+            try:
+                # Load the database page
+                await self._load_page(page)
+
+                # Get available genders
+                genders = await self._get_genders(page)
+                logger.info(f"Found {len(genders)} genders: {genders}")
+
+                genders_to_process = self._filter_genders(genders)
+                logger.info(f"Processing only: {genders_to_process}")
+
+                for gender in genders_to_process:
+                    logger.info(f"🚹 Processing gender: {gender}")
+                    await self._select_gender(page, gender)
+
+                    schools = await self._get_schools(page)
+                    logger.info(f"Found {len(schools)} schools for {gender}")
+                    self._record(stats, total_schools=len(schools))
+
+                    for school in schools:
+                        if self._school_done(gender, school):
+                            logger.info(f"⏭️  Skipping completed school: {school}")
+                            continue
+
+                        logger.info(f"🏫 Processing school: {school}")
+
+                        try:
+                            await self._select_school(page, school)
+
+                            wrestlers = await self._get_wrestlers(page)
+                            logger.info(f"Found {len(wrestlers)} wrestlers at {school}")
+                            self._record(stats, total_wrestlers=len(wrestlers))
+
+                            # Wrestler tasks start running as soon as this coroutine
+                            # awaits again, so enumeration overlaps scraping.
+                            for wrestler in self._pending_wrestlers(gender, school, wrestlers, stats):
+                                wrestler_tasks.append(asyncio.create_task(
+                                    self._scrape_wrestler_task(
+                                        context, semaphore, slots, gender, school, wrestler, stats, writes
+                                    )
+                                ))
+
+                        except Exception as e:
+                            logger.error(f"Error processing school {school}: {e}")
+                            self._record(stats, errors=1)
+                            continue
+
+                await asyncio.gather(*wrestler_tasks)
+                await asyncio.gather(*writes)
+
+            except Exception as e:
+                logger.error(f"Critical scraping error: {e}")
+                raise
+            finally:
+                for task in wrestler_tasks + writes:
+                    task.cancel()
+                # Matches already queued are still written (off the event loop) before the
+                # frontier run is closed out
+                await asyncio.to_thread(self._close_writer, stats)
+                self._finish_frontier(stats)
+                await browser.close()
+                self._finish_stats(stats)
+
+        return stats
+
+    async def _scrape_wrestler_task(self, context: BrowserContext, semaphore: asyncio.Semaphore,
+                                    slots: asyncio.Queue, gender: str, school: str, wrestler: str,
+                                    stats: Dict[str, Any], writes: List[asyncio.Task]) -> None:
+        """Scrape one wrestler on a free page and schedule parsing and the database write."""
+        async with semaphore:
+            slot = slots.get_nowait()
+            try:
+                if slot['page'] is None:
+                    slot['page'] = await context.new_page()
+                    await self._load_page(slot['page'])
+
+                if slot['gender'] != gender:
+                    await self._select_gender(slot['page'], gender)
+                    slot['gender'] = gender
+                    slot['school'] = None
+
+                if slot['school'] != school:
+                    await self._select_school(slot['page'], school)
+                    slot['school'] = school
+
+                logger.info(f"🤼 Processing wrestler: {wrestler}")
+                results = await self._load_wrestler_results(slot['page'], wrestler)
+
+            except Exception as e:
+                logger.error(f"Error processing wrestler {wrestler}: {e}")
+                self._record(stats, errors=1)
+                self._mark_task(gender, school, wrestler, error=str(e))
+                # Force a fresh selection the next time this page is used
+                slot['gender'] = slot['school'] = None
+                return
+            finally:
+                slots.put_nowait(slot)
+
+        # Parsing and the write run while this page moves on to the next wrestler
+        writes.append(asyncio.create_task(
+            asyncio.to_thread(self._handle_results, gender, school, wrestler, results, stats)
+        ))
+
+    async def _load_page(self, page: Page) -> None:
+        """Load the DubStat database page."""
+        logger.info(f"Loading page: {self.base_url}")
+        try:
+            await page.goto(self.base_url, timeout=60000)
+            await page.wait_for_load_state('domcontentloaded')
+            await self.readiness.page_ready(page)  # Wait until the dropdown handlers are bound
+            logger.info("Page loaded successfully")
+        except Exception as e:
+            logger.error(f"Failed to load page: {e}")
+            raise
+
+    async def _get_genders(self, page: Page) -> List[str]:
+        """Get available gender options."""
+        try:
+            element = await page.wait_for_selector('#gender', timeout=5000)
+            if element:
+                options = await page.evaluate('''
+                    Array.from(document.querySelector("#gender").options)
+                        .map(option => option.value)
+                        .filter(value => value && value !== "")
+                ''')
+                if options:
+                    return options
+
+            logger.warning("Could not find gender dropdown, using defaults")
+            return ['boys', 'girls']
+
+        except Exception as e:
+            logger.error(f"Error getting genders: {e}")
+            return ['boys', 'girls']  # Default fallback
+
+    async def _select_gender(self, page: Page, gender: str) -> None:
+        """Select a gender option."""
+        try:
+            # The school dropdown gets repopulated via AJAX after gender selection
+            await self.readiness.after(
+                page, '#school',
+                lambda: page.select_option('#gender', gender),
+                'school_options',
+                fallback_condition="document.querySelector('#school').options.length > 1"
+            )
+            logger.debug(f"Selected gender: {gender}")
+
+        except Exception as e:
+            logger.error(f"Error selecting gender {gender}: {e}")
+
+    async def _get_schools(self, page: Page) -> List[str]:
+        """Get available school options for current gender."""
+        try:
+            await page.wait_for_selector('#school', timeout=5000)
+            options = await page.evaluate('''
+                Array.from(document.querySelector("#school").options)
+                    .map(option => option.value)
+                    .filter(value => value && value !== "" && value !== "0")
+            ''')
+            return self._filter_schools(options)
+
+        except Exception as e:
+            logger.error(f"Error getting schools: {e}")
+            return []
+
+    async def _select_school(self, page: Page, school: str) -> None:
+        """Select a school option."""
+        try:
+            # Wait for the wrestler dropdown to be repopulated via AJAX
+            await self.readiness.after(
+                page, '#wrestler',
+                lambda: page.select_option('#school', school),
+                'wrestler_options',
+                fallback_condition="document.querySelector('#wrestler').options.length > 1"
+            )
+            logger.debug(f"Selected school: {school}")
+
+        except Exception as e:
+            logger.error(f"Error selecting school {school}: {e}")
+
+    async def _get_wrestlers(self, page: Page) -> List[str]:
+        """Get available wrestler options for current school."""
+        try:
+            await page.wait_for_selector('#wrestler', timeout=5000)
+            return await page.evaluate('''
+                Array.from(document.querySelector("#wrestler").options)
+                    .map(option => option.value)
+                    .filter(value => value && value !== "" && value !== "0")
+            ''')
+        except Exception as e:
+            logger.error(f"Error getting wrestlers: {e}")
+            return []
+
+    async def _scrape_wrestler_results(self, page: Page, wrestler: str, school: str) -> List[MatchData]:
+        """Scrape results for a specific wrestler."""
+        try:
+            results = await self._load_wrestler_results(page, wrestler)
+            return self._parse_results(results, wrestler, school)
+
+        except Exception as e:
+            logger.error(f"Error scraping results for wrestler {wrestler}: {e}")
+            return []
+
+    async def _load_wrestler_results(self, page: Page, wrestler: str) -> Results:
+        """
+        Select a wrestler, click Get Results and return the results
+        (HTML, or extracted rows for the 'evaluate' source).
+
+        Raises:
+            ScraperError: If results could not be requested, or neither a results
+                response nor a replaced #results-table arrived
+        """
+        # Selecting a wrestler fires no AJAX, so there is nothing to wait for
+        await page.select_option('#wrestler', wrestler)
+
+        button_selector = '#get-results'
+        if not (await page.is_visible(button_selector) and await page.is_enabled(button_selector)):
+            raise ScraperError(f"Get Results button not clickable for {wrestler}")
+
+        # Until the AJAX callback replaces #results-table it still holds the previous wrestler's results
+        if not await self.readiness.arm(page, '#results-table'):
+            raise ScraperError("Could not find results table")
+
+        if self.results_source == 'xhr':
+            # Read the results straight from the fetch_results response
+            response = await self.readiness.response(
+                page,
+                lambda r: self._is_results_response(r, wrestler),
+                lambda: page.click(button_selector),
+                'results_xhr'
+            )
+            payload = await self._read_results_payload_async(response)
+            if payload is not None:
+                return self._results_html_from_payload(payload)
+        else:
+            await page.click(button_selector)
+
+        if not await self.readiness.changed(page, '#results-table', 'results'):
+            raise ScraperError(f"Results table was not updated for {wrestler}")
+
+        if self.results_source == 'evaluate':
+            rows = await page.evaluate(RESULTS_ROWS_JS)
+            if rows is not None:
+                return rows
+            logger.debug(f"No results table to extract for {wrestler}, falling back to HTML")
+
+        # DOM fallback: the (just replaced) results container, or every table on the page if it is gone
+        container = await page.query_selector('#results-table')
+        if container:
+            return await container.inner_html()
+        return await page.evaluate(TABLES_OUTER_HTML_JS)
+
+    async def _read_results_payload_async(self, response) -> Optional[str]:
+        """Return the body of a captured results response, or None to fall back to the DOM."""
+        if response is None:
+            return None
+        try:
+            if not response.ok:
+                logger.warning(f"fetch_results returned HTTP {response.status}, falling back to DOM")
+                return None
+            return await response.text()
+        except Exception as e:
+            logger.warning(f"Could not read fetch_results response ({e}), falling back to DOM")
+            return None
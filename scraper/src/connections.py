@@ -0,0 +1,288 @@
+"""
+Shared database connections for concurrent writers.
+
+Every SupabaseClient and CopyLoader in a process draws from here instead of
+opening its own connections:
+- PostgREST: a bounded pool of Supabase clients per (url, key), each on its
+  own keep-alive httpx session.
+- PostgreSQL: a bounded psycopg2 ThreadedConnectionPool per DATABASE_URL.
+
+In both, a thread checks a connection out for a unit of work, a full pool
+makes callers wait, and connections that sat idle are health-checked before
+they are handed out. Pools live as long as the process, so a new client
+starts warm.
+"""
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import psycopg2
+import psycopg2.pool
+from psycopg2 import extensions
+from supabase import create_client, Client
+from supabase.lib.client_options import SyncClientOptions
+
+
+logger = logging.getLogger(__name__)
+
+# PostgREST sessions per (url, key)
+DEFAULT_HTTP_POOL_SIZE = 10
+# Connections per DATABASE_URL
+DEFAULT_DB_POOL_SIZE = 4
+# Connections idle longer than this (seconds) are checked with SELECT 1 before use
+DEFAULT_HEALTH_CHECK_AFTER = 30.0
+
+
+class PostgresPool:
+    """Bounded, thread-safe psycopg2 connection pool with health checks."""
+
+    def __init__(self, database_url: str, size: int = DEFAULT_DB_POOL_SIZE,
+                 health_check_after: float = DEFAULT_HEALTH_CHECK_AFTER):
+        """
+        Args:
+            database_url: PostgreSQL connection string
+            size: Most connections open at once; further checkouts wait for one
+            health_check_after: Seconds a connection may sit idle before it is
+                tested with SELECT 1 on checkout (0 tests every checkout)
+        """
+        self.size = max(1, size)
+        self.health_check_after = health_check_after
+        # ThreadedConnectionPool raises when exhausted; the semaphore makes callers wait instead
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._pool = psycopg2.pool.ThreadedConnectionPool(0, self.size, database_url)
+        self._last_used: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self.stats = {'checkouts': 0, 'health_checks': 0, 'replaced': 0}
+
+    @contextmanager
+    def connection(self) -> Iterator[extensions.connection]:
+        """
+        Check out a healthy connection for the calling thread.
+
+        The connection goes back to the pool afterwards, with any open
+        transaction rolled back. Connections that broke while in use are
+        closed instead of returned.
+        """
+        self._slots.acquire()
+        try:
+            conn = self._checkout()
+            try:
+                yield conn
+            finally:
+                self._return(conn)
+        finally:
+            self._slots.release()
+
+    def _checkout(self) -> extensions.connection:
+        with self._lock:
+            self.stats['checkouts'] += 1
+
+        for _ in range(self.size + 1):
+            conn = self._pool.getconn()
+            if self._healthy(conn):
+                return conn
+            with self._lock:
+                self.stats['replaced'] += 1
+                self._last_used.pop(id(conn), None)
+            logger.warning("Discarding broken database connection")
+            self._pool.putconn(conn, close=True)
+
+        raise psycopg2.OperationalError("Could not get a working database connection")
+
+    def _healthy(self, conn: extensions.connection) -> bool:
+        if conn.closed:
+            return False
+        with self._lock:
+            last_used = self._last_used.get(id(conn))
+        if last_used is not None and time.monotonic() - last_used < self.health_check_after:
+            return True
+
+        with self._lock:
+            self.stats['health_checks'] += 1
+        try:
+            with conn.cursor() as cur:
+                cur.execute('SELECT 1')
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _return(self, conn: extensions.connection) -> None:
+        broken = bool(conn.closed)
+        if not broken and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                broken = True
+
+        with self._lock:
+            if broken:
+                self._last_used.pop(id(conn), None)
+            else:
+                self._last_used[id(conn)] = time.monotonic()
+        self._pool.putconn(conn, close=broken)
+
+    def close(self) -> None:
+        self._pool.closeall()
+
+
+class RestClientPool:
+    """
+    Bounded pool of Supabase clients, each on its own keep-alive HTTP session.
+
+    A thread checks a client out for a unit of work (re-entrant: nested
+    checkouts in the same thread get the same client), so sessions are never
+    shared by two requests at once and at most `size` are open. Sessions that
+    sat idle are health-checked on checkout and replaced if the connection is
+    gone.
+    """
+
+    def __init__(self, url: str, key: str, size: int = DEFAULT_HTTP_POOL_SIZE,
+                 health_check_after: float = DEFAULT_HEALTH_CHECK_AFTER):
+        """
+        Args:
+            url: Supabase project URL
+            key: Supabase key
+            size: Most sessions open at once; further checkouts wait for one
+            health_check_after: Seconds a session may sit idle before it is
+                tested with a HEAD request on checkout (0 tests every checkout)
+        """
+        self.url = url
+        self.key = key
+        self.size = max(1, size)
+        self.health_check_after = health_check_after
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._idle: List[Tuple[Client, httpx.Client, float]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._default: Optional[Client] = None
+        self.stats = {'checkouts': 0, 'sessions_opened': 0, 'health_checks': 0, 'replaced': 0}
+
+    @contextmanager
+    def checkout(self) -> Iterator[Client]:
+        """Check out a client for the calling thread until the block ends."""
+        current = self.current()
+        if current is not None:
+            yield current
+            return
+
+        self._slots.acquire()
+        try:
+            client, session = self._take()
+            self._local.client = client
+            try:
+                yield client
+            finally:
+                self._local.client = None
+                with self._lock:
+                    self._idle.append((client, session, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def current(self) -> Optional[Client]:
+        """The client the calling thread has checked out, if any."""
+        return getattr(self._local, 'client', None)
+
+    def default(self) -> Client:
+        """
+        Client for use outside a checkout (one-off calls, single-threaded
+        scripts); it has its own session, outside the pool's bound.
+        """
+        if self._default is None:
+            client = self._open()[0]
+            with self._lock:
+                if self._default is None:
+                    self._default = client
+        return self._default
+
+    def _take(self) -> Tuple[Client, httpx.Client]:
+        with self._lock:
+            self.stats['checkouts'] += 1
+            entry = self._idle.pop() if self._idle else None
+
+        if entry is None:
+            return self._open()
+
+        client, session, last_used = entry
+        if time.monotonic() - last_used < self.health_check_after or self._healthy(session):
+            return client, session
+
+        with self._lock:
+            self.stats['replaced'] += 1
+        logger.warning("Replacing broken Supabase HTTP session")
+        session.close()
+        return self._open()
+
+    def _open(self) -> Tuple[Client, httpx.Client]:
+        # One request at a time per session; the spare sockets only matter for default()
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=1, keepalive_expiry=60)
+        session = httpx.Client(transport=httpx.HTTPTransport(limits=limits, retries=1),
+                               timeout=120, follow_redirects=True)
+        client = create_client(self.url, self.key, options=SyncClientOptions(httpx_client=session))
+        with self._lock:
+            self.stats['sessions_opened'] += 1
+        return client, session
+
+    def _healthy(self, session: httpx.Client) -> bool:
+        with self._lock:
+            self.stats['health_checks'] += 1
+        try:
+            # Any HTTP response means the connection works; only transport errors count
+            session.head(f"{self.url.rstrip('/')}/rest/v1/", headers={'apikey': self.key}, timeout=10)
+            return True
+        except httpx.HTTPError:
+            return False
+
+    def close(self) -> None:
+        with self._lock:
+            for _, session, _ in self._idle:
+                session.close()
+            self._idle.clear()
+
+
+_rest_pools: Dict[Tuple[str, str], RestClientPool] = {}
+_pg_pools: Dict[str, PostgresPool] = {}
+_registry_lock = threading.Lock()
+
+
+def get_rest_pool(url: str, key: str) -> RestClientPool:
+    """RestClientPool for (url, key), created on first use and shared by the whole process."""
+    with _registry_lock:
+        pool = _rest_pools.get((url, key))
+        if pool is None:
+            pool = RestClientPool(
+                url, key,
+                size=int(os.getenv('SUPABASE_HTTP_POOL_SIZE', str(DEFAULT_HTTP_POOL_SIZE))),
+                health_check_after=float(os.getenv('DATABASE_POOL_HEALTH_CHECK', str(DEFAULT_HEALTH_CHECK_AFTER))),
+            )
+            _rest_pools[(url, key)] = pool
+        return pool
+
+
+def get_postgres_pool(database_url: str) -> PostgresPool:
+    """PostgresPool for a DATABASE_URL, created on first use and shared by the whole process."""
+    with _registry_lock:
+        pool = _pg_pools.get(database_url)
+        if pool is None:
+            pool = PostgresPool(
+                database_url,
+                size=int(os.getenv('DATABASE_POOL_SIZE', str(DEFAULT_DB_POOL_SIZE))),
+                health_check_after=float(os.getenv('DATABASE_POOL_HEALTH_CHECK', str(DEFAULT_HEALTH_CHECK_AFTER))),
+            )
+            _pg_pools[database_url] = pool
+        return pool
+
+
+def close_all() -> None:
+    """Close every idle pooled connection (for the end of a script; later use reopens them)."""
+    with _registry_lock:
+        for pool in _pg_pools.values():
+            pool.close()
+        for pool in _rest_pools.values():
+            pool.close()
+        _pg_pools.clear()
+        _rest_pools.clear()
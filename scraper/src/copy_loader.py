@@ -0,0 +1,240 @@
+"""
+Direct PostgreSQL loader for large match backfills.
+
+PostgREST writes cost a request per batch (or per row). For state-wide runs
+and archive reparses this loader connects to the database itself
+(DATABASE_URL), COPYs cleaned matches into a temporary staging table, and
+then creates missing wrestlers and tournaments, resolves their ids and merges
+into `matches` with set-based SQL, all in one transaction.
+"""
+import io
+import csv
+import time
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import psycopg2
+
+from .models import MatchData
+from .data_validator import DataValidator
+from .connections import get_postgres_pool
+
+
+logger = logging.getLogger(__name__)
+
+
+class CopyLoaderError(Exception):
+    """Raised when the loader cannot connect or a load fails."""
+    pass
+
+
+STAGING_COLUMNS = [
+    'tournament_name', 'tournament_date', 'wrestler1_name', 'wrestler1_weight',
+    'wrestler2_name', 'wrestler2_weight', 'winner_name', 'wrestler1_score',
+    'wrestler2_score', 'match_type', 'round', 'match_time',
+]
+
+CREATE_STAGING_SQL = '''
+    CREATE TEMP TABLE match_staging (
+        tournament_name TEXT NOT NULL,
+        tournament_date DATE,
+        wrestler1_name TEXT NOT NULL,
+        wrestler1_weight INTEGER,
+        wrestler2_name TEXT NOT NULL,
+        wrestler2_weight INTEGER,
+        winner_name TEXT,
+        wrestler1_score INTEGER,
+        wrestler2_score INTEGER,
+        match_type TEXT,
+        round TEXT,
+        match_time TEXT
+    ) ON COMMIT DROP
+'''
+
+# Written for None, so NULL and '' stay distinct
+COPY_NULL = r'\N'
+COPY_SQL = f"COPY match_staging ({', '.join(STAGING_COLUMNS)}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+
+# Same per-name advisory locks as get_or_create_wrestlers()/get_or_create_tournaments(), taken in
+# sorted order and held until commit, so concurrent loaders and REST writers create each name once
+LOCK_NAMES_SQL = '''
+    SELECT pg_advisory_xact_lock(hashtextextended(lock_key, 0))
+    FROM (
+        SELECT 'wrestlers:' || wrestler1_name AS lock_key FROM match_staging
+        UNION SELECT 'wrestlers:' || wrestler2_name FROM match_staging
+        UNION SELECT 'tournaments:' || tournament_name FROM match_staging
+    ) keys
+    ORDER BY lock_key
+'''
+
+# Names are not unique in wrestlers/tournaments; like SupabaseClient, the oldest row is the one used
+CREATE_WRESTLERS_SQL = '''
+    INSERT INTO wrestlers (name, weight_class)
+    SELECT DISTINCT ON (name) name, weight
+    FROM (
+        SELECT wrestler1_name AS name, wrestler1_weight AS weight FROM match_staging
+        UNION ALL
+        SELECT wrestler2_name, wrestler2_weight FROM match_staging
+    ) staged
+    WHERE NOT EXISTS (SELECT 1 FROM wrestlers w WHERE w.name = staged.name)
+    ORDER BY name, weight NULLS LAST
+'''
+
+CREATE_TOURNAMENTS_SQL = '''
+    INSERT INTO tournaments (name, date)
+    SELECT tournament_name, min(tournament_date)
+    FROM match_staging s
+    WHERE NOT EXISTS (SELECT 1 FROM tournaments t WHERE t.name = s.tournament_name)
+    GROUP BY tournament_name
+'''
+
+RESOLVE_IDS_SQL = '''
+    CREATE TEMP TABLE staged_wrestler_ids ON COMMIT DROP AS
+    SELECT DISTINCT ON (w.name) w.name, w.id
+    FROM wrestlers w
+    WHERE w.name IN (SELECT wrestler1_name FROM match_staging UNION SELECT wrestler2_name FROM match_staging)
+    ORDER BY w.name, w.created_at, w.id;
+
+    CREATE TEMP TABLE staged_tournament_ids ON COMMIT DROP AS
+    SELECT DISTINCT ON (t.name) t.name, t.id
+    FROM tournaments t
+    WHERE t.name IN (SELECT tournament_name FROM match_staging)
+    ORDER BY t.name, t.created_at, t.id;
+'''
+
+# Same rule as upsert_matches(): new matches are inserted, existing 0-0 matches get the
+# new scores, matches that already have scores are left alone
+MERGE_SQL = '''
+    WITH resolved AS (
+        SELECT DISTINCT ON (t.id, COALESCE(s.round, ''), LEAST(w1.id, w2.id), GREATEST(w1.id, w2.id))
+               t.id AS tournament_id, w1.id AS wrestler1_id, w2.id AS wrestler2_id,
+               CASE s.winner_name WHEN s.wrestler1_name THEN w1.id WHEN s.wrestler2_name THEN w2.id END AS winner_id,
+               COALESCE(s.wrestler1_score, 0) AS wrestler1_score, COALESCE(s.wrestler2_score, 0) AS wrestler2_score,
+               COALESCE(s.match_type, 'decision') AS match_type, s.round, s.match_time
+        FROM match_staging s
+        JOIN staged_tournament_ids t ON t.name = s.tournament_name
+        JOIN staged_wrestler_ids w1 ON w1.name = s.wrestler1_name
+        JOIN staged_wrestler_ids w2 ON w2.name = s.wrestler2_name
+        WHERE w1.id <> w2.id
+    ),
+    merged AS (
+        INSERT INTO matches AS m (
+            tournament_id, wrestler1_id, wrestler2_id, winner_id,
+            wrestler1_score, wrestler2_score, match_type, round, match_time
+        )
+        SELECT * FROM resolved
+        ON CONFLICT (tournament_id, (COALESCE(round, '')),
+                     (LEAST(wrestler1_id, wrestler2_id)), (GREATEST(wrestler1_id, wrestler2_id)))
+        DO UPDATE SET
+            wrestler1_score = CASE WHEN m.wrestler1_id = EXCLUDED.wrestler1_id
+                                   THEN EXCLUDED.wrestler1_score ELSE EXCLUDED.wrestler2_score END,
+            wrestler2_score = CASE WHEN m.wrestler1_id = EXCLUDED.wrestler1_id
+                                   THEN EXCLUDED.wrestler2_score ELSE EXCLUDED.wrestler1_score END,
+            match_type = EXCLUDED.match_type,
+            match_time = COALESCE(EXCLUDED.match_time, m.match_time)
+        WHERE m.wrestler1_score = 0 AND m.wrestler2_score = 0
+        RETURNING (m.xmax = 0) AS was_inserted
+    )
+    SELECT count(*) FILTER (WHERE was_inserted), count(*) FILTER (WHERE NOT was_inserted)
+    FROM merged
+'''
+
+
+class CopyLoader:
+    """Bulk-loads matches over a direct PostgreSQL connection with COPY and a set-based merge."""
+
+    def __init__(self, database_url: str, validate: bool = True):
+        """
+        Args:
+            database_url: PostgreSQL connection string (Settings.DATABASE_URL; for
+                Supabase, the connection string from Project Settings → Database).
+                Connections come from the shared pool for this URL, so loaders on
+                several threads can run at once
+            validate: Validate and clean matches before loading (skip for matches
+                already cleaned, e.g. by reparse_archive.py)
+        """
+        if not database_url:
+            raise CopyLoaderError("DATABASE_URL is required for the COPY loader")
+
+        try:
+            self._pool = get_postgres_pool(database_url)
+            # Fail now on a bad DATABASE_URL rather than at the first load
+            with self._pool.connection():
+                pass
+        except psycopg2.Error as e:
+            raise CopyLoaderError(f"Failed to connect to the database: {e}")
+
+        self.validator: Optional[DataValidator] = DataValidator() if validate else None
+
+    def load_matches(self, matches: List[MatchData]) -> Dict[str, int]:
+        """
+        Load matches in one transaction: COPY into staging, create missing
+        wrestlers and tournaments, merge into `matches`.
+
+        Nothing is written if any step fails.
+
+        Returns:
+            Counts: staged, invalid, inserted, updated, skipped (duplicates
+            and matches that already had scores), new_wrestlers, new_tournaments
+        """
+        started = time.perf_counter()
+        rows, invalid = self._staging_csv(matches)
+        stats = {'staged': len(matches) - invalid, 'invalid': invalid, 'inserted': 0, 'updated': 0,
+                 'skipped': 0, 'new_wrestlers': 0, 'new_tournaments': 0}
+        if not stats['staged']:
+            return stats
+
+        try:
+            with self._pool.connection() as conn, conn:
+                with conn.cursor() as cur:
+                    cur.execute(CREATE_STAGING_SQL)
+                    cur.copy_expert(COPY_SQL, rows)
+                    cur.execute(LOCK_NAMES_SQL)
+                    cur.execute(CREATE_WRESTLERS_SQL)
+                    stats['new_wrestlers'] = cur.rowcount
+                    cur.execute(CREATE_TOURNAMENTS_SQL)
+                    stats['new_tournaments'] = cur.rowcount
+                    cur.execute(RESOLVE_IDS_SQL)
+                    cur.execute(MERGE_SQL)
+                    stats['inserted'], stats['updated'] = cur.fetchone()
+        except psycopg2.Error as e:
+            raise CopyLoaderError(f"Failed to load {stats['staged']} matches: {e}")
+
+        stats['skipped'] = stats['staged'] - stats['inserted'] - stats['updated']
+        elapsed = time.perf_counter() - started
+        logger.info(f"Loaded {stats['staged']} matches in {elapsed:.2f}s ({stats['staged'] / max(elapsed, 1e-9):.0f} rows/s): "
+                    f"{stats['inserted']} inserted, {stats['updated']} updated, {stats['skipped']} skipped, "
+                    f"{stats['new_wrestlers']} new wrestlers, {stats['new_tournaments']} new tournaments")
+        return stats
+
+    def _staging_csv(self, matches: List[MatchData]) -> Tuple[io.StringIO, int]:
+        """CSV of the staging rows for COPY, and the number of invalid matches left out."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        invalid = 0
+
+        for match in matches:
+            if self.validator:
+                if not self.validator.validate_match_data(match):
+                    invalid += 1
+                    continue
+                match = self.validator.clean_match_data(match)
+            writer.writerow([COPY_NULL if value is None else value for value in (
+                match.tournament_name,
+                match.date.date().isoformat() if match.date else None,
+                match.wrestler1.name,
+                match.wrestler1.weight_class,
+                match.wrestler2.name,
+                match.wrestler2.weight_class,
+                match.winner.name if match.winner else None,
+                match.wrestler1_score,
+                match.wrestler2_score,
+                match.match_type.value,
+                match.round,
+                match.match_time,
+            )])
+
+        if self.validator:
+            self.validator.clear_validation_errors()
+        buffer.seek(0)
+        return buffer, invalid
@@ -0,0 +1,218 @@
+"""
+Durable crawl frontier for the DubStat scraper.
+
+Keeps every (gender, school, wrestler) task of a crawl in a local SQLite
+file together with its status, so a run that dies halfway can be resumed
+by the next invocation instead of starting over from the first school.
+"""
+import os
+import sqlite3
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlFrontier:
+    """SQLite-backed task list with pending/done/failed status per wrestler.
+
+    A crawl is a "run". Opening the frontier resumes the last run if it never
+    finished and started less than `max_age_hours` ago; otherwise (including
+    once a run is marked finished) the next begin() starts a fresh one, so an
+    old run with a few failed wrestlers does not make every later crawl skip
+    the wrestlers it finished. Safe to share between worker threads.
+    """
+
+    PENDING = 'pending'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TEXT NOT NULL,
+            finished_at TEXT
+        );
+        CREATE TABLE IF NOT EXISTS schools (
+            gender TEXT NOT NULL,
+            school TEXT NOT NULL,
+            PRIMARY KEY (gender, school)
+        );
+        CREATE TABLE IF NOT EXISTS tasks (
+            gender TEXT NOT NULL,
+            school TEXT NOT NULL,
+            wrestler TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            updated_at TEXT,
+            PRIMARY KEY (gender, school, wrestler)
+        );
+    '''
+
+    def __init__(self, path: str, max_attempts: int = 3, max_age_hours: float = 12.0):
+        """
+        Args:
+            path: SQLite file to store the frontier in (created if missing)
+            max_attempts: Failed tasks are retried on resume until they reach this many attempts
+            max_age_hours: Unfinished runs started longer ago than this are not
+                resumed (0 resumes them however old they are)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.max_attempts = max_attempts
+        self.max_age_hours = max_age_hours
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+        self.run_id: Optional[int] = None
+
+    def begin(self) -> bool:
+        """
+        Resume the last unfinished run if it is recent enough, or start a new one.
+
+        Returns:
+            True if an unfinished run was resumed
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT id, started_at, finished_at FROM runs ORDER BY id DESC LIMIT 1'
+            ).fetchone()
+
+            resumable = bool(row) and row[2] is None
+            if resumable and self.max_age_hours and self._age(row[1]) > timedelta(hours=self.max_age_hours):
+                logger.info(f"Not resuming crawl run {row[0]}: started {row[1]}, "
+                            f"more than {self.max_age_hours:g}h ago")
+                resumable = False
+
+            if resumable:
+                self.run_id = row[0]
+                resumed = True
+            else:
+                self._conn.execute('DELETE FROM tasks')
+                self._conn.execute('DELETE FROM schools')
+                cursor = self._conn.execute(
+                    'INSERT INTO runs (started_at) VALUES (?)', (datetime.now().isoformat(),)
+                )
+                self.run_id = cursor.lastrowid
+                resumed = False
+            self._conn.commit()
+
+        if resumed:
+            logger.info(f"♻️  Resuming crawl run {self.run_id}: {self.summary()}")
+        else:
+            logger.info(f"Starting new crawl run {self.run_id}")
+        return resumed
+
+    @staticmethod
+    def _age(started_at: str) -> timedelta:
+        try:
+            return datetime.now() - datetime.fromisoformat(started_at)
+        except ValueError:
+            return timedelta.max
+
+    def finish(self) -> None:
+        """Mark the current run complete so the next begin() starts fresh."""
+        with self._lock:
+            self._conn.execute(
+                'UPDATE runs SET finished_at = ? WHERE id = ?', (datetime.now().isoformat(), self.run_id)
+            )
+            self._conn.commit()
+
+    def add_school(self, gender: str, school: str, wrestlers: List[str]) -> None:
+        """Record a school's full roster; existing task statuses are kept."""
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO tasks (gender, school, wrestler) VALUES (?, ?, ?)',
+                [(gender, school, wrestler) for wrestler in wrestlers]
+            )
+            self._conn.execute(
+                'INSERT OR IGNORE INTO schools (gender, school) VALUES (?, ?)', (gender, school)
+            )
+            self._conn.commit()
+
+    def school_complete(self, gender: str, school: str) -> bool:
+        """True if the school's roster is known and none of its tasks still need work."""
+        with self._lock:
+            enumerated = self._conn.execute(
+                'SELECT 1 FROM schools WHERE gender = ? AND school = ?', (gender, school)
+            ).fetchone()
+            if not enumerated:
+                return False
+
+            remaining = self._conn.execute(
+                '''SELECT COUNT(*) FROM tasks
+                   WHERE gender = ? AND school = ?
+                     AND (status = ? OR (status = ? AND attempts < ?))''',
+                (gender, school, self.PENDING, self.FAILED, self.max_attempts)
+            ).fetchone()[0]
+            return remaining == 0
+
+    def should_process(self, gender: str, school: str, wrestler: str) -> bool:
+        """False for tasks already done, or failed too many times."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT status, attempts FROM tasks WHERE gender = ? AND school = ? AND wrestler = ?',
+                (gender, school, wrestler)
+            ).fetchone()
+
+        if row is None:
+            return True
+        status, attempts = row
+        if status == self.DONE:
+            return False
+        if status == self.FAILED and attempts >= self.max_attempts:
+            return False
+        return True
+
+    def mark_done(self, gender: str, school: str, wrestler: str) -> None:
+        """Record a successfully scraped wrestler."""
+        self._update(gender, school, wrestler, self.DONE, None)
+
+    def mark_failed(self, gender: str, school: str, wrestler: str, error: str) -> None:
+        """Record a failed attempt for a wrestler."""
+        self._update(gender, school, wrestler, self.FAILED, error)
+
+    def has_remaining_work(self) -> bool:
+        """True while any task is pending or failed with attempts left."""
+        with self._lock:
+            remaining = self._conn.execute(
+                'SELECT COUNT(*) FROM tasks WHERE status = ? OR (status = ? AND attempts < ?)',
+                (self.PENDING, self.FAILED, self.max_attempts)
+            ).fetchone()[0]
+        return remaining > 0
+
+    def summary(self) -> Dict[str, int]:
+        """Task counts by status for the current run."""
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) FROM tasks GROUP BY status').fetchall()
+        counts = {self.PENDING: 0, self.DONE: 0, self.FAILED: 0}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _update(self, gender: str, school: str, wrestler: str, status: str, error: Optional[str]) -> None:
+        with self._lock:
+            self._conn.execute(
+                '''INSERT INTO tasks (gender, school, wrestler, status, attempts, last_error, updated_at)
+                   VALUES (?, ?, ?, ?, 1, ?, ?)
+                   ON CONFLICT (gender, school, wrestler) DO UPDATE SET
+                       status = excluded.status,
+                       attempts = tasks.attempts + 1,
+                       last_error = excluded.last_error,
+                       updated_at = excluded.updated_at''',
+                (gender, school, wrestler, status, error, datetime.now().isoformat())
+            )
+            self._conn.commit()
@@ -0,0 +1,207 @@
+"""
+Compressed raw-HTML archive for the DubStat scraper.
+
+Every results table the scraper receives is appended, compressed, to
+numbered segment files. A SQLite index records where each one lives
+(segment, byte offset, length), so the archive can be re-parsed or audited
+from local disk instead of re-crawling the site.
+
+Each record is its own gzip member (or zstd frame), so a record can be read
+on its own by seeking to its offset. Segment files are only ever appended to,
+and every archive instance writes its own segments, so several scraper
+processes can share one archive directory.
+"""
+import os
+import gzip
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Optional
+
+from .results_cache import ResultsCache
+
+try:
+    import zstandard
+except ImportError:
+    # zstd is optional; gzip is always available
+    zstandard = None
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ArchiveRecord:
+    """Where one archived results table lives, and whose it is."""
+    id: int
+    gender: str
+    school: str
+    wrestler: str
+    fingerprint: str
+    segment: str
+    offset: int
+    length: int
+    compression: str
+    archived_at: str
+
+
+class HtmlArchive:
+    """Append-only, compressed store of results-table HTML with an offset index.
+
+    Safe to share between worker threads.
+    """
+
+    COLUMNS = 'id, gender, school, wrestler, fingerprint, segment, offset, length, compression, archived_at'
+    COMPRESSIONS = ('gzip', 'zstd')
+    EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            gender TEXT NOT NULL,
+            school TEXT NOT NULL,
+            wrestler TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            segment TEXT NOT NULL,
+            offset INTEGER NOT NULL,
+            length INTEGER NOT NULL,
+            compression TEXT NOT NULL,
+            archived_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_records_wrestler ON records (school, wrestler, id);
+    '''
+
+    def __init__(self, directory: str, compression: str = 'gzip', segment_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            directory: Folder holding the segment files and index.sqlite (created if missing)
+            compression: 'gzip' or 'zstd' (zstd needs the zstandard package)
+            segment_bytes: Start a new segment file once the current one reaches this size
+
+        Raises:
+            ValueError: If the compression is unknown or unavailable
+        """
+        if compression not in self.COMPRESSIONS:
+            raise ValueError(f"Unknown archive compression '{compression}', expected one of {self.COMPRESSIONS}")
+        if compression == 'zstd' and zstandard is None:
+            raise ValueError("zstd archive compression requires the zstandard package (pip install zstandard)")
+
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.compression = compression
+        self.segment_bytes = segment_bytes
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, 'index.sqlite'), timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+
+        # Segments are named after this writer, so no two writers share a file
+        self._writer = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{os.getpid()}-{id(self) % 10000:04d}"
+        self._segment_number = 0
+        self._segment: Optional[str] = None
+        self._file = None
+
+    def append(self, gender: str, school: str, wrestler: str, html: str) -> int:
+        """
+        Archive a wrestler's results table.
+
+        If the HTML is identical to the wrestler's most recent archived table,
+        nothing is written and that record's id is returned.
+
+        Returns:
+            Id of the record holding this HTML
+        """
+        fingerprint = ResultsCache.fingerprint(html)
+        with self._lock:
+            latest = self._conn.execute(
+                'SELECT id, fingerprint FROM records WHERE school = ? AND wrestler = ? ORDER BY id DESC LIMIT 1',
+                (school, wrestler)
+            ).fetchone()
+            if latest and latest[1] == fingerprint:
+                return latest[0]
+
+            if self._file is None or self._file.tell() >= self.segment_bytes:
+                self._rotate()
+
+            data = self._compress(html.encode('utf-8'))
+            offset = self._file.tell()
+            self._file.write(data)
+            self._file.flush()
+
+            cursor = self._conn.execute(
+                '''INSERT INTO records
+                   (gender, school, wrestler, fingerprint, segment, offset, length, compression, archived_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                (gender, school, wrestler, fingerprint, self._segment, offset, len(data),
+                 self.compression, datetime.now().isoformat())
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def read(self, record: ArchiveRecord) -> str:
+        """Return the HTML stored in a record."""
+        with open(os.path.join(self.directory, record.segment), 'rb') as f:
+            f.seek(record.offset)
+            data = f.read(record.length)
+        return self._decompress(data, record.compression).decode('utf-8')
+
+    def get(self, record_id: int) -> Optional[ArchiveRecord]:
+        """Look up a record by id."""
+        with self._lock:
+            row = self._conn.execute(f'SELECT {self.COLUMNS} FROM records WHERE id = ?', (record_id,)).fetchone()
+        return ArchiveRecord(*row) if row else None
+
+    def records(self, latest_only: bool = True) -> Iterator[ArchiveRecord]:
+        """
+        Iterate archived records in id order.
+
+        Args:
+            latest_only: Only the newest record per (school, wrestler)
+        """
+        query = f'SELECT {self.COLUMNS} FROM records'
+        if latest_only:
+            query += ' WHERE id IN (SELECT MAX(id) FROM records GROUP BY school, wrestler)'
+        query += ' ORDER BY id'
+
+        with self._lock:
+            rows = self._conn.execute(query).fetchall()
+        for row in rows:
+            yield ArchiveRecord(*row)
+
+    def count(self) -> int:
+        """Number of archived records."""
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM records').fetchone()[0]
+
+    def close(self) -> None:
+        """Close the open segment and the index."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+            self._conn.close()
+
+    def _rotate(self) -> None:
+        """Close the current segment (if any) and start this writer's next one."""
+        if self._file:
+            self._file.close()
+        self._segment_number += 1
+        self._segment = f"segment-{self._writer}-{self._segment_number:05d}{self.EXTENSIONS[self.compression]}"
+        self._file = open(os.path.join(self.directory, self._segment), 'ab')
+        logger.info(f"🗄️  Started archive segment {self._segment}")
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == 'zstd':
+            return zstandard.ZstdCompressor(level=10).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    @staticmethod
+    def _decompress(data: bytes, compression: str) -> bytes:
+        if compression == 'zstd':
+            if zstandard is None:
+                raise ValueError("Reading zstd archive records requires the zstandard package")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
@@ -0,0 +1,262 @@
+"""
+Browserless DubStat scraper for wrestling analytics.
+
+The DubStat database page fills its #school, #wrestler and #results-table
+widgets with jQuery POSTs to WordPress' admin-ajax.php. This scraper finds
+that endpoint once (or takes it from config) and replays the same requests
+over a pooled keep-alive HTTP client, so no browser process is needed.
+"""
+import re
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
+from datetime import datetime
+
+import httpx
+from bs4 import BeautifulSoup
+
+from .models import MatchData
+from .playwright_scraper import PlaywrightScraper
+from .frontier import CrawlFrontier
+from .results_cache import ResultsCache
+from .selection import SelectionSpec
+from .html_archive import HtmlArchive
+from .copy_loader import CopyLoader
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DubStatEndpoints:
+    """The AJAX endpoint and actions behind the DubStat search form."""
+    ajax_url: str
+    schools_action: str = 'fetch_schools'
+    wrestlers_action: str = 'fetch_wrestlers'
+    results_action: str = 'fetch_results'
+
+    # e.g. var ajax_object = { ajaxurl: "https://dubstat.com/wp-admin/admin-ajax.php" };
+    AJAX_URL_PATTERN = re.compile(r'ajax_object\s*=\s*\{\s*ajaxurl\s*:\s*["\']([^"\']+)["\']')
+    ACTION_PATTERN = re.compile(r'action\s*:\s*["\'](fetch_\w+)["\']')
+
+    @classmethod
+    def discover(cls, page_html: str) -> 'DubStatEndpoints':
+        """
+        Read the endpoint and action names from the database page's inline script.
+
+        Raises:
+            ValueError: If the page does not contain the AJAX configuration
+        """
+        url_match = cls.AJAX_URL_PATTERN.search(page_html)
+        if not url_match:
+            raise ValueError("Could not find ajax_object.ajaxurl on the DubStat page")
+
+        endpoints = cls(ajax_url=url_match.group(1))
+        for action in cls.ACTION_PATTERN.findall(page_html):
+            if 'school' in action:
+                endpoints.schools_action = action
+            elif 'wrestler' in action:
+                endpoints.wrestlers_action = action
+            elif 'result' in action:
+                endpoints.results_action = action
+        return endpoints
+
+
+class HttpScraper(PlaywrightScraper):
+    """Scraper that replays DubStat's AJAX requests without a browser.
+
+    Produces the same MatchData lists as PlaywrightScraper by feeding the
+    returned results table through the inherited parser.
+    """
+
+    def __init__(self, concurrency: int = 4, ajax_url: Optional[str] = None,
+                 user_agent: str = "Mozilla/5.0 (compatible; WrestlingAnalytics/1.0)",
+                 timeout: int = 30, max_retries: int = 3, retry_delay: int = 1,
+                 frontier: Optional[CrawlFrontier] = None,
+                 results_cache: Optional[ResultsCache] = None,
+                 selection: Optional[SelectionSpec] = None, archive: Optional[HtmlArchive] = None,
+                 html_parser: str = 'lxml', base_url: Optional[str] = None,
+                 write_batch_size: int = 0, write_delay: float = 2.0,
+                 copy_loader: Optional[CopyLoader] = None):
+        """
+        Initialize the scraper.
+
+        Args:
+            concurrency: Number of wrestlers fetched at once over the shared client
+            ajax_url: admin-ajax.php URL; discovered from the page when omitted
+            user_agent: User-Agent header sent with every request
+            timeout: Per-request timeout in seconds
+            max_retries: Attempts per request before giving up
+            retry_delay: Base delay in seconds between attempts (doubles each retry)
+            frontier: Durable task list used to skip completed wrestlers and resume
+            results_cache: Fingerprint cache used to skip unchanged results tables
+            selection: Genders, schools and shard to scrape
+            archive: Compressed store every received results table is appended to
+            html_parser: BeautifulSoup backend for results tables ('lxml' or 'html.parser')
+            base_url: Database page to scrape (defaults to DubStat's)
+            write_batch_size: Batch size for write-behind database writes (0 = one write per wrestler)
+            write_delay: Seconds before a partial write-behind batch is written
+            copy_loader: Write write-behind batches with this COPY loader instead of the REST API
+        """
+        super().__init__(headless=True, frontier=frontier, results_cache=results_cache,
+                         selection=selection, archive=archive, html_parser=html_parser,
+                         base_url=base_url, write_batch_size=write_batch_size,
+                         write_delay=write_delay, copy_loader=copy_loader)
+        self.concurrency = max(1, concurrency)
+        self.endpoints = DubStatEndpoints(ajax_url=ajax_url) if ajax_url else None
+        self.max_retries = max(1, max_retries)
+        self.retry_delay = retry_delay
+        # One pooled client: connections stay open across every request of the run
+        self.http = httpx.Client(
+            headers={'User-Agent': user_agent, 'Referer': self.base_url},
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=self.concurrency + 1,
+                max_keepalive_connections=self.concurrency + 1
+            ),
+            follow_redirects=True
+        )
+
+    def scrape_all_data(self) -> Dict[str, Any]:
+        """
+        Main scraping function that loops through all data.
+        Returns summary statistics.
+        """
+        logger.info("🏆 Starting complete DubStat scraping (HTTP)...")
+
+        stats = self._new_stats(concurrency=self.concurrency)
+        self._start_writer()
+
+        try:
+            genders = self._load_form()
+            genders_to_process = self._filter_genders(genders)
+            logger.info(f"Processing only: {genders_to_process}")
+
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='http-scraper') as pool:
+                futures = []
+                for gender in genders_to_process:
+                    logger.info(f"🚹 Processing gender: {gender}")
+
+                    schools = self._filter_schools(self._fetch_schools(gender))
+                    logger.info(f"Found {len(schools)} schools for {gender}")
+                    stats['total_schools'] += len(schools)
+
+                    for school in schools:
+                        if self._school_done(gender, school):
+                            logger.info(f"⏭️  Skipping completed school: {school}")
+                            continue
+
+                        try:
+                            wrestlers = self._fetch_wrestlers(gender, school)
+                            logger.info(f"Found {len(wrestlers)} wrestlers at {school}")
+                            self._record(stats, total_wrestlers=len(wrestlers))
+
+                            for wrestler in self._pending_wrestlers(gender, school, wrestlers, stats):
+                                futures.append(pool.submit(self._process_task, gender, school, wrestler, stats))
+                        except Exception as e:
+                            logger.error(f"Error processing school {school}: {e}")
+                            self._record(stats, errors=1)
+                            continue
+
+                for future in futures:
+                    future.result()
+
+        except Exception as e:
+            logger.error(f"Critical scraping error: {e}")
+            raise
+        finally:
+            # Matches already queued are still written before the frontier run is closed out
+            self._close_writer(stats)
+            self._finish_frontier(stats)
+            self.http.close()
+            stats['end_time'] = datetime.now()
+
+        return stats
+
+    def _process_task(self, gender: str, school: str, wrestler: str, stats: Dict[str, Any]) -> None:
+        """Fetch, parse and store one wrestler's results, updating stats."""
+        logger.info(f"🤼 Processing wrestler: {wrestler}")
+
+        try:
+            html = self._fetch_results_html(gender, school, wrestler)
+        except Exception as e:
+            logger.error(f"Error processing wrestler {wrestler}: {e}")
+            self._record(stats, errors=1)
+            self._mark_task(gender, school, wrestler, error=str(e))
+            return
+
+        self._handle_results(gender, school, wrestler, html, stats)
+
+    def _load_form(self) -> List[str]:
+        """Fetch the database page once: discover endpoints and read the gender options."""
+        logger.info(f"Loading page: {self.base_url}")
+        response = self._request('GET', self.base_url)
+
+        if self.endpoints is None:
+            self.endpoints = DubStatEndpoints.discover(response.text)
+            logger.info(f"Discovered AJAX endpoint: {self.endpoints.ajax_url}")
+
+        soup = BeautifulSoup(response.text, 'html.parser')
+        select = soup.select_one('#gender')
+        genders = self._option_values(select) if select else []
+        if not genders:
+            logger.warning("Could not find gender dropdown, using defaults")
+            return ['boys', 'girls']
+        return genders
+
+    def _fetch_schools(self, gender: str) -> List[str]:
+        """Get school options for a gender (same request as selecting #gender)."""
+        html = self._post({'action': self.endpoints.schools_action, 'gender': gender})
+        return self._option_values(BeautifulSoup(html, 'html.parser'))
+
+    def _fetch_wrestlers(self, gender: str, school: str) -> List[str]:
+        """Get wrestler options for a school (same request as selecting #school)."""
+        html = self._post({'action': self.endpoints.wrestlers_action, 'school': school, 'gender': gender})
+        return self._option_values(BeautifulSoup(html, 'html.parser'))
+
+    def fetch_wrestler_results(self, gender: str, school: str, wrestler: str) -> List[MatchData]:
+        """Fetch and parse a wrestler's results table (same request as #get-results)."""
+        html = self._fetch_results_html(gender, school, wrestler)
+        return self._parse_results_html(html, wrestler, school)
+
+    def _fetch_results_html(self, gender: str, school: str, wrestler: str) -> str:
+        """Fetch a wrestler's results table HTML without parsing it."""
+        payload = self._post({
+            'action': self.endpoints.results_action,
+            'gender': gender,
+            'school': school,
+            'wrestler': wrestler
+        })
+        return self._results_html_from_payload(payload)
+
+    def _option_values(self, root) -> List[str]:
+        """Extract non-placeholder <option> values, matching the browser scraper's filter."""
+        values = []
+        for option in root.find_all('option'):
+            value = option.get('value', '')
+            if value and value != "0":
+                values.append(value)
+        return values
+
+    def _post(self, data: Dict[str, str]) -> str:
+        """POST form data to the AJAX endpoint and return the response body."""
+        return self._request('POST', self.endpoints.ajax_url, data=data).text
+
+    def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, retrying transport errors and 5xx responses with backoff."""
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = self.http.request(method, url, **kwargs)
+                if response.status_code < 500:
+                    response.raise_for_status()
+                    return response
+                logger.warning(f"{method} {url} returned {response.status_code} (attempt {attempt})")
+            except httpx.TransportError as e:
+                logger.warning(f"{method} {url} failed: {e} (attempt {attempt})")
+
+            if attempt < self.max_retries:
+                time.sleep(self.retry_delay * (2 ** (attempt - 1)))
+
+        raise httpx.HTTPError(f"{method} {url} failed after {self.max_retries} attempts")
@@ -0,0 +1,140 @@
+"""
+Lean browser profile for the DubStat scraper.
+
+The DubStat database page is a WordPress page with images, web fonts,
+stylesheets, analytics and social embeds. None of that is needed to drive
+the search form, so the lean profile aborts those requests at the browser
+context and keeps per-run counts of what was blocked.
+"""
+import logging
+import threading
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+
+logger = logging.getLogger(__name__)
+
+
+class LeanProfile:
+    """Route filter that blocks resources the scraper never reads."""
+
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'stylesheet', 'media'})
+
+    # Blocked requests never download, so their size is unknown. These are
+    # typical sizes per resource type, used only for the bytes-saved estimate.
+    ESTIMATED_BYTES = {
+        'image': 50_000,
+        'font': 40_000,
+        'stylesheet': 20_000,
+        'media': 250_000,
+        'script': 30_000,
+    }
+    DEFAULT_ESTIMATED_BYTES = 5_000
+
+    def __init__(self, first_party_domains: Iterable[str],
+                 blocked_resource_types: Optional[Iterable[str]] = None,
+                 block_third_party: bool = True):
+        """
+        Args:
+            first_party_domains: Domains the page needs (subdomains included),
+                e.g. ['dubstat.com']
+            blocked_resource_types: Playwright resource types to abort
+            block_third_party: Abort every request to a non first-party host
+                (analytics, tag managers, social widgets, ...)
+        """
+        self.first_party_domains = [d.lower().lstrip('.') for d in first_party_domains]
+        self.blocked_resource_types = frozenset(blocked_resource_types or self.BLOCKED_RESOURCE_TYPES)
+        self.block_third_party = block_third_party
+
+        self._lock = threading.Lock()
+        self.requests_allowed = 0
+        self.requests_blocked = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.blocked_by_reason: Dict[str, int] = {}
+        self.bytes_loaded = 0
+        self.bytes_saved_estimate = 0
+
+    def block_reason(self, url: str, resource_type: str) -> Optional[str]:
+        """Return why a request should be aborted, or None to let it through."""
+        if resource_type in self.blocked_resource_types:
+            return 'resource_type'
+        if self.block_third_party and resource_type != 'document' and not self._is_first_party(url):
+            return 'third_party'
+        return None
+
+    def attach(self, context) -> None:
+        """Install the filter on a sync Playwright BrowserContext."""
+        def handle(route):
+            request = route.request
+            if self._should_abort(request.url, request.resource_type):
+                route.abort()
+            else:
+                route.continue_()
+
+        context.route('**/*', handle)
+        context.on('response', self._count_response)
+
+    async def attach_async(self, context) -> None:
+        """Install the filter on an async Playwright BrowserContext."""
+        async def handle(route):
+            request = route.request
+            if self._should_abort(request.url, request.resource_type):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route('**/*', handle)
+        context.on('response', self._count_response)
+
+    def reset(self) -> None:
+        """Zero the counters, so the next summary() covers only what follows."""
+        with self._lock:
+            self.requests_allowed = 0
+            self.requests_blocked = 0
+            self.blocked_by_type = {}
+            self.blocked_by_reason = {}
+            self.bytes_loaded = 0
+            self.bytes_saved_estimate = 0
+
+    def summary(self) -> Dict[str, Any]:
+        """Blocked/allowed counts for the run stats."""
+        with self._lock:
+            return {
+                'requests_allowed': self.requests_allowed,
+                'requests_blocked': self.requests_blocked,
+                'blocked_by_type': dict(self.blocked_by_type),
+                'blocked_by_reason': dict(self.blocked_by_reason),
+                'bytes_loaded': self.bytes_loaded,
+                'bytes_saved_estimate': self.bytes_saved_estimate,
+            }
+
+    def _should_abort(self, url: str, resource_type: str) -> bool:
+        reason = self.block_reason(url, resource_type)
+        with self._lock:
+            if reason is None:
+                self.requests_allowed += 1
+                return False
+
+            self.requests_blocked += 1
+            self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+            self.blocked_by_reason[reason] = self.blocked_by_reason.get(reason, 0) + 1
+            self.bytes_saved_estimate += self.ESTIMATED_BYTES.get(resource_type, self.DEFAULT_ESTIMATED_BYTES)
+
+        logger.debug(f"Blocked {resource_type} ({reason}): {url}")
+        return True
+
+    def _count_response(self, response) -> None:
+        """Add the Content-Length of every response that was let through."""
+        try:
+            length = int(response.headers.get('content-length', 0))
+        except (TypeError, ValueError):
+            length = 0
+        with self._lock:
+            self.bytes_loaded += length
+
+    def _is_first_party(self, url: str) -> bool:
+        host = (urlparse(url).hostname or '').lower()
+        if not host:
+            # data:, blob: and similar carry no network cost
+            return True
+        return any(host == domain or host.endswith('.' + domain) for domain in self.first_party_domains)
@@ -0,0 +1,133 @@
+"""
+Streaming results pipeline for the DubStat scraper.
+
+Runs the work that follows a wrestler's scrape (parse, validate/clean,
+database write) as stages on their own threads, joined by bounded queues.
+The browser hands results to the first stage and moves on to the next
+wrestler while earlier wrestlers are still being parsed and written, so
+page waits and database round trips overlap instead of alternating. A full
+queue blocks the stage feeding it, which keeps memory bounded when the
+database falls behind.
+"""
+import time
+import queue
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .models import MatchData
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WrestlerResults:
+    """One wrestler's results as they move through the pipeline stages."""
+    gender: str
+    school: str
+    wrestler: str
+    results: Any
+    fingerprint: Optional[str] = None
+    matches: List[MatchData] = field(default_factory=list)
+    cleaned: Optional[List[MatchData]] = None
+
+
+# A stage takes an item and returns it for the next stage, or None once it is fully handled
+Stage = Tuple[str, Callable[[WrestlerResults], Optional[WrestlerResults]]]
+
+# Marks the end of the stream; each stage passes it on after its last item
+_DONE = object()
+
+
+class ResultsPipeline:
+    """Bounded-queue stages, each on its own thread.
+
+    Safe to submit to from several threads. submit() blocks while the first
+    stage's queue is full; close() waits for every submitted item to pass
+    through every stage.
+    """
+
+    def __init__(self, stages: List[Stage], depth: int = 16,
+                 on_error: Optional[Callable[[WrestlerResults, Exception], None]] = None):
+        """
+        Args:
+            stages: (name, function) pairs, run in order
+            depth: Items each stage may have waiting before the stage feeding it blocks
+            on_error: Called with the item and exception when a stage raises;
+                the item is dropped and the stage carries on
+        """
+        self.depth = max(1, depth)
+        self.on_error = on_error
+        self._queues = [queue.Queue(maxsize=self.depth) for _ in stages]
+        self._counts = {name: 0 for name, _ in stages}
+        self._max_backlog = {name: 0 for name, _ in stages}
+        self._submit_wait = 0.0
+        self._wait_lock = threading.Lock()
+        self._closed = False
+        self._threads = []
+
+        for index, (name, function) in enumerate(stages):
+            inbox = self._queues[index]
+            outbox = self._queues[index + 1] if index + 1 < len(stages) else None
+            thread = threading.Thread(
+                target=self._run_stage,
+                args=(name, function, inbox, outbox),
+                name=f"pipeline-{name}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, item: WrestlerResults) -> None:
+        """Hand an item to the first stage, waiting while that stage is backed up."""
+        if self._closed:
+            raise RuntimeError("Results pipeline is closed")
+        started = time.perf_counter()
+        self._queues[0].put(item)
+        with self._wait_lock:
+            self._submit_wait += time.perf_counter() - started
+
+    def close(self) -> None:
+        """Flush every submitted item through all stages and stop the stage threads."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queues[0].put(_DONE)
+        for thread in self._threads:
+            thread.join()
+
+    def summary(self) -> Dict[str, Any]:
+        """Items handled per stage, deepest backlog seen per stage, and time spent blocked on submit."""
+        return {
+            'depth': self.depth,
+            'items': dict(self._counts),
+            'max_backlog': dict(self._max_backlog),
+            'submit_wait_s': round(self._submit_wait, 2),
+        }
+
+    def _run_stage(self, name: str, function: Callable, inbox: queue.Queue,
+                   outbox: Optional[queue.Queue]) -> None:
+        while True:
+            self._max_backlog[name] = max(self._max_backlog[name], inbox.qsize())
+            item = inbox.get()
+            if item is _DONE:
+                if outbox is not None:
+                    outbox.put(_DONE)
+                return
+
+            try:
+                result = function(item)
+            except Exception as e:
+                logger.error(f"Pipeline stage '{name}' failed for {item.wrestler}: {e}")
+                if self.on_error:
+                    try:
+                        self.on_error(item, e)
+                    except Exception as callback_error:
+                        logger.debug(f"Pipeline error callback failed: {callback_error}")
+                continue
+
+            self._counts[name] += 1
+            if result is not None and outbox is not None:
+                outbox.put(result)
@@ -2,30 +2,204 @@
 Playwright-based DubStat scraper for wrestling analytics.
 Implements Gender → School → Wrestler → Results loop.
 """
-import time
+import re
+import html as html_lib
+import json
+import queue
 import logging
-from typing import List, Dict, Any, Optional
-from playwright.sync_api import sync_playwright, Page, Browser
+import threading
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable, Union, Tuple
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 from bs4 import BeautifulSoup
 from datetime import datetime
+from urllib.parse import parse_qs, urlparse
 
 from .models import WrestlerData, MatchData, TournamentData, MatchType
 from .supabase_client import SupabaseClient
 from .data_validator import DataValidator
+from .readiness import ReadinessWaiter
+from .lean_profile import LeanProfile
+from .frontier import CrawlFrontier
+from .results_cache import ResultsCache
+from .selection import SelectionSpec
+from .html_archive import HtmlArchive
+from .pipeline import ResultsPipeline, WrestlerResults
+from .copy_loader import CopyLoader
 
 
 logger = logging.getLogger(__name__)
 
 
+# The DubStat database page the search form lives on
+DEFAULT_BASE_URL = "https://dubstat.com/dubstat-home/ohio-high-school-wrestling/dubstat-database/"
+
+# Top-level <table> elements; used to cut a page down to its tables before parsing
+TABLE_PATTERN = re.compile(r'<table\b.*?</table\s*>', re.IGNORECASE | re.DOTALL)
+RESULTS_TABLE_CLASS_PATTERN = re.compile(r'class\s*=\s*["\'][^"\']*\bresults-table\b', re.IGNORECASE)
+
+# Outer HTML of the page's top-level tables (nested tables come along inside their parent)
+TABLES_OUTER_HTML_JS = '''
+() => Array.from(document.querySelectorAll('table'))
+    .filter(table => !table.parentElement || !table.parentElement.closest('table'))
+    .map(table => table.outerHTML)
+    .join('\\n')
+'''
+
+# Results table columns, in DubStat's order (see _parse_match_row)
+RESULT_COLUMNS = ['Event Date', 'Event', 'Round', 'Weight', 'W/L', 'Result', 'Opponent', 'Opponent School']
+
+# Text of every results-table row below the header, as arrays of cell strings.
+# Picks the table the way _parse_results_table does for DubStat's markup;
+# returns null when there is no table, so the caller can fall back to HTML.
+RESULTS_ROWS_JS = '''
+() => {
+    const scope = document.querySelector('#results-table') || document;
+    const tables = Array.from(scope.querySelectorAll('table'));
+    const hasHeader = (table, text) =>
+        Array.from(table.querySelectorAll('th')).some(th => th.textContent.includes(text));
+    const table = scope.querySelector('table.results, table#results')
+        || tables.find(t => hasHeader(t, 'Tournament'))
+        || tables.find(t => hasHeader(t, 'Opponent'));
+    if (!table) return null;
+    return Array.from(table.querySelectorAll('tr')).slice(1)
+        .map(row => Array.from(row.querySelectorAll('td, th'), cell => cell.textContent.trim()));
+}
+'''
+
+# A wrestler's results: table HTML, or rows of cell text extracted in the browser
+Results = Union[str, List[List[str]]]
+
+# Result column grammar: "(W-L)" scores and "(M:SS)" pin times
+SCORE_PATTERN = re.compile(r'\((\d+)-(\d+)\)')
+PIN_TIME_PATTERN = re.compile(r'\((\d+:\d+(?:\.\d+)?)\)')
+
+# Result prefixes whose parentheses hold a score, checked in this order
+SCORED_RESULT_PREFIXES = (
+    ('TF ', MatchType.TECH_FALL),
+    ('MD ', MatchType.MAJOR_DECISION),
+    ('D ', MatchType.DECISION),
+)
+
+
+@lru_cache(maxsize=4096)
+def decode_result(result_str: str) -> Tuple[MatchType, int, int, Optional[str]]:
+    """
+    Decode a Result column string into (MatchType, winner score, loser score, pin time).
+    
+    Results come from a small set of strings ("D (3-0)", "F (5:32)", ...), so
+    decoded values are memoized. See PlaywrightScraper._parse_result_column.
+    """
+    result_upper = result_str.upper().strip()
+    
+    if 'FF' in result_upper or 'FORFEIT' in result_upper:
+        return MatchType.FORFEIT, 0, 0, None
+    
+    if 'DQ' in result_upper or 'DISQUAL' in result_upper:
+        return MatchType.DISQUALIFICATION, 0, 0, None
+    
+    # Fall/pin: the parentheses hold the time, not a score
+    if result_upper.startswith('F ') or result_upper.startswith('FALL'):
+        time_match = PIN_TIME_PATTERN.search(result_str)
+        return MatchType.PIN, 0, 0, time_match.group(1) if time_match else None
+    
+    # Default to decision for anything unrecognized, keeping any score found
+    match_type = MatchType.DECISION
+    for prefix, prefix_type in SCORED_RESULT_PREFIXES:
+        if result_upper.startswith(prefix):
+            match_type = prefix_type
+            break
+    
+    score_match = SCORE_PATTERN.search(result_str)
+    if score_match:
+        return match_type, int(score_match.group(1)), int(score_match.group(2)), None
+    return match_type, 0, 0, None
+
+
+class ScraperError(Exception):
+    """Custom exception for scraping errors."""
+    pass
+
+
 class PlaywrightScraper:
     """Playwright-based scraper for DubStat wrestling database."""
     
-    def __init__(self, headless: bool = True):
-        """Initialize the scraper."""
+    def __init__(self, headless: bool = True, workers: int = 1, results_source: str = 'xhr',
+                 lean: bool = False, frontier: Optional[CrawlFrontier] = None,
+                 results_cache: Optional[ResultsCache] = None,
+                 selection: Optional[SelectionSpec] = None, archive: Optional[HtmlArchive] = None,
+                 html_parser: str = 'lxml', pipeline_depth: int = 16,
+                 base_url: Optional[str] = None, write_batch_size: int = 0,
+                 write_delay: float = 2.0, copy_loader: Optional[CopyLoader] = None):
+        """
+        Initialize the scraper.
+        
+        Args:
+            headless: Run the browser without a window
+            workers: Number of parallel browser contexts used to scrape wrestlers
+                (1 keeps the original single-page loop)
+            results_source: 'xhr' reads results from the intercepted fetch_results
+                response (falling back to the DOM if it is missed); 'dom' always
+                parses the rendered page; 'evaluate' extracts the rows' cell text
+                inside the page, so no HTML is transferred or parsed
+            lean: Block images, fonts, stylesheets, media and third-party
+                requests in the browser context (see LeanProfile)
+            frontier: Durable task list; completed wrestlers are skipped and an
+                interrupted run resumes where it stopped
+            results_cache: Fingerprints of each wrestler's stored results table;
+                unchanged tables skip parsing, validation and the database
+            selection: Genders, schools and shard to scrape (defaults to
+                Olentangy Liberty boys)
+            archive: Compressed store every received results table is appended to
+            html_parser: BeautifulSoup backend for results tables: 'lxml' (C-backed)
+                or 'html.parser' (pure Python)
+            pipeline_depth: Parse, validate and database-write stages run on their
+                own threads behind queues of this size, overlapping with the
+                browser (0 handles each wrestler inline)
+            base_url: Database page to scrape (defaults to DubStat's; e.g. a
+                local fixture site for benchmarks)
+            write_batch_size: Queue matches for SupabaseClient's write-behind
+                buffer, written in batches of this size (0 writes each
+                wrestler's matches as its own batch)
+            write_delay: Seconds a queued match may wait before a partial
+                write-behind batch is written
+            copy_loader: Write the write-behind batches with this COPY loader
+                instead of through Supabase's REST API (needs write_batch_size)
+        """
         self.headless = headless
-        self.base_url = "https://dubstat.com/dubstat-home/ohio-high-school-wrestling/dubstat-database/"
-        self.db_client = SupabaseClient()
+        self.workers = max(1, workers)
+        self.results_source = results_source
+        self._stats_lock = threading.Lock()
+        self.readiness = ReadinessWaiter()
+        self.base_url = base_url or DEFAULT_BASE_URL
+        self.lean_profile = LeanProfile([self._site_domain()]) if lean else None
+        self.frontier = frontier
+        self.results_cache = results_cache
+        self.selection = selection or SelectionSpec()
+        self.archive = archive
+        self.html_parser = html_parser
+        self.pipeline_depth = pipeline_depth
+        self._pipeline: Optional[ResultsPipeline] = None
+        self.write_batch_size = max(0, write_batch_size)
+        self.write_delay = write_delay
+        self.copy_loader = copy_loader
+        # Optional callback receiving progress events ({'event': 'school'|'wrestler', ...})
+        self.progress: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._db_client: Optional[SupabaseClient] = None
+        self._db_lock = threading.Lock()
         self.validator = DataValidator()
+    
+    @property
+    def db_client(self) -> SupabaseClient:
+        """Supabase client, created on first use so parsing alone needs no database."""
+        with self._db_lock:
+            if self._db_client is None:
+                self._db_client = SupabaseClient()
+            return self._db_client
+    
+    @db_client.setter
+    def db_client(self, client: SupabaseClient) -> None:
+        self._db_client = client
         
     def scrape_all_data(self) -> Dict[str, Any]:
         """
@@ -34,97 +208,513 @@ class PlaywrightScraper:
         """
         logger.info("🏆 Starting complete DubStat scraping...")
         
-        stats = {
-            'total_matches': 0,
-            'total_wrestlers': 0,
-            'total_schools': 0,
-            'successful_inserts': 0,
-            'errors': 0,
-            'start_time': datetime.now(),
-            'end_time': None
-        }
+        stats = self._new_stats(workers=self.workers)
         
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=self.headless)
-            page = browser.new_page()
+            page = self._new_context(browser).new_page()
             
             try:
                 # Load the database page
                 self._load_page(page)
                 
-                # Get available genders - but only process Boys
-                genders = self._get_genders(page)
-                logger.info(f"Found {len(genders)} genders: {genders}")
+                self._crawl_page(page, stats)
+                            
+            except Exception as e:
+                logger.error(f"Critical scraping error: {e}")
+                raise
+            finally:
+                browser.close()
+                self._finish_stats(stats)
                 
-                # Filter to only Boys (not Girls)
-                genders_to_process = [g for g in genders if g.lower() == 'boys']
-                logger.info(f"Processing only: {genders_to_process}")
+        return stats
+    
+    def scrape_page(self, page: Page) -> Dict[str, Any]:
+        """
+        Run the scraping loop on a page that already has the database loaded.
+        
+        Lets a long-lived caller keep one browser and page warm across runs.
+        Returns summary statistics; wait timings and lean-profile counters
+        cover this run only.
+        """
+        logger.info("🏆 Starting DubStat scraping on a loaded page...")
+        
+        stats = self._new_stats(workers=self.workers)
+        self.readiness.reset()
+        if self.lean_profile:
+            self.lean_profile.reset()
+        
+        try:
+            self._crawl_page(page, stats)
+        except Exception as e:
+            logger.error(f"Critical scraping error: {e}")
+            raise
+        finally:
+            self._finish_stats(stats)
+        
+        return stats
+    
+    def _crawl_page(self, page: Page, stats: Dict[str, Any]) -> None:
+        """Gender → School → Wrestler loop over a loaded database page."""
+        # Get available genders
+        genders = self._get_genders(page)
+        logger.info(f"Found {len(genders)} genders: {genders}")
+        
+        # Keep the genders selected for this run
+        genders_to_process = self._filter_genders(genders)
+        logger.info(f"Processing only: {genders_to_process}")
+        
+        self._start_writer()
+        self._pipeline = self._start_pipeline(stats)
+        try:
+            if self.workers > 1:
+                self._scrape_with_worker_pool(page, genders_to_process, stats)
+            else:
+                self._scrape_sequential(page, genders_to_process, stats)
+        finally:
+            # Results already scraped still get parsed and written before the frontier run is closed out
+            self._close_pipeline(stats)
+            self._close_writer(stats)
+            self._finish_frontier(stats)
+    
+    def _start_pipeline(self, stats: Dict[str, Any]) -> Optional[ResultsPipeline]:
+        """Start the parse → validate → write stages, unless results are handled inline."""
+        if self.pipeline_depth <= 0:
+            return None
+        
+        def on_error(item: WrestlerResults, error: Exception) -> None:
+            self._record(stats, errors=1)
+            self._mark_task(item.gender, item.school, item.wrestler, error=str(error))
+        
+        return ResultsPipeline(
+            [
+                ('parse', lambda item: self._parse_stage(item, stats)),
+                ('validate', self._validate_stage),
+                ('write', lambda item: self._write_stage(item, stats)),
+            ],
+            depth=self.pipeline_depth,
+            on_error=on_error
+        )
+    
+    def _close_pipeline(self, stats: Dict[str, Any]) -> None:
+        """Flush the results pipeline and record its summary."""
+        if not self._pipeline:
+            return
+        logger.info("⏳ Flushing results pipeline...")
+        self._pipeline.close()
+        stats['pipeline'] = self._pipeline.summary()
+        self._pipeline = None
+    
+    def _start_writer(self) -> None:
+        """Start the database client's write-behind buffer if batched writes are enabled."""
+        if self.write_batch_size:
+            write = self._copy_batch if self.copy_loader else None
+            self.db_client.start_write_behind(self.write_batch_size, self.write_delay, write=write)
+    
+    def _copy_batch(self, matches: List[MatchData]) -> bool:
+        """Write one write-behind batch with the COPY loader (CopyLoaderError fails the batch)."""
+        self.copy_loader.load_matches(matches)
+        return True
+    
+    def _close_writer(self, stats: Dict[str, Any]) -> None:
+        """Drain the write-behind buffer (finishing its wrestlers) and record its summary."""
+        if not self.write_batch_size:
+            return
+        summary = self.db_client.close_write_behind()
+        if summary:
+            stats['write_behind'] = summary
+    
+    def _finish_stats(self, stats: Dict[str, Any]) -> None:
+        """Attach wait/lean-profile summaries and the end time to the run stats."""
+        stats['readiness'] = self.readiness.summary()
+        if self.lean_profile:
+            stats['lean_profile'] = self.lean_profile.summary()
+        stats['end_time'] = datetime.now()
+    
+    def _scrape_sequential(self, page: Page, genders: List[str], stats: Dict[str, Any]) -> None:
+        """Walk Gender → School → Wrestler on a single page."""
+        for gender in genders:
+            logger.info(f"🚹 Processing gender: {gender}")
+            
+            # Select gender
+            self._select_gender(page, gender)
+            
+            # Get schools for this gender
+            schools = self._get_schools(page)
+            logger.info(f"Found {len(schools)} schools for {gender}")
+            stats['total_schools'] += len(schools)
+            
+            for school in schools:
+                if self._school_done(gender, school):
+                    logger.info(f"⏭️  Skipping completed school: {school}")
+                    continue
+                
+                logger.info(f"🏫 Processing school: {school}")
                 
-                for gender in genders_to_process:
-                    logger.info(f"🚹 Processing gender: {gender}")
+                try:
+                    # Select school
+                    self._select_school(page, school)
                     
-                    # Select gender
-                    self._select_gender(page, gender)
+                    # Get wrestlers for this school
+                    wrestlers = self._get_wrestlers(page)
+                    logger.info(f"Found {len(wrestlers)} wrestlers at {school}")
+                    stats['total_wrestlers'] += len(wrestlers)
                     
-                    # Get schools for this gender
-                    schools = self._get_schools(page)
-                    logger.info(f"Found {len(schools)} schools for {gender}")
-                    stats['total_schools'] += len(schools)
+                    for wrestler in self._pending_wrestlers(gender, school, wrestlers, stats):
+                        self._process_wrestler(page, gender, school, wrestler, stats)
+                            
+                except Exception as e:
+                    logger.error(f"Error processing school {school}: {e}")
+                    self._record(stats, errors=1)
+                    continue
+    
+    def _scrape_with_worker_pool(self, page: Page, genders: List[str], stats: Dict[str, Any]) -> None:
+        """
+        Fan wrestlers out to a pool of worker threads.
+        
+        The main page enumerates (gender, school, wrestler) tasks onto a shared
+        queue while each worker drives its own browser context, so workers start
+        scraping as soon as the first school's roster is known.
+        """
+        tasks: queue.Queue = queue.Queue()
+        threads = []
+        
+        for worker_id in range(self.workers):
+            thread = threading.Thread(
+                target=self._pool_worker,
+                args=(worker_id, tasks, stats),
+                name=f"scraper-worker-{worker_id}",
+                daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+        
+        try:
+            for gender in genders:
+                logger.info(f"🚹 Enumerating gender: {gender}")
+                self._select_gender(page, gender)
+                
+                schools = self._get_schools(page)
+                logger.info(f"Found {len(schools)} schools for {gender}")
+                self._record(stats, total_schools=len(schools))
+                
+                for school in schools:
+                    if self._school_done(gender, school):
+                        logger.info(f"⏭️  Skipping completed school: {school}")
+                        continue
                     
-                    for school in schools:
-                        logger.info(f"🏫 Processing school: {school}")
+                    try:
+                        self._select_school(page, school)
+                        wrestlers = self._get_wrestlers(page)
+                        logger.info(f"Queued {len(wrestlers)} wrestlers at {school}")
+                        self._record(stats, total_wrestlers=len(wrestlers))
+                        
+                        for wrestler in self._pending_wrestlers(gender, school, wrestlers, stats):
+                            tasks.put((gender, school, wrestler))
+                    except Exception as e:
+                        logger.error(f"Error enumerating school {school}: {e}")
+                        self._record(stats, errors=1)
+                        continue
+        finally:
+            # One sentinel per worker so every thread exits once the queue drains
+            for _ in threads:
+                tasks.put(None)
+            for thread in threads:
+                thread.join()
+        
+        # Anything left over means every worker died before finishing
+        leftover = 0
+        while not tasks.empty():
+            if tasks.get_nowait() is not None:
+                leftover += 1
+        if leftover:
+            logger.error(f"{leftover} wrestlers were never processed (all workers stopped)")
+            self._record(stats, errors=leftover)
+    
+    def _pool_worker(self, worker_id: int, tasks: queue.Queue, stats: Dict[str, Any]) -> None:
+        """Run one worker: an isolated browser context pulling tasks until a sentinel arrives."""
+        # Sync Playwright objects are bound to the thread that created them,
+        # so every worker starts its own driver and browser.
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=self.headless)
+            try:
+                page = self._new_context(browser).new_page()
+                self._load_page(page)
+                logger.info(f"👷 Worker {worker_id} ready")
+                
+                selection = {'gender': None, 'school': None}
+                while True:
+                    task = tasks.get()
+                    if task is None:
+                        break
+                    
+                    gender, school, wrestler = task
+                    try:
+                        self._ensure_selection(page, selection, gender, school)
+                        self._process_wrestler(page, gender, school, wrestler, stats)
+                    except Exception as e:
+                        logger.error(f"Worker {worker_id} failed on {wrestler} ({school}): {e}")
+                        self._record(stats, errors=1)
+                        self._mark_task(gender, school, wrestler, error=str(e))
+                        # Force a fresh selection on the next task
+                        selection['gender'] = selection['school'] = None
                         
-                        try:
-                            # Select school
-                            self._select_school(page, school)
-                            
-                            # Get wrestlers for this school
-                            wrestlers = self._get_wrestlers(page)
-                            logger.info(f"Found {len(wrestlers)} wrestlers at {school}")
-                            stats['total_wrestlers'] += len(wrestlers)
-                            
-                            for wrestler in wrestlers:
-                                logger.info(f"🤼 Processing wrestler: {wrestler}")
-                                
-                                try:
-                                    # Scrape this wrestler's results
-                                    matches = self._scrape_wrestler_results(page, wrestler, school)
-                                    stats['total_matches'] += len(matches)
-                                    
-                                    # Insert matches into database
-                                    if matches:
-                                        success = self.db_client.batch_insert_matches(matches)
-                                        if success:
-                                            stats['successful_inserts'] += len(matches)
-                                        else:
-                                            stats['errors'] += len(matches)
-                                    
-                                except Exception as e:
-                                    logger.error(f"Error processing wrestler {wrestler}: {e}")
-                                    stats['errors'] += 1
-                                    continue
-                                    
-                        except Exception as e:
-                            logger.error(f"Error processing school {school}: {e}")
-                            stats['errors'] += 1
-                            continue
-                            
             except Exception as e:
-                logger.error(f"Critical scraping error: {e}")
-                raise
+                logger.error(f"Worker {worker_id} stopped: {e}")
             finally:
                 browser.close()
-                stats['end_time'] = datetime.now()
+    
+    def _new_context(self, browser: Browser) -> BrowserContext:
+        """Create a browser context, applying the lean profile when enabled."""
+        context = browser.new_context()
+        if self.lean_profile:
+            self.lean_profile.attach(context)
+        return context
+    
+    def _site_domain(self) -> str:
+        """Registrable host of base_url (e.g. 'dubstat.com'), used as the first party."""
+        host = urlparse(self.base_url).hostname or ''
+        return host[4:] if host.startswith('www.') else host
+    
+    def _ensure_selection(self, page: Page, selection: Dict[str, Optional[str]], gender: str, school: str) -> None:
+        """Re-select gender/school on a worker page only when the task needs a different one."""
+        if selection['gender'] != gender:
+            self._select_gender(page, gender)
+            selection['gender'] = gender
+            selection['school'] = None
+        
+        if selection['school'] != school:
+            self._select_school(page, school)
+            selection['school'] = school
+    
+    def _process_wrestler(self, page: Page, gender: str, school: str, wrestler: str, stats: Dict[str, Any]) -> None:
+        """Scrape one wrestler's results and store them, updating stats."""
+        logger.info(f"🤼 Processing wrestler: {wrestler}")
+        
+        try:
+            # Scrape this wrestler's results
+            results = self._load_wrestler_results(page, wrestler)
+        except Exception as e:
+            logger.error(f"Error scraping results for wrestler {wrestler}: {e}")
+            self._record(stats, errors=1)
+            self._mark_task(gender, school, wrestler, error=str(e))
+            return
+        
+        self._handle_results(gender, school, wrestler, results, stats)
+    
+    def _handle_results(self, gender: str, school: str, wrestler: str,
+                        results: Results, stats: Dict[str, Any]) -> None:
+        """
+        Archive the raw results, then skip them if unchanged or parse and store them.
+        
+        While a results pipeline is running this only queues the results
+        (blocking if the pipeline is backed up); otherwise it runs inline.
+        """
+        item = WrestlerResults(gender, school, wrestler, results)
+        if self._pipeline:
+            self._pipeline.submit(item)
+            return
+        
+        if self._parse_stage(item, stats):
+            self._store_results(gender, school, wrestler, item.matches, stats, item.fingerprint)
+    
+    def _parse_stage(self, item: WrestlerResults, stats: Dict[str, Any]) -> Optional[WrestlerResults]:
+        """Archive and fingerprint the results, then parse them unless they are unchanged."""
+        gender, school, wrestler = item.gender, item.school, item.wrestler
+        
+        # Extracted rows are archived and fingerprinted as the table they came from
+        html = item.results if isinstance(item.results, str) else self._rows_to_html(item.results)
+        
+        if self.archive:
+            try:
+                self.archive.append(gender, school, wrestler, html)
+                self._record(stats, archived=1)
+            except Exception as e:
+                logger.warning(f"Could not archive results for {wrestler}: {e}")
+        
+        if self.results_cache:
+            item.fingerprint = self.results_cache.fingerprint(html)
+            if self.results_cache.is_unchanged(school, wrestler, item.fingerprint):
+                logger.info(f"💾 Results unchanged for {wrestler}, skipping")
+                self._record(stats, cache_hits=1)
+                self._mark_task(gender, school, wrestler, unchanged=True)
+                return None
+            self._record(stats, cache_misses=1)
+        
+        try:
+            item.matches = self._parse_results(item.results, wrestler, school)
+        except Exception as e:
+            logger.error(f"Error parsing results for wrestler {wrestler}: {e}")
+            self._record(stats, errors=1)
+            self._mark_task(gender, school, wrestler, error=str(e))
+            return None
+        
+        return item
+    
+    def _validate_stage(self, item: WrestlerResults) -> WrestlerResults:
+        """Validate and clean parsed matches, dropping invalid ones."""
+        item.cleaned = self._clean_matches(item.matches)
+        return item
+    
+    def _clean_matches(self, matches: List[MatchData]) -> List[MatchData]:
+        """Validated and cleaned copies of the valid matches."""
+        cleaned = []
+        for match in matches:
+            if self.validator.validate_match_data(match):
+                cleaned.append(self.validator.clean_match_data(match))
+            else:
+                logger.warning(f"Skipping invalid match: {match}")
+        self.validator.clear_validation_errors()
+        return cleaned
+    
+    def _write_stage(self, item: WrestlerResults, stats: Dict[str, Any]) -> None:
+        """Write validated matches, then record the wrestler in the cache and frontier."""
+        self._store_results(item.gender, item.school, item.wrestler, item.matches, stats,
+                            item.fingerprint, cleaned=item.cleaned)
+    
+    def _store_results(self, gender: str, school: str, wrestler: str,
+                       matches: List[MatchData], stats: Dict[str, Any],
+                       fingerprint: Optional[str] = None,
+                       cleaned: Optional[List[MatchData]] = None) -> None:
+        """
+        Insert a wrestler's matches into the database and mark the task done.
+        
+        If `cleaned` is given, those already validated and cleaned matches
+        are written instead of validating `matches` again. With write-behind
+        enabled the matches are queued, and the wrestler is finished once
+        the batch holding its last match has been written.
+        """
+        self._record(stats, total_matches=len(matches))
+        
+        try:
+            # Insert matches into database
+            success = True
+            if matches:
+                if cleaned is None and self.write_batch_size:
+                    cleaned = self._clean_matches(matches)
                 
+                if cleaned is None:
+                    success = self.db_client.batch_insert_matches(matches)
+                elif cleaned and self.write_batch_size:
+                    self.db_client.enqueue_matches(
+                        cleaned, prevalidated=True,
+                        on_written=lambda ok: self._finish_wrestler(gender, school, wrestler, len(matches),
+                                                                    ok, stats, fingerprint)
+                    )
+                    return
+                elif cleaned:
+                    success = self.db_client.batch_insert_matches(cleaned, prevalidated=True)
+                else:
+                    logger.warning(f"No valid matches to insert for {wrestler}")
+                    success = False
+            
+            self._finish_wrestler(gender, school, wrestler, len(matches), success, stats, fingerprint)
+            
+        except Exception as e:
+            logger.error(f"Error processing wrestler {wrestler}: {e}")
+            self._record(stats, errors=1)
+            self._mark_task(gender, school, wrestler, error=str(e))
+    
+    def _finish_wrestler(self, gender: str, school: str, wrestler: str, match_count: int,
+                         success: bool, stats: Dict[str, Any], fingerprint: Optional[str] = None) -> None:
+        """Record a wrestler's write outcome, then update the results cache and the frontier."""
+        if match_count:
+            if success:
+                self._record(stats, successful_inserts=match_count)
+            else:
+                self._record(stats, errors=match_count)
+        
+        # Only cache results that are known to be in the database
+        if success and fingerprint and self.results_cache:
+            self.results_cache.store(school, wrestler, fingerprint)
+        
+        self._mark_task(gender, school, wrestler, matches=match_count)
+    
+    def _new_stats(self, **extra: Any) -> Dict[str, Any]:
+        """Fresh run statistics; resumes the frontier if one is configured."""
+        stats = {
+            'total_matches': 0,
+            'total_wrestlers': 0,
+            'total_schools': 0,
+            'successful_inserts': 0,
+            'errors': 0,
+            'skipped_done': 0,
+            **extra,
+            'start_time': datetime.now(),
+            'end_time': None
+        }
+        if self.frontier:
+            stats['resumed'] = self.frontier.begin()
+        if self.results_cache:
+            stats['cache_hits'] = 0
+            stats['cache_misses'] = 0
+        if self.archive:
+            stats['archived'] = 0
         return stats
     
+    def _school_done(self, gender: str, school: str) -> bool:
+        """True if the frontier says every wrestler at this school is already handled."""
+        return bool(self.frontier and self.frontier.school_complete(gender, school))
+    
+    def _pending_wrestlers(self, gender: str, school: str, wrestlers: List[str],
+                           stats: Dict[str, Any]) -> List[str]:
+        """Register a school's roster with the frontier and drop wrestlers already done."""
+        pending = wrestlers
+        if self.frontier:
+            self.frontier.add_school(gender, school, wrestlers)
+            pending = [w for w in wrestlers if self.frontier.should_process(gender, school, w)]
+            skipped = len(wrestlers) - len(pending)
+            if skipped:
+                logger.info(f"⏭️  Skipping {skipped} already-scraped wrestlers at {school}")
+                self._record(stats, skipped_done=skipped)
+        
+        self._emit('school', gender=gender, school=school, wrestlers=len(wrestlers), pending=len(pending))
+        return pending
+    
+    def _mark_task(self, gender: str, school: str, wrestler: str, error: Optional[str] = None,
+                   **details: Any) -> None:
+        """Record a wrestler's outcome in the frontier (if any) and report progress."""
+        if self.frontier:
+            if error is None:
+                self.frontier.mark_done(gender, school, wrestler)
+            else:
+                self.frontier.mark_failed(gender, school, wrestler, error)
+        
+        self._emit('wrestler', gender=gender, school=school, wrestler=wrestler,
+                   status='failed' if error else 'done', error=error, **details)
+    
+    def _emit(self, event: str, **fields: Any) -> None:
+        """Send a progress event to the progress callback, if one is set."""
+        if not self.progress:
+            return
+        try:
+            self.progress({'event': event, **fields})
+        except Exception as e:
+            logger.debug(f"Progress callback failed: {e}")
+    
+    def _finish_frontier(self, stats: Dict[str, Any]) -> None:
+        """Close out the frontier run when nothing is left to retry."""
+        if not self.frontier:
+            return
+        stats['frontier'] = self.frontier.summary()
+        if self.frontier.has_remaining_work():
+            logger.info(f"Crawl run left unfinished for resume: {stats['frontier']}")
+        else:
+            self.frontier.finish()
+    
+    def _record(self, stats: Dict[str, Any], **increments: int) -> None:
+        """Add counters to the shared stats dict (safe across worker threads)."""
+        with self._stats_lock:
+            for key, value in increments.items():
+                stats[key] += value
+    
     def _load_page(self, page: Page) -> None:
         """Load the DubStat database page."""
         logger.info(f"Loading page: {self.base_url}")
         try:
             page.goto(self.base_url, timeout=60000)  # Increase timeout to 60 seconds
             page.wait_for_load_state('domcontentloaded')  # Wait for DOM instead of networkidle
-            time.sleep(3)  # Additional wait for dynamic content
+            self.readiness.page_ready(page)  # Wait until the dropdown handlers are bound
             logger.info("Page loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load page: {e}")
@@ -183,18 +773,16 @@ class PlaywrightScraper:
             try:
                 element = page.query_selector(selector)
                 if element:
-                    page.select_option(selector, gender)
+                    # The school dropdown gets repopulated via AJAX after gender selection,
+                    # so wait for #school to actually be replaced
+                    self.readiness.after(
+                        page, '#school',
+                        lambda: page.select_option(selector, gender),
+                        'school_options',
+                        fallback_condition="document.querySelector('#school').options.length > 1"
+                    )
                     logger.debug(f"Selected gender: {gender}")
                     
-                    # Wait for school dropdown to populate (important!)
-                    # The school dropdown gets populated via JavaScript after gender selection
-                    page.wait_for_timeout(3000)  # Wait 3 seconds for AJAX to complete
-                    
-                    # Wait for school dropdown to have options
-                    page.wait_for_function('''
-                        document.querySelector('#school').options.length > 1
-                    ''', timeout=10000)
-                    
                     logger.debug(f"School dropdown populated after selecting {gender}")
                     return
             except Exception as e:
@@ -222,15 +810,7 @@ class PlaywrightScraper:
                     ''')
                     if options:
                         logger.debug(f"Found {len(options)} schools")
-                        # Filter to only include Olentangy Liberty
-                        liberty_schools = [school for school in options if 'olentangy liberty' in school.lower()]
-                        if liberty_schools:
-                            logger.info(f"Found Olentangy Liberty school(s): {liberty_schools}")
-                            return liberty_schools
-                        else:
-                            logger.warning("Olentangy Liberty not found in school list")
-                            logger.debug(f"Available schools: {options[:10]}...")  # Show first 10 for debugging
-                            return []
+                        return self._filter_schools(options)
             except Exception as e:
                 logger.error(f"Error getting schools with selector {selector}: {e}")
             
@@ -241,6 +821,21 @@ class PlaywrightScraper:
             logger.error(f"Error getting schools: {e}")
             return []
     
+    def _filter_genders(self, genders: List[str]) -> List[str]:
+        """Reduce the gender dropdown options to the genders this run should scrape."""
+        return self.selection.select_genders(genders)
+    
+    def _filter_schools(self, options: List[str]) -> List[str]:
+        """Reduce the school dropdown options to the schools this run should scrape."""
+        schools = self.selection.select_schools(options)
+        if schools:
+            logger.info(f"Selected {len(schools)} of {len(options)} schools ({self.selection.describe()})")
+            return schools
+        
+        logger.warning(f"No schools in the list match the selection ({self.selection.describe()})")
+        logger.debug(f"Available schools: {options[:10]}...")  # Show first 10 for debugging
+        return []
+    
     def _select_school(self, page: Page, school: str) -> None:
         """Select a school option."""
         try:
@@ -250,17 +845,15 @@ class PlaywrightScraper:
             try:
                 element = page.query_selector(selector)
                 if element:
-                    page.select_option(selector, school)
+                    # Wait for the wrestler dropdown to be repopulated via AJAX
+                    self.readiness.after(
+                        page, '#wrestler',
+                        lambda: page.select_option(selector, school),
+                        'wrestler_options',
+                        fallback_condition="document.querySelector('#wrestler').options.length > 1"
+                    )
                     logger.debug(f"Selected school: {school}")
                     
-                    # Wait for wrestler dropdown to populate (important!)
-                    page.wait_for_timeout(3000)  # Wait 3 seconds for AJAX
-                    
-                    # Wait for wrestler dropdown to have options
-                    page.wait_for_function('''
-                        document.querySelector('#wrestler').options.length > 1
-                    ''', timeout=10000)
-                    
                     logger.debug(f"Wrestler dropdown populated after selecting {school}")
                     return
             except Exception as e:
@@ -302,63 +895,163 @@ class PlaywrightScraper:
     def _scrape_wrestler_results(self, page: Page, wrestler: str, school: str) -> List[MatchData]:
         """Scrape results for a specific wrestler."""
         try:
-            # Select wrestler using the specific ID
-            selector = '#wrestler'
-            
-            try:
-                element = page.query_selector(selector)
-                if element:
-                    page.select_option(selector, wrestler)
-                    page.wait_for_timeout(1000)
-                    logger.debug(f"Selected wrestler {wrestler}")
-                else:
-                    logger.warning(f"Could not find wrestler dropdown")
-                    return []
-            except Exception as e:
-                logger.error(f"Failed to select wrestler: {e}")
-                return []
-            
-            # Click "Get Results" button using the specific ID
-            button_selector = '#get-results'
-            
-            try:
-                element = page.query_selector(button_selector)
-                if element:
-                    is_visible = page.is_visible(button_selector)
-                    is_enabled = page.is_enabled(button_selector)
-                    
-                    logger.debug(f"Get Results button: visible={is_visible}, enabled={is_enabled}")
-                    
-                    if is_visible and is_enabled:
-                        logger.debug(f"Clicking Get Results button")
-                        page.click(button_selector)
-                        page.wait_for_load_state('domcontentloaded')
-                        time.sleep(3)  # Wait for results to load
-                        logger.debug(f"Successfully clicked Get Results button")
-                    else:
-                        logger.warning(f"Get Results button not clickable: visible={is_visible}, enabled={is_enabled}")
-                        return []
-                else:
-                    logger.warning(f"Could not find Get Results button")
-                    return []
-            except Exception as e:
-                logger.error(f"Failed to click Get Results button: {e}")
-                return []
-            
-            # Get the results table HTML
-            html_content = page.content()
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Parse matches from the results table
-            matches = self._parse_results_table(soup, wrestler, school)
-            
-            logger.info(f"Found {len(matches)} matches for {wrestler}")
-            return matches
+            results = self._load_wrestler_results(page, wrestler)
+            return self._parse_results(results, wrestler, school)
             
         except Exception as e:
             logger.error(f"Error scraping results for wrestler {wrestler}: {e}")
             return []
     
+    def _load_wrestler_results(self, page: Page, wrestler: str) -> Results:
+        """
+        Select a wrestler, click Get Results and return the results.
+        
+        Returns the rows extracted in the page for the 'evaluate' source, the
+        fetch_results payload when it was captured, and otherwise the rendered
+        #results-table (or the page's tables if it is missing).
+        
+        Raises:
+            ScraperError: If the wrestler could not be selected, results requested, or
+                neither a results response nor a replaced #results-table arrived
+        """
+        # Select wrestler using the specific ID
+        selector = '#wrestler'
+        if not page.query_selector(selector):
+            raise ScraperError("Could not find wrestler dropdown")
+        
+        # Selecting a wrestler fires no AJAX, so there is nothing to wait for
+        page.select_option(selector, wrestler)
+        logger.debug(f"Selected wrestler {wrestler}")
+        
+        # Click "Get Results" button using the specific ID
+        button_selector = '#get-results'
+        if not page.query_selector(button_selector):
+            raise ScraperError("Could not find Get Results button")
+        
+        is_visible = page.is_visible(button_selector)
+        is_enabled = page.is_enabled(button_selector)
+        logger.debug(f"Get Results button: visible={is_visible}, enabled={is_enabled}")
+        
+        if not (is_visible and is_enabled):
+            raise ScraperError(f"Get Results button not clickable: visible={is_visible}, enabled={is_enabled}")
+        
+        # Until the AJAX callback replaces #results-table it still holds the previous wrestler's results
+        if not self.readiness.arm(page, '#results-table'):
+            raise ScraperError("Could not find results table")
+        
+        logger.debug(f"Clicking Get Results button")
+        if self.results_source == 'xhr':
+            # Read the results straight from the fetch_results response
+            response = self.readiness.response(
+                page,
+                lambda r: self._is_results_response(r, wrestler),
+                lambda: page.click(button_selector),
+                'results_xhr'
+            )
+            payload = self._read_results_payload(response)
+            if payload is not None:
+                # Only the results fragment gets parsed, not the whole page
+                return self._results_html_from_payload(payload)
+        else:
+            page.click(button_selector)
+        
+        if not self.readiness.changed(page, '#results-table', 'results'):
+            raise ScraperError(f"Results table was not updated for {wrestler}")
+        
+        if self.results_source == 'evaluate':
+            rows = page.evaluate(RESULTS_ROWS_JS)
+            if rows is not None:
+                return rows
+            logger.debug(f"No results table to extract for {wrestler}, falling back to HTML")
+        
+        # DOM fallback: the (just replaced) results container, or every table on the page if it is gone
+        container = page.query_selector('#results-table')
+        if container:
+            return container.inner_html()
+        return page.evaluate(TABLES_OUTER_HTML_JS)
+    
+    def _parse_results(self, results: Results, wrestler: str, school: str) -> List[MatchData]:
+        """Parse a wrestler's matches out of results HTML or extracted rows."""
+        if isinstance(results, str):
+            return self._parse_results_html(results, wrestler, school)
+        
+        matches = self._parse_rows(results, wrestler, school)
+        logger.info(f"Found {len(matches)} matches for {wrestler}")
+        return matches
+    
+    def _rows_to_html(self, rows: List[List[str]]) -> str:
+        """Rebuild a results table from extracted rows (for the archive and cache)."""
+        lines = ['<table>', '<tr>' + ''.join(f'<th>{name}</th>' for name in RESULT_COLUMNS) + '</tr>']
+        for row in rows:
+            lines.append('<tr>' + ''.join(f'<td>{html_lib.escape(cell)}</td>' for cell in row) + '</tr>')
+        lines.append('</table>')
+        return '\n'.join(lines)
+    
+    def _parse_results_html(self, html: str, wrestler: str, school: str) -> List[MatchData]:
+        """Parse a wrestler's matches out of results HTML (a fragment or a full page)."""
+        soup = BeautifulSoup(self._table_scope(html), self.html_parser)
+        matches = self._parse_results_table(soup, wrestler, school)
+        
+        logger.info(f"Found {len(matches)} matches for {wrestler}")
+        return matches
+    
+    def _table_scope(self, html: str) -> str:
+        """
+        Cut results HTML down to its top-level <table> elements.
+        
+        _parse_results_table only ever picks a table, so parsing just the
+        tables gives the same matches at a fraction of the cost for full
+        pages. Returns the HTML unchanged when that cannot be guaranteed:
+        no tables, nested tables, or a non-table '.results-table' element
+        that the selectors could match.
+        """
+        if RESULTS_TABLE_CLASS_PATTERN.search(html):
+            return html
+        
+        tables = TABLE_PATTERN.findall(html)
+        if not tables or any(table.lower().count('<table') > 1 for table in tables):
+            return html
+        return '\n'.join(tables)
+    
+    def _is_results_response(self, response, wrestler: str) -> bool:
+        """Match the admin-ajax fetch_results POST fired by #get-results for this wrestler."""
+        request = response.request
+        if request.method != 'POST' or 'admin-ajax' not in response.url:
+            return False
+        form = parse_qs(request.post_data or '')
+        return form.get('action') == ['fetch_results'] and form.get('wrestler') == [wrestler]
+    
+    def _read_results_payload(self, response) -> Optional[str]:
+        """Return the body of a captured results response, or None to fall back to the DOM."""
+        if response is None:
+            return None
+        try:
+            if not response.ok:
+                logger.warning(f"fetch_results returned HTTP {response.status}, falling back to DOM")
+                return None
+            return response.text()
+        except Exception as e:
+            logger.warning(f"Could not read fetch_results response ({e}), falling back to DOM")
+            return None
+    
+    def _results_html_from_payload(self, payload: str) -> str:
+        """
+        Get the results HTML out of an admin-ajax payload.
+        
+        DubStat returns the table HTML directly; a WordPress JSON envelope
+        ({"success": true, "data": ...}) is unwrapped as well.
+        """
+        stripped = payload.lstrip()
+        if stripped.startswith('{'):
+            try:
+                data = json.loads(stripped).get('data', '')
+                if isinstance(data, dict):
+                    data = data.get('html', '')
+                return data if isinstance(data, str) else ''
+            except (ValueError, AttributeError):
+                pass
+        return payload
+    
     def _parse_results_table(self, soup: BeautifulSoup, wrestler_name: str, school: str) -> List[MatchData]:
         """Parse matches from the results table HTML."""
         matches = []
@@ -394,21 +1087,26 @@ class PlaywrightScraper:
             
             # Parse table rows
             rows = results_table.find_all('tr')[1:]  # Skip header row
-            
-            for row in rows:
-                try:
-                    match_data = self._parse_match_row(row, wrestler_name, school)
-                    if match_data:
-                        matches.append(match_data)
-                except Exception as e:
-                    logger.debug(f"Error parsing row: {e}")
-                    continue
+            matches = self._parse_rows(rows, wrestler_name, school)
             
         except Exception as e:
             logger.error(f"Error parsing results table: {e}")
         
         return matches
     
+    def _parse_rows(self, rows: list, wrestler_name: str, school: str) -> List[MatchData]:
+        """Parse match rows (table row elements or lists of cell text), skipping bad rows."""
+        matches = []
+        for row in rows:
+            try:
+                match_data = self._parse_match_row(row, wrestler_name, school)
+                if match_data:
+                    matches.append(match_data)
+            except Exception as e:
+                logger.debug(f"Error parsing row: {e}")
+                continue
+        return matches
+    
     def _looks_like_results_table(self, table) -> bool:
         """Check if a table looks like it contains match results."""
         text = table.get_text().lower()
@@ -427,15 +1125,19 @@ class PlaywrightScraper:
         Column 5: Result (e.g., "D (3-0)", "F (5:32)", "TF (22-4)")
         Column 6: Opponent
         Column 7: Opponent School
+        
+        The row is a table row element, or the row's cell texts as extracted
+        in the browser (RESULTS_ROWS_JS).
         """
         try:
-            cells = row.find_all(['td', 'th'])
-            if len(cells) < 8:  # Need all 8 columns
-                logger.debug(f"Row has only {len(cells)} cells, expected 8")
-                return None
-            
             # Extract data from cells using fixed column positions
-            cell_texts = [cell.get_text().strip() for cell in cells]
+            if isinstance(row, (list, tuple)):
+                cell_texts = [str(cell).strip() for cell in row]
+            else:
+                cell_texts = [cell.get_text().strip() for cell in row.find_all(['td', 'th'])]
+            if len(cell_texts) < 8:  # Need all 8 columns
+                logger.debug(f"Row has only {len(cell_texts)} cells, expected 8")
+                return None
             
             # Column 0: Event Date (optional, not used in MVP)
             event_date = cell_texts[0] if len(cell_texts) > 0 else None
@@ -526,70 +1228,11 @@ class PlaywrightScraper:
         Returns:
             Tuple of (MatchType, scores_dict, match_time) where scores_dict has 'winner_score'
             and 'loser_score', and match_time is the time string for pins (e.g. "5:32") or None.
-        """
-        import re
-        scores = {'winner_score': 0, 'loser_score': 0}
-        match_time = None
-        result_upper = result_str.upper().strip()
-        
-        # Default to decision
-        match_type = MatchType.DECISION
-        
-        # Check for forfeit
-        if 'FF' in result_upper or 'FORFEIT' in result_upper:
-            match_type = MatchType.FORFEIT
-            return match_type, scores, match_time
-        
-        # Check for disqualification
-        if 'DQ' in result_upper or 'DISQUAL' in result_upper:
-            match_type = MatchType.DISQUALIFICATION
-            return match_type, scores, match_time
-        
-        # Check for fall/pin (format: "F (5:32)" or "F (1:54)")
-        if result_upper.startswith('F ') or result_upper.startswith('FALL'):
-            match_type = MatchType.PIN
-            # Extract time from parentheses (e.g. "5:32" or "1:54.2")
-            time_match = re.search(r'\((\d+:\d+(?:\.\d+)?)\)', result_str)
-            if time_match:
-                match_time = time_match.group(1)
-            return match_type, scores, match_time
-        
-        # Check for technical fall (format: "TF (22-4)")
-        if result_upper.startswith('TF '):
-            match_type = MatchType.TECH_FALL
-            # Extract score from parentheses
-            score_match = re.search(r'\((\d+)-(\d+)\)', result_str)
-            if score_match:
-                scores['winner_score'] = int(score_match.group(1))
-                scores['loser_score'] = int(score_match.group(2))
-            return match_type, scores, match_time
-        
-        # Check for major decision (format: "MD (8-0)")
-        if result_upper.startswith('MD '):
-            match_type = MatchType.MAJOR_DECISION
-            # Extract score from parentheses
-            score_match = re.search(r'\((\d+)-(\d+)\)', result_str)
-            if score_match:
-                scores['winner_score'] = int(score_match.group(1))
-                scores['loser_score'] = int(score_match.group(2))
-            return match_type, scores, match_time
-        
-        # Check for decision (format: "D (3-0)")
-        if result_upper.startswith('D '):
-            match_type = MatchType.DECISION
-            # Extract score from parentheses
-            score_match = re.search(r'\((\d+)-(\d+)\)', result_str)
-            if score_match:
-                scores['winner_score'] = int(score_match.group(1))
-                scores['loser_score'] = int(score_match.group(2))
-            return match_type, scores, match_time
-        
-        # Fallback: try to extract any score pattern
-        score_match = re.search(r'\((\d+)-(\d+)\)', result_str)
-        if score_match:
-            scores['winner_score'] = int(score_match.group(1))
-            scores['loser_score'] = int(score_match.group(2))
         
+        Decoding is memoized in decode_result; each call still gets its own scores dict.
+        """
+        match_type, winner_score, loser_score, match_time = decode_result(result_str)
+        scores = {'winner_score': winner_score, 'loser_score': loser_score}
         return match_type, scores, match_time
     
     def _parse_match_type(self, type_str: str) -> MatchType:
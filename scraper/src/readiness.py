@@ -0,0 +1,312 @@
+"""
+Event-driven readiness waits for the DubStat page.
+
+DubStat fills #school, #wrestler and #results-table by replacing their HTML
+from jQuery AJAX callbacks. Instead of sleeping a fixed amount after every
+interaction, these waiters arm a MutationObserver on the element that is
+about to be replaced, perform the interaction, and return as soon as the
+element actually changes (or, for results, as soon as the AJAX response
+lands). Fixed timeouts are only used when the signal never arrives.
+"""
+import time
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+logger = logging.getLogger(__name__)
+
+
+# Counts childList mutations on the target so replacing its HTML is observable,
+# even when the new content happens to be identical to the old content.
+ARM_OBSERVER_JS = '''
+(selector) => {
+    const el = document.querySelector(selector);
+    if (!el) return false;
+    window.__readiness = window.__readiness || {counts: {}, observers: {}};
+    const state = window.__readiness;
+    if (state.observers[selector]) state.observers[selector].disconnect();
+    state.counts[selector] = 0;
+    const observer = new MutationObserver(() => { state.counts[selector] += 1; });
+    observer.observe(el, {childList: true, subtree: true});
+    state.observers[selector] = observer;
+    return true;
+}
+'''
+
+MUTATED_JS = '''
+(selector) => !!(window.__readiness && window.__readiness.counts[selector] > 0)
+'''
+
+# The dropdown change handlers are bound in $(document).ready, so interacting
+# before jQuery is ready would fire change events nobody listens to.
+PAGE_READY_JS = '''
+() => {
+    const $ = window.jQuery;
+    const el = document.querySelector('#gender');
+    return !!(el && $ && $.isReady);
+}
+'''
+
+
+class _ReadinessTimings:
+    """Thread-safe record of how long each kind of wait actually took."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings: Dict[str, Dict[str, float]] = {}
+
+    def _record(self, label: str, elapsed: float, fallback: bool) -> None:
+        with self._lock:
+            entry = self._timings.setdefault(
+                label, {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'fallbacks': 0}
+            )
+            entry['count'] += 1
+            entry['total_seconds'] += elapsed
+            entry['max_seconds'] = max(entry['max_seconds'], elapsed)
+            if fallback:
+                entry['fallbacks'] += 1
+
+    def reset(self) -> None:
+        """Forget recorded waits, so the next summary() covers only what follows."""
+        with self._lock:
+            self._timings = {}
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-label wait statistics in milliseconds, suitable for the run stats."""
+        with self._lock:
+            return {
+                label: {
+                    'count': int(entry['count']),
+                    'avg_ms': round(entry['total_seconds'] / entry['count'] * 1000, 1),
+                    'max_ms': round(entry['max_seconds'] * 1000, 1),
+                    'fallbacks': int(entry['fallbacks']),
+                }
+                for label, entry in self._timings.items()
+            }
+
+
+class ReadinessWaiter(_ReadinessTimings):
+    """Readiness waits for the sync Playwright API."""
+
+    def __init__(self, timeout_ms: int = 10000, fallback_ms: int = 3000):
+        """
+        Args:
+            timeout_ms: How long to wait for the real signal
+            fallback_ms: Fixed wait used when the signal cannot be observed
+        """
+        super().__init__()
+        self.timeout_ms = timeout_ms
+        self.fallback_ms = fallback_ms
+
+    def page_ready(self, page) -> float:
+        """Wait until the search form is interactive. Returns seconds waited."""
+        start = time.perf_counter()
+        fallback = False
+        try:
+            page.wait_for_function(PAGE_READY_JS, timeout=self.timeout_ms)
+        except Exception as e:
+            logger.debug(f"Page readiness signal not seen ({e}), falling back to fixed wait")
+            page.wait_for_timeout(self.fallback_ms)
+            fallback = True
+        elapsed = time.perf_counter() - start
+        self._record('page_ready', elapsed, fallback)
+        return elapsed
+
+    def after(self, page, selector: str, action: Callable[[], Any], label: str,
+              fallback_condition: Optional[str] = None) -> float:
+        """
+        Run `action` and wait until the element at `selector` has been replaced.
+
+        Args:
+            page: Playwright page
+            selector: Element whose contents the action's AJAX callback replaces
+            action: Interaction that triggers the update (select, click, ...)
+            label: Name under which the wait time is recorded
+            fallback_condition: JS expression to wait for if no mutation is seen
+
+        Returns:
+            Seconds spent waiting after the action
+        """
+        armed = self.arm(page, selector)
+
+        action()
+
+        start = time.perf_counter()
+        fallback = not armed
+        if armed:
+            try:
+                page.wait_for_function(MUTATED_JS, arg=selector, timeout=self.timeout_ms)
+            except Exception as e:
+                logger.debug(f"No update on {selector} after {self.timeout_ms}ms ({e})")
+                fallback = True
+
+        if fallback:
+            if fallback_condition:
+                try:
+                    page.wait_for_function(fallback_condition, timeout=self.fallback_ms)
+                except Exception as e:
+                    logger.debug(f"Fallback condition for {label} not met: {e}")
+            else:
+                page.wait_for_timeout(self.fallback_ms)
+
+        elapsed = time.perf_counter() - start
+        self._record(label, elapsed, fallback)
+        return elapsed
+
+    def arm(self, page, selector: str) -> bool:
+        """
+        Start counting replacements of the element at `selector`, for changed().
+
+        Returns:
+            False if the element is missing or the observer could not be armed
+        """
+        try:
+            return bool(page.evaluate(ARM_OBSERVER_JS, selector))
+        except Exception as e:
+            logger.debug(f"Could not arm readiness observer on {selector}: {e}")
+            return False
+
+    def changed(self, page, selector: str, label: str) -> bool:
+        """
+        Wait until the element armed with arm() has been replaced.
+
+        Returns:
+            True once it has changed, False if it did not change in time
+        """
+        start = time.perf_counter()
+        changed = True
+        try:
+            page.wait_for_function(MUTATED_JS, arg=selector, timeout=self.timeout_ms)
+        except PlaywrightTimeoutError as e:
+            logger.debug(f"No update on {selector} after {self.timeout_ms}ms ({e})")
+            changed = False
+
+        self._record(label, time.perf_counter() - start, not changed)
+        return changed
+
+    def response(self, page, predicate: Callable[[Any], bool], action: Callable[[], Any],
+                 label: str) -> Optional[Any]:
+        """
+        Run `action` and wait for the network response matching `predicate`.
+
+        Errors from `action` itself (e.g. a failed click) are raised; only
+        the response not arriving in time counts as a miss.
+
+        Returns:
+            The Playwright Response, or None if it did not arrive in time
+        """
+        start = time.perf_counter()
+        response = None
+        acted = False
+        try:
+            with page.expect_response(predicate, timeout=self.timeout_ms) as response_info:
+                action()
+                acted = True
+            response = response_info.value
+        except PlaywrightTimeoutError as e:
+            if not acted:
+                raise
+            logger.debug(f"No {label} response after {self.timeout_ms}ms ({e})")
+
+        self._record(label, time.perf_counter() - start, response is None)
+        return response
+
+
+class AsyncReadinessWaiter(_ReadinessTimings):
+    """Readiness waits for the async Playwright API."""
+
+    def __init__(self, timeout_ms: int = 10000, fallback_ms: int = 3000):
+        """
+        Args:
+            timeout_ms: How long to wait for the real signal
+            fallback_ms: Fixed wait used when the signal cannot be observed
+        """
+        super().__init__()
+        self.timeout_ms = timeout_ms
+        self.fallback_ms = fallback_ms
+
+    async def page_ready(self, page) -> float:
+        """Wait until the search form is interactive. Returns seconds waited."""
+        start = time.perf_counter()
+        fallback = False
+        try:
+            await page.wait_for_function(PAGE_READY_JS, timeout=self.timeout_ms)
+        except Exception as e:
+            logger.debug(f"Page readiness signal not seen ({e}), falling back to fixed wait")
+            await page.wait_for_timeout(self.fallback_ms)
+            fallback = True
+        elapsed = time.perf_counter() - start
+        self._record('page_ready', elapsed, fallback)
+        return elapsed
+
+    async def after(self, page, selector: str, action: Callable[[], Awaitable[Any]], label: str,
+                    fallback_condition: Optional[str] = None) -> float:
+        """Async counterpart of ReadinessWaiter.after; `action` returns an awaitable."""
+        armed = await self.arm(page, selector)
+
+        await action()
+
+        start = time.perf_counter()
+        fallback = not armed
+        if armed:
+            try:
+                await page.wait_for_function(MUTATED_JS, arg=selector, timeout=self.timeout_ms)
+            except Exception as e:
+                logger.debug(f"No update on {selector} after {self.timeout_ms}ms ({e})")
+                fallback = True
+
+        if fallback:
+            if fallback_condition:
+                try:
+                    await page.wait_for_function(fallback_condition, timeout=self.fallback_ms)
+                except Exception as e:
+                    logger.debug(f"Fallback condition for {label} not met: {e}")
+            else:
+                await page.wait_for_timeout(self.fallback_ms)
+
+        elapsed = time.perf_counter() - start
+        self._record(label, elapsed, fallback)
+        return elapsed
+
+    async def arm(self, page, selector: str) -> bool:
+        """Async counterpart of ReadinessWaiter.arm."""
+        try:
+            return bool(await page.evaluate(ARM_OBSERVER_JS, selector))
+        except Exception as e:
+            logger.debug(f"Could not arm readiness observer on {selector}: {e}")
+            return False
+
+    async def changed(self, page, selector: str, label: str) -> bool:
+        """Async counterpart of ReadinessWaiter.changed."""
+        start = time.perf_counter()
+        changed = True
+        try:
+            await page.wait_for_function(MUTATED_JS, arg=selector, timeout=self.timeout_ms)
+        except PlaywrightTimeoutError as e:
+            logger.debug(f"No update on {selector} after {self.timeout_ms}ms ({e})")
+            changed = False
+
+        self._record(label, time.perf_counter() - start, not changed)
+        return changed
+
+    async def response(self, page, predicate: Callable[[Any], bool], action: Callable[[], Awaitable[Any]],
+                       label: str) -> Optional[Any]:
+        """Async counterpart of ReadinessWaiter.response; `action` returns an awaitable."""
+        start = time.perf_counter()
+        response = None
+        acted = False
+        try:
+            async with page.expect_response(predicate, timeout=self.timeout_ms) as response_info:
+                await action()
+                acted = True
+            response = await response_info.value
+        except PlaywrightTimeoutError as e:
+            if not acted:
+                raise
+            logger.debug(f"No {label} response after {self.timeout_ms}ms ({e})")
+
+        self._record(label, time.perf_counter() - start, response is None)
+        return response
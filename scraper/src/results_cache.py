@@ -0,0 +1,98 @@
+"""
+Results fingerprint cache for the DubStat scraper.
+
+Most wrestlers' results tables do not change between runs. This cache keeps
+a content hash of each wrestler's last stored results table in a local
+SQLite file, so an unchanged table can be skipped before it is parsed,
+validated or sent to the database.
+"""
+import os
+import re
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResultsCache:
+    """SQLite map of (school, wrestler) -> fingerprint of the stored results table.
+
+    Safe to share between worker threads.
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS results_fingerprints (
+            school TEXT NOT NULL,
+            wrestler TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (school, wrestler)
+        );
+    '''
+
+    # Whitespace between tags varies with how the HTML was serialized
+    # (AJAX payload vs. rendered DOM), not with the results themselves.
+    _WHITESPACE = re.compile(r'>\s+<')
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite file to store fingerprints in (created if missing)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+
+    @classmethod
+    def fingerprint(cls, html: str) -> str:
+        """Hash a results table, ignoring whitespace between tags."""
+        normalized = cls._WHITESPACE.sub('><', html.strip())
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def get(self, school: str, wrestler: str) -> Optional[str]:
+        """Return the fingerprint stored for a wrestler, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT fingerprint FROM results_fingerprints WHERE school = ? AND wrestler = ?',
+                (school, wrestler)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_unchanged(self, school: str, wrestler: str, fingerprint: str) -> bool:
+        """True if the wrestler's last stored results have this fingerprint."""
+        return self.get(school, wrestler) == fingerprint
+
+    def store(self, school: str, wrestler: str, fingerprint: str) -> None:
+        """Remember the fingerprint of results that were written successfully."""
+        with self._lock:
+            self._conn.execute(
+                '''INSERT INTO results_fingerprints (school, wrestler, fingerprint, updated_at)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT (school, wrestler) DO UPDATE SET
+                       fingerprint = excluded.fingerprint,
+                       updated_at = excluded.updated_at''',
+                (school, wrestler, fingerprint, datetime.now().isoformat())
+            )
+            self._conn.commit()
+
+    def size(self) -> int:
+        """Number of wrestlers with a stored fingerprint."""
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM results_fingerprints').fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
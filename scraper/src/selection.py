@@ -0,0 +1,151 @@
+"""
+Gender and school selection for DubStat crawls.
+
+A SelectionSpec decides which gender and school dropdown options a run
+scrapes: everything, include/exclude lists, a regex, or a file of school
+names. It can also keep only one shard of the selected schools. Shards are
+assigned from a hash of the school name, so the same school always lands in
+the same shard no matter what order the site lists schools in.
+"""
+import re
+import zlib
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+ALL = 'all'
+
+
+def _split_list(value: str) -> List[str]:
+    """Split a comma-separated setting into trimmed, non-empty entries."""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+@dataclass
+class SelectionSpec:
+    """Which genders and schools a crawl should cover.
+
+    Attributes:
+        genders: Gender option values to keep (case-insensitive); empty keeps all
+        schools: Keep schools whose name contains any of these (case-insensitive);
+            empty keeps all
+        exclude_schools: Drop schools whose name contains any of these
+        school_pattern: Regex a school name must match (re.search, case-insensitive)
+        schools_file: File with one school name per line, added to `schools`
+            ('#' starts a comment)
+        shard_index: Which shard of the selected schools to keep (0-based)
+        shard_count: Number of shards the selected schools are split into
+    """
+    genders: List[str] = field(default_factory=lambda: ['boys'])
+    schools: List[str] = field(default_factory=lambda: ['olentangy liberty'])
+    exclude_schools: List[str] = field(default_factory=list)
+    school_pattern: Optional[str] = None
+    schools_file: Optional[str] = None
+    shard_index: int = 0
+    shard_count: int = 1
+
+    def __post_init__(self):
+        if self.shard_count < 1:
+            raise ValueError(f"shard_count must be at least 1, got {self.shard_count}")
+        if not 0 <= self.shard_index < self.shard_count:
+            raise ValueError(f"shard_index must be in [0, {self.shard_count}), got {self.shard_index}")
+
+        self._genders = [g.lower() for g in self.genders]
+        self._includes = [s.lower() for s in self.schools]
+        if self.schools_file:
+            self._includes.extend(name.lower() for name in self._read_schools_file(self.schools_file))
+        self._excludes = [s.lower() for s in self.exclude_schools]
+        try:
+            self._pattern = re.compile(self.school_pattern, re.IGNORECASE) if self.school_pattern else None
+        except re.error as e:
+            raise ValueError(f"Invalid school_pattern {self.school_pattern!r}: {e}")
+
+    @classmethod
+    def from_settings(cls, settings) -> 'SelectionSpec':
+        """
+        Build a spec from SCRAPER_GENDERS, SCRAPER_SCHOOLS, SCRAPER_EXCLUDE_SCHOOLS,
+        SCRAPER_SCHOOL_PATTERN, SCRAPER_SCHOOLS_FILE, SCRAPER_SHARD_INDEX and
+        SCRAPER_SHARD_COUNT. 'all' for genders or schools selects every option.
+        """
+        genders = _split_list(settings.SCRAPER_GENDERS)
+        schools = _split_list(settings.SCRAPER_SCHOOLS)
+        return cls(
+            genders=[] if [g.lower() for g in genders] == [ALL] else genders,
+            schools=[] if [s.lower() for s in schools] == [ALL] else schools,
+            exclude_schools=_split_list(settings.SCRAPER_EXCLUDE_SCHOOLS),
+            school_pattern=settings.SCRAPER_SCHOOL_PATTERN or None,
+            schools_file=settings.SCRAPER_SCHOOLS_FILE or None,
+            shard_index=settings.SCRAPER_SHARD_INDEX,
+            shard_count=settings.SCRAPER_SHARD_COUNT
+        )
+
+    def with_shard(self, shard_index: int, shard_count: int) -> 'SelectionSpec':
+        """Copy of this spec restricted to one shard."""
+        return SelectionSpec(
+            genders=list(self.genders),
+            schools=list(self.schools),
+            exclude_schools=list(self.exclude_schools),
+            school_pattern=self.school_pattern,
+            schools_file=self.schools_file,
+            shard_index=shard_index,
+            shard_count=shard_count
+        )
+
+    @staticmethod
+    def shard_of(school: str, shard_count: int) -> int:
+        """Stable shard number for a school (independent of list order and process)."""
+        return zlib.crc32(school.strip().lower().encode('utf-8')) % shard_count
+
+    def select_genders(self, genders: List[str]) -> List[str]:
+        """Keep the gender options this run should scrape."""
+        if not self._genders:
+            return list(genders)
+        return [g for g in genders if g.lower() in self._genders]
+
+    def matches_school(self, school: str) -> bool:
+        """True if a school passes the include, exclude and regex rules (ignores sharding)."""
+        name = school.lower()
+        if self._includes and not any(include in name for include in self._includes):
+            return False
+        if any(exclude in name for exclude in self._excludes):
+            return False
+        if self._pattern and not self._pattern.search(school):
+            return False
+        return True
+
+    def select_schools(self, schools: List[str]) -> List[str]:
+        """Keep the school options this run (and shard) should scrape, in site order."""
+        return [
+            school for school in schools
+            if self.matches_school(school)
+            and self.shard_of(school, self.shard_count) == self.shard_index
+        ]
+
+    def describe(self) -> str:
+        """One-line summary for logs."""
+        # Schools named directly and read from schools_file are both includes
+        school_sources = [str(self.schools)] if self.schools else []
+        if self.schools_file:
+            school_sources.append(f"{self.schools_file} ({len(self._includes) - len(self.schools)} names)")
+        parts = [
+            f"genders={self.genders or ALL}",
+            f"schools={' + '.join(school_sources) or ALL}",
+        ]
+        if self.exclude_schools:
+            parts.append(f"exclude={self.exclude_schools}")
+        if self.school_pattern:
+            parts.append(f"pattern={self.school_pattern!r}")
+        if self.shard_count > 1:
+            parts.append(f"shard={self.shard_index + 1}/{self.shard_count}")
+        return ', '.join(parts)
+
+    def _read_schools_file(self, path: str) -> List[str]:
+        with open(path, encoding='utf-8') as f:
+            names = [line.split('#', 1)[0].strip() for line in f]
+        names = [name for name in names if name]
+        logger.info(f"Loaded {len(names)} schools from {path}")
+        return names
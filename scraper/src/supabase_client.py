@@ -3,15 +3,19 @@ Supabase client for wrestling analytics data operations.
 """
 import os
 import uuid
-from typing import List, Optional, Dict, Any, Tuple
+import threading
+import functools
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import logging
-from supabase import create_client, Client
+from supabase import Client
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
 from .models import WrestlerData, MatchData, TournamentData, MatchType
 from .data_validator import DataValidator
+from .connections import get_rest_pool
+from .write_buffer import WriteBehindBuffer
 
 
 logger = logging.getLogger(__name__)
@@ -22,10 +26,53 @@ class SupabaseClientError(Exception):
     pass
 
 
+# Rows per request when preloading ids (PostgREST's default max-rows)
+ID_PRELOAD_PAGE_SIZE = 1000
+# Names per `in` filter when resolving a batch (keeps the request URL short)
+ID_LOOKUP_CHUNK_SIZE = 100
+
+
+class IdentityMap:
+    """Thread-safe name → id map for one table, so repeat lookups skip the database."""
+    
+    def __init__(self):
+        self._ids: Dict[str, str] = {}
+        self._name_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, name: str) -> Optional[str]:
+        with self._lock:
+            return self._ids.get(name)
+    
+    def put(self, name: str, row_id: str) -> str:
+        """Remember an id for a name; the first id stored for a name wins and is returned."""
+        with self._lock:
+            return self._ids.setdefault(name, row_id)
+    
+    def name_lock(self, name: str) -> threading.Lock:
+        """Lock held while looking up or creating a name, so two threads never both create it."""
+        with self._lock:
+            return self._name_locks.setdefault(name, threading.Lock())
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ids)
+
+
+def _pooled(method: Callable) -> Callable:
+    """Run a SupabaseClient method with a pooled HTTP session checked out for the calling thread."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._rest.checkout():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class SupabaseClient:
     """Client for interacting with Supabase database."""
     
-    def __init__(self, url: Optional[str] = None, key: Optional[str] = None):
+    def __init__(self, url: Optional[str] = None, key: Optional[str] = None,
+                 preload_ids: Optional[bool] = None):
         """
         Initialize Supabase client.
         
@@ -33,6 +80,8 @@ class SupabaseClient:
             url: Supabase project URL (defaults to SUPABASE_URL env var)
             key: Supabase key (defaults to SUPABASE_SERVICE_ROLE_KEY for writes, 
                 falls back to SUPABASE_ANON_KEY)
+            preload_ids: Load every wrestler and tournament id up front so lookups
+                by name need no request (defaults to SUPABASE_PRELOAD_IDS, true)
         """
         self.url = url or os.getenv('SUPABASE_URL')
         # Prefer service_role key for write operations, fall back to anon key
@@ -42,23 +91,138 @@ class SupabaseClient:
             raise SupabaseClientError("Supabase URL and key are required")
         
         try:
-            self.client: Client = create_client(self.url, self.key)
+            # Shared with every other SupabaseClient in the process, so new clients start warm
+            self._rest = get_rest_pool(self.url, self.key)
+            self._rest.default()
             logger.info("Supabase client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {e}")
             raise SupabaseClientError(f"Failed to initialize client: {e}")
         
         self.validator = DataValidator()
+        # Cleared if the upsert_matches() database function turns out to be missing
+        self._bulk_upsert = True
+        # Cleared if the get_or_create_wrestlers()/get_or_create_tournaments() functions are missing
+        self._server_get_or_create = True
+        
+        # Background batch writer, see start_write_behind()
+        self._writer: Optional[WriteBehindBuffer] = None
+        self._writer_lock = threading.Lock()
+        
+        # Name → id for wrestlers and tournaments, shared by all writer threads
+        self.identity = {'wrestlers': IdentityMap(), 'tournaments': IdentityMap()}
+        if preload_ids is None:
+            preload_ids = os.getenv('SUPABASE_PRELOAD_IDS', 'true').lower() == 'true'
+        if preload_ids:
+            self.preload_ids()
+    
+    @property
+    def client(self) -> Client:
+        """
+        Supabase client for the calling thread: its pooled checkout inside
+        SupabaseClient methods, otherwise the pool's default client.
+        """
+        return self._rest.current() or self._rest.default()
     
-    def batch_insert_matches(self, matches: List[MatchData]) -> bool:
+    @_pooled
+    def preload_ids(self) -> None:
+        """Load every wrestler and tournament name → id into the identity map, a page at a time."""
+        for table, ids in self.identity.items():
+            try:
+                start = 0
+                while True:
+                    # Oldest first, so a name stored more than once maps to its original row
+                    result = (self.client.table(table).select('id, name')
+                              .order('created_at').order('id')
+                              .range(start, start + ID_PRELOAD_PAGE_SIZE - 1).execute())
+                    rows = result.data or []
+                    for row in rows:
+                        ids.put(row['name'], row['id'])
+                    if len(rows) < ID_PRELOAD_PAGE_SIZE:
+                        break
+                    start += ID_PRELOAD_PAGE_SIZE
+                logger.info(f"Preloaded {len(ids)} {table} ids")
+            except Exception as e:
+                # Not fatal: names missing from the map are looked up one at a time
+                logger.warning(f"Failed to preload {table} ids: {e}")
+    
+    def start_write_behind(self, batch_size: int = 100, max_delay: float = 2.0,
+                           max_pending: Optional[int] = None,
+                           write: Optional[Callable[[List[MatchData]], bool]] = None) -> WriteBehindBuffer:
+        """
+        Start the background writer used by enqueue_matches() (no-op if running).
+        
+        Args:
+            batch_size: Matches per database write (Settings.SCRAPER_BATCH_SIZE)
+            max_delay: Seconds a queued match may wait before a partial batch is written
+            max_pending: Queued matches before enqueue_matches() blocks (default 10 batches)
+            write: Writes one batch of cleaned matches, returning True on success
+                (defaults to batch_insert_matches; e.g. a CopyLoader for bulk runs)
+        """
+        if write is None:
+            write = lambda batch: self.batch_insert_matches(batch, prevalidated=True, batch_size=batch_size)
+        
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = WriteBehindBuffer(
+                    write, batch_size=batch_size, max_delay=max_delay, max_pending=max_pending
+                )
+                logger.info(f"Write-behind started: batches of {batch_size}, max delay {max_delay}s")
+            return self._writer
+    
+    def enqueue_matches(self, matches: List[MatchData], prevalidated: bool = False,
+                        on_written: Optional[Callable[[bool], None]] = None) -> None:
+        """
+        Queue matches for the background writer, blocking while its queue is full.
+        
+        Args:
+            matches: Matches to write
+            prevalidated: The matches were already validated and cleaned
+            on_written: Called from the writer thread once all of these matches
+                are written, with False if any of their batches failed
+        """
+        if self._writer is None:
+            raise SupabaseClientError("Write-behind is not running; call start_write_behind() first")
+        if not prevalidated:
+            cleaned = []
+            for match in matches:
+                if self.validator.validate_match_data(match):
+                    cleaned.append(self.validator.clean_match_data(match))
+                else:
+                    logger.warning(f"Skipping invalid match: {match}")
+            matches = cleaned
+        self._writer.put(matches, on_written)
+    
+    def flush_write_behind(self) -> None:
+        """Wait until every queued match has been written."""
+        if self._writer is not None:
+            self._writer.flush()
+    
+    def close_write_behind(self) -> Optional[Dict[str, Any]]:
+        """Write every queued match, stop the background writer and return its summary."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is None:
+            return None
+        logger.info("Draining write-behind buffer")
+        writer.close()
+        return writer.summary()
+    
+    @_pooled
+    def batch_insert_matches(self, matches: List[MatchData], prevalidated: bool = False,
+                             batch_size: int = 50) -> bool:
         """
         Insert multiple matches in batch with duplicate detection.
         
         Args:
             matches: List of MatchData objects to insert
+            prevalidated: The matches were already validated and cleaned
+                (e.g. by the scraper's results pipeline); skip doing it again
+            batch_size: Matches per database request
             
         Returns:
-            True if successful, False otherwise
+            True if every valid match was inserted, updated or skipped as an
+            existing scored match; False if any failed to write
         """
         if not matches:
             logger.warning("No matches to insert")
@@ -70,41 +234,122 @@ class SupabaseClient:
             # Validate all matches first
             valid_matches = []
             skipped_invalid = 0
-            for match in matches:
-                if self.validator.validate_match_data(match):
-                    valid_matches.append(self.validator.clean_match_data(match))
-                else:
-                    logger.warning(f"Skipping invalid match: {match}")
-                    skipped_invalid += 1
+            if prevalidated:
+                valid_matches = list(matches)
+            else:
+                for match in matches:
+                    if self.validator.validate_match_data(match):
+                        valid_matches.append(self.validator.clean_match_data(match))
+                    else:
+                        logger.warning(f"Skipping invalid match: {match}")
+                        skipped_invalid += 1
             
             if not valid_matches:
                 logger.warning("No valid matches to insert after validation")
                 return False
             
             # Process matches in smaller batches to avoid timeouts
-            batch_size = 50
+            batch_size = max(1, batch_size)
             total_inserted = 0
             total_updated = 0
             total_skipped = 0
+            total_failed = 0
             
             for i in range(0, len(valid_matches), batch_size):
                 batch = valid_matches[i:i + batch_size]
                 inserted, updated, skipped = self._insert_match_batch(batch)
+                failed = len(batch) - inserted - updated - skipped
                 total_inserted += inserted
                 total_updated += updated
                 total_skipped += skipped
-                logger.info(f"Batch {i//batch_size + 1}: {inserted} inserted, {updated} updated, {skipped} skipped")
+                total_failed += failed
+                logger.info(f"Batch {i//batch_size + 1}: {inserted} inserted, {updated} updated, {skipped} skipped, {failed} failed")
             
-            logger.info(f"Summary: {total_inserted} inserted, {total_updated} updated, {total_skipped} skipped, {skipped_invalid} invalid (out of {len(matches)} total)")
-            return (total_inserted + total_updated) > 0
+            logger.info(f"Summary: {total_inserted} inserted, {total_updated} updated, {total_skipped} skipped, {total_failed} failed, {skipped_invalid} invalid (out of {len(matches)} total)")
+            return total_failed == 0
             
         except Exception as e:
             logger.error(f"Failed to batch insert matches: {e}")
             return False
     
-    def _insert_match_batch(self, matches: List[MatchData]) -> int:
-        """Insert a single batch of matches, or update existing matches with 0-0 scores."""
+    def _insert_match_batch(self, matches: List[MatchData]) -> Tuple[int, int, int]:
+        """
+        Insert a single batch of matches, or update existing matches with 0-0 scores.
+        
+        Sends the whole batch to the upsert_matches() database function in one
+        request (see shared/database/upsert_matches_function.sql), which
+        resolves duplicates on idx_matches_unique_match. Falls back to one
+        request per match if the function is not installed or the batch is
+        rejected.
+        
+        Returns:
+            (inserted, updated, skipped) counts; matches not counted failed
+        """
+        try:
+            self.resolve_batch_ids(matches)
+        except Exception as e:
+            # Not fatal: names left unresolved are looked up one at a time below
+            logger.warning(f"Failed to resolve ids for batch: {e}")
+        
+        if self._bulk_upsert:
+            rows = self._match_rows(matches)
+            if not rows:
+                return 0, 0, 0
+            try:
+                result = self.client.rpc('upsert_matches', {'match_rows': rows}).execute()
+                counts = result.data[0] if result.data else {}
+                return counts.get('inserted', 0), counts.get('updated', 0), counts.get('skipped', 0)
+            except Exception as e:
+                if self._is_missing_function(e):
+                    logger.warning("upsert_matches() is not installed, writing matches one at a time "
+                                   "(run shared/database/upsert_matches_function.sql to enable bulk upserts)")
+                    self._bulk_upsert = False
+                else:
+                    logger.warning(f"Bulk upsert of {len(rows)} matches failed ({e}), retrying one at a time")
+        
+        return self._insert_matches_individually(matches)
+    
+    def _match_rows(self, matches: List[MatchData]) -> List[Dict[str, Any]]:
+        """
+        Resolve wrestler and tournament ids for a batch and build upsert_matches() rows.
+        
+        Matches whose ids cannot be resolved are left out (and count as failed).
+        """
+        rows = []
+        
+        for match in matches:
+            try:
+                wrestler1_id = self._ensure_wrestler_exists(match.wrestler1)
+                wrestler2_id = self._ensure_wrestler_exists(match.wrestler2)
+                tournament_id = self._ensure_tournament_exists(match)
+            except Exception as e:
+                logger.error(f"Failed to resolve ids for {match.wrestler1.name} vs {match.wrestler2.name}: {e}")
+                continue
+            
+            rows.append({
+                'tournament_id': tournament_id,
+                'wrestler1_id': wrestler1_id,
+                'wrestler2_id': wrestler2_id,
+                'winner_id': self._get_winner_id(match, wrestler1_id, wrestler2_id),
+                'wrestler1_score': match.wrestler1_score,
+                'wrestler2_score': match.wrestler2_score,
+                'match_type': match.match_type.value,
+                'round': match.round,
+                'match_time': match.match_time
+            })
+        
+        return rows
+    
+    def _is_missing_function(self, exc: Exception) -> bool:
+        """Return True if PostgREST could not find the called database function."""
+        msg = str(exc).lower()
+        return 'pgrst202' in msg or 'could not find the function' in msg or '42883' in msg
+    
+    def _insert_matches_individually(self, matches: List[MatchData]) -> Tuple[int, int, int]:
+        """Write matches one request at a time (the path used before upsert_matches())."""
         inserted_count = 0
+        updated_count = 0
+        skipped_count = 0
         
         for match in matches:
             try:
@@ -128,12 +373,13 @@ class SupabaseClient:
                             match.match_time
                         ):
                             logger.info(f"Updated match scores: {match.wrestler1.name} vs {match.wrestler2.name} ({match.tournament_name}, {match.round})")
-                            inserted_count += 1
+                            updated_count += 1
                         else:
                             logger.warning(f"Failed to update match: {match.wrestler1.name} vs {match.wrestler2.name}")
                     else:
                         # Match already has scores, skip it
                         logger.debug(f"Skipping match (already has scores): {match.wrestler1.name} vs {match.wrestler2.name} ({match.tournament_name}, {match.round})")
+                        skipped_count += 1
                     continue
                 
                 # Match doesn't exist - insert it
@@ -160,6 +406,7 @@ class SupabaseClient:
                     # Treat unique constraint violation (23505) as duplicate skip
                     if self._is_unique_violation(insert_err):
                         logger.info(f"Skipping duplicate match (DB constraint): {match.wrestler1.name} vs {match.wrestler2.name} ({match.tournament_name}, {match.round})")
+                        skipped_count += 1
                     else:
                         logger.error(f"Failed to insert match {match.wrestler1.name} vs {match.wrestler2.name}: {insert_err}")
                 
@@ -167,66 +414,170 @@ class SupabaseClient:
                 logger.error(f"Failed to insert individual match: {e}")
                 continue
         
-        return inserted_count
+        return inserted_count, updated_count, skipped_count
+    
+    @_pooled
+    def resolve_batch_ids(self, matches: List[MatchData]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Get or create every wrestler and tournament in a batch of matches.
+        
+        Returns:
+            (wrestler name → id, tournament name → id)
+        """
+        wrestlers: Dict[str, Dict[str, Any]] = {}
+        tournaments: Dict[str, Dict[str, Any]] = {}
+        for match in matches:
+            for wrestler in (match.wrestler1, match.wrestler2):
+                if wrestler.name not in wrestlers:
+                    wrestlers[wrestler.name] = self._wrestler_row(wrestler)
+            if match.tournament_name not in tournaments:
+                tournaments[match.tournament_name] = self._tournament_row(match)
+        
+        return self._get_or_create_ids('wrestlers', wrestlers), self._get_or_create_ids('tournaments', tournaments)
+    
+    def _get_or_create_ids(self, table: str, new_rows: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Return name → id for every name in `new_rows`, inserting the missing ones.
+        
+        Names in the identity map cost nothing. The rest are fetched with
+        `in` queries and whatever is still missing is created in one request
+        (see _create_rows).
+        """
+        ids = self.identity[table]
+        missing = sorted(name for name in new_rows if not ids.get(name))
+        
+        if missing:
+            # Same per-name locks as _resolve_id, taken in sorted order so batches cannot deadlock
+            locks = [ids.name_lock(name) for name in missing]
+            for lock in locks:
+                lock.acquire()
+            try:
+                # Another thread may have resolved some while we waited
+                missing = [name for name in missing if not ids.get(name)]
+                found = self._select_ids(table, missing)
+                to_create = [new_rows[name] for name in missing if name not in found]
+                
+                if to_create:
+                    found.update(self._create_rows(table, to_create))
+                
+                for name in missing:
+                    if name in found:
+                        ids.put(name, found[name])
+            finally:
+                for lock in locks:
+                    lock.release()
+        
+        return {name: row_id for name, row_id in ((name, ids.get(name)) for name in new_rows) if row_id}
+    
+    def _select_ids(self, table: str, names: List[str]) -> Dict[str, str]:
+        """name → id of the oldest row for each name that exists, ID_LOOKUP_CHUNK_SIZE names per request."""
+        found: Dict[str, str] = {}
+        for start in range(0, len(names), ID_LOOKUP_CHUNK_SIZE):
+            chunk = names[start:start + ID_LOOKUP_CHUNK_SIZE]
+            result = (self.client.table(table).select('id, name').in_('name', chunk)
+                      .order('created_at').order('id').execute())
+            for row in result.data or []:
+                found.setdefault(row['name'], row['id'])
+        return found
+    
+    def _create_rows(self, table: str, rows: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Create wrestlers/tournaments rows and return name → id of the oldest row for each name.
+        
+        Names have no unique constraint, so creation goes through the
+        get_or_create_<table>() database function, which locks each name on
+        the server and inserts it only if no row has it yet. Without the
+        function the rows are inserted directly and selected again: another
+        process creating the same name at the same moment leaves a duplicate
+        row, which is kept (matches may already reference it) and never used.
+        """
+        if self._server_get_or_create:
+            try:
+                result = self.client.rpc(f'get_or_create_{table}', {'new_rows': rows}).execute()
+                logger.debug(f"Resolved {len(rows)} new {table} on the server")
+                return {row['row_name']: row['row_id'] for row in result.data or []}
+            except Exception as e:
+                if not self._is_missing_function(e):
+                    raise
+                logger.warning(f"get_or_create_{table}() is not installed, inserting names directly "
+                               "(run shared/database/get_or_create_functions.sql to create them race-safely)")
+                self._server_get_or_create = False
+        
+        self.client.table(table).insert(rows).execute()
+        logger.debug(f"Created {len(rows)} {table}")
+        return self._select_ids(table, [row['name'] for row in rows])
+    
+    def _resolve_id(self, table: str, name: str, create: Callable[[], str]) -> str:
+        """
+        Return the id for a name in wrestlers/tournaments, creating the row if needed.
+        
+        Names in the identity map cost no request. Otherwise the database is
+        checked (the row may come from another process) and the row created,
+        under a per-name lock so concurrent writers create it only once.
+        """
+        ids = self.identity[table]
+        row_id = ids.get(name)
+        if row_id:
+            return row_id
+        
+        with ids.name_lock(name):
+            # Another thread may have resolved it while we waited
+            row_id = ids.get(name)
+            if row_id:
+                return row_id
+            
+            result = self.client.table(table).select('id').eq('name', name).order('created_at').order('id').limit(1).execute()
+            row_id = result.data[0]['id'] if result.data else create()
+            return ids.put(name, row_id)
     
     def _ensure_wrestler_exists(self, wrestler: WrestlerData) -> str:
         """Ensure wrestler exists in database and return ID - MVP simplified."""
         try:
-            # First check if wrestler already exists
-            result = self.client.table('wrestlers').select('id').eq('name', wrestler.name).execute()
-            
-            if result.data:
-                return result.data[0]['id']
-            
-            # Create new wrestler (no team reference in MVP)
-            wrestler_data = {
-                'id': str(uuid.uuid4()),
-                'name': wrestler.name,
-                'weight_class': wrestler.weight_class,
-                'created_at': datetime.now().isoformat()
-            }
-            
-            result = self.client.table('wrestlers').insert(wrestler_data).execute()
-            if result.data:
-                logger.debug(f"Created new wrestler: {wrestler.name}")
-                return result.data[0]['id']
-            else:
-                raise SupabaseClientError(f"Failed to create wrestler: {wrestler.name}")
-                
+            return self._resolve_id('wrestlers', wrestler.name, lambda: self._create_wrestler(wrestler))
         except Exception as e:
             logger.error(f"Failed to ensure wrestler exists: {e}")
             raise
     
+    def _wrestler_row(self, wrestler: WrestlerData) -> Dict[str, Any]:
+        """New wrestlers row (no team reference in MVP); id and created_at are assigned by the database."""
+        return {
+            'name': wrestler.name,
+            'weight_class': wrestler.weight_class
+        }
+    
+    def _create_wrestler(self, wrestler: WrestlerData) -> str:
+        """Insert a wrestler and return its ID."""
+        row_id = self._create_rows('wrestlers', [self._wrestler_row(wrestler)]).get(wrestler.name)
+        if row_id:
+            logger.debug(f"Created new wrestler: {wrestler.name}")
+            return row_id
+        raise SupabaseClientError(f"Failed to create wrestler: {wrestler.name}")
+    
     # Removed _ensure_team_exists - not needed for MVP simplified schema
     
     def _ensure_tournament_exists(self, match: MatchData) -> str:
         """Ensure tournament exists in database and return ID - MVP simplified."""
         try:
-            # Check if tournament already exists
-            result = self.client.table('tournaments').select('id').eq('name', match.tournament_name).execute()
-            
-            if result.data:
-                return result.data[0]['id']
-            
-            # Create new tournament (simplified)
-            tournament_data = {
-                'id': str(uuid.uuid4()),
-                'name': match.tournament_name,
-                'date': match.date.date().isoformat() if match.date else None,
-                'created_at': datetime.now().isoformat()
-            }
-            
-            result = self.client.table('tournaments').insert(tournament_data).execute()
-            if result.data:
-                logger.debug(f"Created new tournament: {match.tournament_name}")
-                return result.data[0]['id']
-            else:
-                raise SupabaseClientError(f"Failed to create tournament: {match.tournament_name}")
-                
+            return self._resolve_id('tournaments', match.tournament_name, lambda: self._create_tournament(match))
         except Exception as e:
             logger.error(f"Failed to ensure tournament exists: {e}")
             raise
     
+    def _tournament_row(self, match: MatchData) -> Dict[str, Any]:
+        """New tournaments row (simplified); id and created_at are assigned by the database."""
+        return {
+            'name': match.tournament_name,
+            'date': match.date.date().isoformat() if match.date else None
+        }
+    
+    def _create_tournament(self, match: MatchData) -> str:
+        """Insert a tournament and return its ID."""
+        row_id = self._create_rows('tournaments', [self._tournament_row(match)]).get(match.tournament_name)
+        if row_id:
+            logger.debug(f"Created new tournament: {match.tournament_name}")
+            return row_id
+        raise SupabaseClientError(f"Failed to create tournament: {match.tournament_name}")
+    
     def _is_unique_violation(self, exc: Exception) -> bool:
         """Return True if the exception is a PostgreSQL unique constraint violation (23505)."""
         msg = str(exc).lower()
@@ -312,6 +663,7 @@ class SupabaseClient:
         else:
             return None
     
+    @_pooled
     def update_wrestler_stats(self, wrestler_id: str) -> bool:
         """Update wrestler statistics based on match results - MVP simplified."""
         try:
@@ -325,6 +677,7 @@ class SupabaseClient:
             logger.error(f"Failed to update wrestler stats: {e}")
             return False
     
+    @_pooled
     def get_wrestler_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get wrestler data by name."""
         try:
@@ -334,6 +687,7 @@ class SupabaseClient:
             logger.error(f"Failed to get wrestler by name: {e}")
             return None
     
+    @_pooled
     def get_tournament_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get tournament data by name."""
         try:
@@ -343,6 +697,7 @@ class SupabaseClient:
             logger.error(f"Failed to get tournament by name: {e}")
             return None
     
+    @_pooled
     def get_matches_for_tournament(self, tournament_id: str) -> List[Dict[str, Any]]:
         """Get all matches for a tournament."""
         try:
@@ -355,6 +710,7 @@ class SupabaseClient:
     # Removed scraper job methods - not needed for MVP
     # Job tracking can be done through logs instead of database
     
+    @_pooled
     def test_connection(self) -> bool:
         """Test database connection."""
         try:
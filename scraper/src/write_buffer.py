@@ -0,0 +1,201 @@
+"""
+Write-behind buffer for match inserts.
+
+The scraper produces 20-40 matches per wrestler. Writing each wrestler's
+matches as its own database batch keeps batches tiny and makes the producer
+wait for every round trip. This buffer takes matches from any number of
+producer threads and writes them on a background thread in batches of up to
+`batch_size`, or sooner once the oldest queued match has waited `max_delay`
+seconds. A full queue blocks producers, and close() writes everything still
+queued before returning.
+"""
+import time
+import queue
+import atexit
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .models import MatchData
+
+
+logger = logging.getLogger(__name__)
+
+# Sentinels on the queue: write what is buffered now / write it and stop
+_FLUSH = object()
+_CLOSE = object()
+
+
+@dataclass
+class _Ticket:
+    """One put() call: how many of its matches are still unwritten and whether all writes succeeded."""
+    remaining: int
+    ok: bool
+    on_written: Optional[Callable[[bool], None]]
+
+
+class WriteBehindBuffer:
+    """Batches matches from producer threads and writes them on a background thread.
+
+    Safe to put() to from several threads. put() blocks while `max_pending`
+    matches are already waiting; flush() and close() wait until everything
+    queued before them has been written.
+    """
+
+    def __init__(self, write: Callable[[List[MatchData]], bool], batch_size: int = 100,
+                 max_delay: float = 2.0, max_pending: Optional[int] = None):
+        """
+        Args:
+            write: Writes one batch of matches, returning True on success
+                (e.g. SupabaseClient.batch_insert_matches)
+            batch_size: Matches per batch; a full batch is written at once
+            max_delay: Seconds the oldest queued match may wait before a
+                partial batch is written
+            max_pending: Matches that may wait in the queue before put()
+                blocks (defaults to 10 batches)
+        """
+        self.write = write
+        self.batch_size = max(1, batch_size)
+        self.max_delay = max(0.0, max_delay)
+        self.max_pending = max_pending or self.batch_size * 10
+        self._queue: queue.Queue = queue.Queue(maxsize=self.max_pending)
+        self._closed = False
+        self._put_wait = 0.0
+        self._lock = threading.Lock()
+        self._stats = {
+            'batches': 0,
+            'matches': 0,
+            'failed_batches': 0,
+            'flush_reasons': {'size': 0, 'delay': 0, 'flush': 0, 'close': 0},
+            'max_batch': 0,
+            'max_backlog': 0,
+        }
+        self._latencies: List[float] = []
+
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        # Buffered matches are still written if the process exits without close()
+        atexit.register(self.close)
+
+    def put(self, matches: List[MatchData], on_written: Optional[Callable[[bool], None]] = None) -> None:
+        """
+        Queue matches for writing, waiting while the queue is full.
+
+        Args:
+            matches: Validated, cleaned matches
+            on_written: Called on the writer thread once every one of these
+                matches has been written, with False if any batch failed
+        """
+        if self._closed:
+            raise RuntimeError("Write-behind buffer is closed")
+        if not matches:
+            if on_written:
+                on_written(True)
+            return
+
+        ticket = _Ticket(remaining=len(matches), ok=True, on_written=on_written)
+        started = time.perf_counter()
+        for match in matches:
+            self._queue.put((match, ticket, time.monotonic()))
+        with self._lock:
+            self._put_wait += time.perf_counter() - started
+
+    def flush(self) -> None:
+        """Write everything queued so far and wait until it is done."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait()
+
+    def close(self) -> None:
+        """Write everything still queued and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put((_CLOSE, None))
+        self._thread.join()
+
+    def summary(self) -> Dict[str, Any]:
+        """Batches written, batch sizes, flush reasons, flush latency and time producers spent blocked."""
+        with self._lock:
+            stats = dict(self._stats, flush_reasons=dict(self._stats['flush_reasons']))
+            latencies = sorted(self._latencies)
+            put_wait = self._put_wait
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000, 1)
+
+        return {
+            **stats,
+            'batch_size': self.batch_size,
+            'max_delay_s': self.max_delay,
+            'avg_batch': round(stats['matches'] / stats['batches'], 1) if stats['batches'] else 0.0,
+            'flush_latency_p50_ms': percentile(0.50),
+            'flush_latency_p95_ms': percentile(0.95),
+            'flush_latency_max_ms': percentile(1.0),
+            'put_wait_s': round(put_wait, 2),
+        }
+
+    def _run(self) -> None:
+        batch: List[Tuple[MatchData, _Ticket, float]] = []
+
+        while True:
+            with self._lock:
+                self._stats['max_backlog'] = max(self._stats['max_backlog'], self._queue.qsize())
+
+            timeout = None
+            if batch:
+                timeout = max(0.0, batch[0][2] + self.max_delay - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write_batch(batch, 'delay')
+                batch = []
+                continue
+
+            if item[0] is _FLUSH:
+                self._write_batch(batch, 'flush')
+                batch = []
+                item[1].set()
+                continue
+            if item[0] is _CLOSE:
+                self._write_batch(batch, 'close')
+                return
+
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._write_batch(batch, 'size')
+                batch = []
+
+    def _write_batch(self, batch: List[Tuple[MatchData, _Ticket, float]], reason: str) -> None:
+        if not batch:
+            return
+
+        try:
+            ok = bool(self.write([match for match, _, _ in batch]))
+        except Exception as e:
+            logger.error(f"Write-behind batch of {len(batch)} matches failed: {e}")
+            ok = False
+        finished = time.monotonic()
+
+        with self._lock:
+            self._stats['batches'] += 1
+            self._stats['matches'] += len(batch)
+            self._stats['failed_batches'] += 0 if ok else 1
+            self._stats['flush_reasons'][reason] += 1
+            self._stats['max_batch'] = max(self._stats['max_batch'], len(batch))
+            self._latencies.append(finished - batch[0][2])
+
+        for _, ticket, _ in batch:
+            ticket.remaining -= 1
+            ticket.ok = ticket.ok and ok
+            if ticket.remaining == 0 and ticket.on_written:
+                try:
+                    ticket.on_written(ticket.ok)
+                except Exception as e:
+                    logger.error(f"Write-behind callback failed: {e}")
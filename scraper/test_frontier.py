@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the durable crawl frontier (src/frontier.py).
+Each test uses its own temporary SQLite file.
+Usage: python -m pytest test_frontier.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.frontier import CrawlFrontier
+
+
+def open_frontier(tmp_path, **kwargs) -> CrawlFrontier:
+    return CrawlFrontier(str(tmp_path / 'frontier.sqlite'), **kwargs)
+
+
+def age_last_run(frontier: CrawlFrontier, started_at: str) -> None:
+    frontier._conn.execute('UPDATE runs SET started_at = ? WHERE id = ?', (started_at, frontier.run_id))
+    frontier._conn.commit()
+
+
+def test_unfinished_run_is_resumed_and_skips_done_wrestlers(tmp_path):
+    frontier = open_frontier(tmp_path)
+    assert frontier.begin() is False
+    frontier.add_school('boys', 'Central', ['Smith', 'Jones'])
+    frontier.mark_done('boys', 'Central', 'Smith')
+    frontier.close()
+
+    frontier = open_frontier(tmp_path)
+    assert frontier.begin() is True
+    assert frontier.should_process('boys', 'Central', 'Smith') is False
+    assert frontier.should_process('boys', 'Central', 'Jones') is True
+    assert frontier.summary() == {'pending': 1, 'done': 1, 'failed': 0}
+
+
+def test_finished_run_starts_fresh(tmp_path):
+    frontier = open_frontier(tmp_path)
+    frontier.begin()
+    frontier.add_school('boys', 'Central', ['Smith'])
+    frontier.mark_done('boys', 'Central', 'Smith')
+    frontier.finish()
+
+    assert frontier.begin() is False
+    assert frontier.should_process('boys', 'Central', 'Smith') is True
+    assert frontier.school_complete('boys', 'Central') is False
+
+
+def test_old_unfinished_run_is_not_resumed(tmp_path):
+    frontier = open_frontier(tmp_path, max_age_hours=12)
+    frontier.begin()
+    frontier.add_school('boys', 'Central', ['Smith'])
+    frontier.mark_done('boys', 'Central', 'Smith')
+    age_last_run(frontier, '2000-01-01T00:00:00')
+
+    assert frontier.begin() is False
+    assert frontier.should_process('boys', 'Central', 'Smith') is True
+
+
+def test_max_age_zero_always_resumes(tmp_path):
+    frontier = open_frontier(tmp_path, max_age_hours=0)
+    frontier.begin()
+    frontier.add_school('boys', 'Central', ['Smith'])
+    frontier.mark_done('boys', 'Central', 'Smith')
+    age_last_run(frontier, '2000-01-01T00:00:00')
+
+    assert frontier.begin() is True
+    assert frontier.should_process('boys', 'Central', 'Smith') is False
+
+
+def test_failed_wrestlers_are_retried_until_max_attempts(tmp_path):
+    frontier = open_frontier(tmp_path, max_attempts=2)
+    frontier.begin()
+    frontier.add_school('boys', 'Central', ['Smith'])
+
+    frontier.mark_failed('boys', 'Central', 'Smith', 'timeout')
+    assert frontier.should_process('boys', 'Central', 'Smith') is True
+    assert frontier.has_remaining_work() is True
+    assert frontier.school_complete('boys', 'Central') is False
+
+    frontier.mark_failed('boys', 'Central', 'Smith', 'timeout')
+    assert frontier.should_process('boys', 'Central', 'Smith') is False
+    assert frontier.has_remaining_work() is False
+    assert frontier.school_complete('boys', 'Central') is True
+
+
+def test_adding_a_school_again_keeps_task_status(tmp_path):
+    frontier = open_frontier(tmp_path)
+    frontier.begin()
+    frontier.add_school('boys', 'Central', ['Smith'])
+    frontier.mark_done('boys', 'Central', 'Smith')
+    frontier.add_school('boys', 'Central', ['Smith', 'Jones'])
+
+    assert frontier.summary() == {'pending': 1, 'done': 1, 'failed': 0}
+    assert frontier.school_complete('boys', 'Central') is False
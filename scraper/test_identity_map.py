@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Tests for the wrestler/tournament identity map in src/supabase_client.py.
+Uses a fake PostgREST client, so no database is needed.
+Usage: python -m pytest test_identity_map.py
+"""
+import os
+import sys
+import time
+import threading
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.supabase_client import IdentityMap, SupabaseClient
+
+
+class FakeQuery:
+    """Just enough of the PostgREST builder for _resolve_id's select-by-name lookup."""
+
+    def __init__(self, rows, calls):
+        self.rows = rows
+        self.calls = calls
+        self.name = None
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        self.name = value
+        return self
+
+    def order(self, column):
+        return self
+
+    def limit(self, count):
+        return self
+
+    def execute(self):
+        self.calls.append(self.name)
+        time.sleep(0.01)
+        return SimpleNamespace(data=[{'id': self.rows[self.name]}] if self.name in self.rows else [])
+
+
+class FakeRest:
+    """Stands in for RestClientPool: every thread gets the same fake client."""
+
+    def __init__(self, rows):
+        self.calls = []
+        client = SimpleNamespace(table=lambda name: FakeQuery(rows, self.calls))
+        self.current = lambda: client
+        self.default = lambda: client
+
+
+def make_client(rows=None):
+    """A SupabaseClient wired to a fake REST pool, without connecting anywhere."""
+    client = SupabaseClient.__new__(SupabaseClient)
+    client._rest = FakeRest(rows or {})
+    client.identity = {'wrestlers': IdentityMap(), 'tournaments': IdentityMap()}
+    return client
+
+
+def test_first_id_stored_for_a_name_wins():
+    ids = IdentityMap()
+
+    assert ids.get('Smith') is None
+    assert ids.put('Smith', 'id-1') == 'id-1'
+    assert ids.put('Smith', 'id-2') == 'id-1'
+    assert ids.get('Smith') == 'id-1'
+    assert len(ids) == 1
+
+
+def test_name_lock_is_shared_per_name():
+    ids = IdentityMap()
+
+    assert ids.name_lock('Smith') is ids.name_lock('Smith')
+    assert ids.name_lock('Smith') is not ids.name_lock('Jones')
+
+
+def test_known_names_cost_no_request():
+    client = make_client()
+    client.identity['wrestlers'].put('Smith', 'id-1')
+
+    assert client._resolve_id('wrestlers', 'Smith', lambda: 'new') == 'id-1'
+    assert client._rest.calls == []
+
+
+def test_existing_row_is_looked_up_once_and_remembered():
+    client = make_client({'Smith': 'db-id'})
+
+    assert client._resolve_id('wrestlers', 'Smith', lambda: 'new') == 'db-id'
+    assert client._resolve_id('wrestlers', 'Smith', lambda: 'new') == 'db-id'
+    assert client._rest.calls == ['Smith']
+
+
+def test_concurrent_writers_create_a_new_name_once():
+    client = make_client()
+    created = []
+    lock = threading.Lock()
+
+    def create():
+        with lock:
+            created.append(1)
+            return f"id-{len(created)}"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client._resolve_id('wrestlers', 'Smith', create)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert created == [1]
+    assert results == ['id-1'] * 8
+    assert client._rest.calls == ['Smith']
+
+
+class FakeTable:
+    """In-memory wrestlers table: select ... in_(name) ordered oldest first, insert and delete."""
+
+    def __init__(self, db):
+        self.db = db
+        self.names = None
+
+    def select(self, columns):
+        return self
+
+    def in_(self, column, values):
+        self.names = set(values)
+        return self
+
+    def order(self, column):
+        return self
+
+    def insert(self, rows):
+        self.db.rows.extend(self.db.racing_rows)
+        for row in rows:
+            self.db.rows.append({'id': f"id-{len(self.db.rows) + 1}", 'name': row['name']})
+        self.names = set()
+        return self
+
+    def delete(self):
+        self.db.deletes += 1
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=[row for row in self.db.rows if row['name'] in self.names])
+
+
+class FakeDatabase:
+    """
+    A fake PostgREST client holding one table. `functions` says whether get_or_create_*() exist;
+    `racing` rows are added just before a direct insert, as if another process got there first.
+    """
+
+    def __init__(self, rows=(), functions=True, racing=()):
+        self.rows = [{'id': row_id, 'name': name} for name, row_id in rows]
+        self.racing_rows = [{'id': row_id, 'name': name} for name, row_id in racing]
+        self.functions = functions
+        self.rpc_calls = []
+        self.deletes = 0
+        self.table = lambda name: FakeTable(self)
+
+    def rpc(self, function, params):
+        self.rpc_calls.append(function)
+        if not self.functions:
+            raise Exception("PGRST202: Could not find the function public.get_or_create_wrestlers")
+        for row in params['new_rows']:
+            if not any(existing['name'] == row['name'] for existing in self.rows):
+                self.rows.append({'id': f"id-{len(self.rows) + 1}", 'name': row['name']})
+        data = [{'row_name': row['name'], 'row_id': row['id']} for row in self.rows]
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=data))
+
+
+def make_batch_client(db):
+    client = make_client()
+    client._rest.current = client._rest.default = lambda: db
+    client._server_get_or_create = True
+    return client
+
+
+def test_missing_names_are_created_through_the_server_function():
+    db = FakeDatabase(rows=[('Smith', 'db-id')])
+    client = make_batch_client(db)
+
+    ids = client._get_or_create_ids('wrestlers', {'Smith': {'name': 'Smith'}, 'Jones': {'name': 'Jones'}})
+
+    assert ids == {'Smith': 'db-id', 'Jones': 'id-2'}
+    assert db.rpc_calls == ['get_or_create_wrestlers']
+    assert client.identity['wrestlers'].get('Jones') == 'id-2'
+
+
+def test_fallback_keeps_the_oldest_row_and_deletes_nothing():
+    # Another process creates Jones between our select and insert, so our row is a duplicate
+    db = FakeDatabase(functions=False, racing=[('Jones', 'other-id')])
+    client = make_batch_client(db)
+
+    ids = client._get_or_create_ids('wrestlers', {'Jones': {'name': 'Jones'}})
+
+    assert ids == {'Jones': 'other-id'}
+    assert db.deletes == 0
+    assert client._server_get_or_create is False
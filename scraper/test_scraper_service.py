@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for the scraper service's job submission endpoint (scraper_service.py).
+The worker thread is never started, so no browser or database is needed.
+Usage: python -m pytest test_scraper_service.py
+"""
+import os
+import sys
+import json
+import threading
+import http.client
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from scraper_service import ScraperService, ServiceRequestHandler
+
+
+@pytest.fixture
+def service_url():
+    """Serve a ScraperService (worker not started) on a free local port."""
+    handler = type('TestHandler', (ServiceRequestHandler,), {'service': ScraperService()})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def post_job(address, body):
+    connection = http.client.HTTPConnection(*address, timeout=5)
+    connection.request('POST', '/jobs', body=json.dumps(body), headers={'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    result = response.status, json.loads(response.read() or b'{}')
+    connection.close()
+    return result
+
+
+def test_valid_job_is_queued(service_url):
+    status, body = post_job(service_url, {'genders': ['boys'], 'school_pattern': '^Olentangy'})
+
+    assert status == 202
+    assert body['status'] == 'queued'
+
+
+def test_invalid_school_pattern_is_rejected(service_url):
+    status, body = post_job(service_url, {'school_pattern': '(unclosed'})
+
+    assert status == 400
+    assert 'school_pattern' in body['error']
+
+
+def test_non_list_schools_are_rejected(service_url):
+    status, body = post_job(service_url, {'schools': 'Olentangy Liberty'})
+
+    assert status == 400
+    assert body['error'] == "'schools' must be a list of strings"
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests for the write-behind match buffer (src/write_buffer.py).
+Uses a fake write function, so no database is needed.
+Usage: python -m pytest test_write_buffer.py
+"""
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.write_buffer import WriteBehindBuffer
+
+
+class FakeWriter:
+    """Records every batch it is given; batches whose number is in `fail` return False."""
+
+    def __init__(self, fail=(), delay: float = 0.0):
+        self.batches = []
+        self.fail = set(fail)
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self, batch):
+        if self.delay:
+            time.sleep(self.delay)
+        with self.lock:
+            self.batches.append(list(batch))
+            return len(self.batches) not in self.fail
+
+    @property
+    def sizes(self):
+        return [len(batch) for batch in self.batches]
+
+
+def test_batches_split_at_batch_size():
+    writer = FakeWriter()
+    buffer = WriteBehindBuffer(writer, batch_size=10, max_delay=60)
+
+    buffer.put(list(range(25)))
+    buffer.close()
+
+    assert writer.sizes == [10, 10, 5]
+    assert [m for batch in writer.batches for m in batch] == list(range(25))
+    summary = buffer.summary()
+    assert summary['flush_reasons'] == {'size': 2, 'delay': 0, 'flush': 0, 'close': 1}
+    assert summary['matches'] == 25
+    assert summary['max_batch'] == 10
+
+
+def test_partial_batch_written_after_max_delay():
+    writer = FakeWriter()
+    written = threading.Event()
+    buffer = WriteBehindBuffer(writer, batch_size=100, max_delay=0.1)
+
+    buffer.put([1, 2, 3], on_written=lambda ok: written.set())
+
+    assert written.wait(2), "partial batch was not written after max_delay"
+    assert writer.sizes == [3]
+    assert buffer.summary()['flush_reasons']['delay'] == 1
+    buffer.close()
+
+
+def test_flush_waits_for_queued_matches():
+    writer = FakeWriter(delay=0.05)
+    buffer = WriteBehindBuffer(writer, batch_size=100, max_delay=60)
+
+    buffer.put([1, 2])
+    buffer.flush()
+
+    assert writer.sizes == [2]
+    buffer.close()
+
+
+def test_on_written_called_once_per_put_across_batches():
+    # Batch 2 fails: the put() whose matches span batches 1-2 and the one inside batch 2
+    # both report False, the rest True.
+    writer = FakeWriter(fail={2})
+    results = {}
+    calls = []
+    buffer = WriteBehindBuffer(writer, batch_size=4, max_delay=60)
+
+    def callback(key):
+        def on_written(ok):
+            calls.append(key)
+            results[key] = ok
+        return on_written
+
+    buffer.put(['a1', 'a2', 'a3'], on_written=callback('a'))          # batch 1
+    buffer.put(['b1', 'b2', 'b3'], on_written=callback('b'))          # batches 1-2
+    buffer.put(['c1'], on_written=callback('c'))                      # batch 2
+    buffer.put(['d1', 'd2', 'd3', 'd4'], on_written=callback('d'))    # batches 2-3
+    buffer.close()
+
+    assert writer.sizes == [4, 4, 3]
+    assert sorted(calls) == ['a', 'b', 'c', 'd']
+    assert results == {'a': True, 'b': False, 'c': False, 'd': False}
+    assert buffer.summary()['failed_batches'] == 1
+
+
+def test_write_exception_counts_as_failed_batch():
+    def write(batch):
+        raise RuntimeError("database down")
+
+    results = []
+    buffer = WriteBehindBuffer(write, batch_size=2, max_delay=60)
+    buffer.put([1, 2, 3], on_written=results.append)
+    buffer.close()
+
+    assert results == [False]
+    assert buffer.summary()['failed_batches'] == 2
+
+
+def test_put_blocks_while_queue_is_full():
+    release = threading.Event()
+    writer = FakeWriter()
+
+    def slow_write(batch):
+        release.wait(5)
+        return writer(batch)
+
+    buffer = WriteBehindBuffer(slow_write, batch_size=2, max_delay=60, max_pending=4)
+    # The writer thread takes the first batch and blocks in write(), then 4 more fill the queue
+    buffer.put([1, 2])
+    time.sleep(0.1)
+    buffer.put([3, 4, 5, 6])
+
+    producer = threading.Thread(target=buffer.put, args=([7, 8],))
+    producer.start()
+    producer.join(0.3)
+    assert producer.is_alive(), "put() should block while max_pending matches are queued"
+
+    release.set()
+    producer.join(5)
+    assert not producer.is_alive()
+    buffer.close()
+
+    assert sum(writer.sizes) == 8
+    assert buffer.summary()['put_wait_s'] > 0
+
+
+def test_close_drains_every_queued_match_from_many_producers():
+    writer = FakeWriter(delay=0.01)
+    done = []
+    buffer = WriteBehindBuffer(writer, batch_size=7, max_delay=60, max_pending=10)
+
+    def produce(worker):
+        for i in range(20):
+            buffer.put([(worker, i, n) for n in range(3)], on_written=done.append)
+
+    producers = [threading.Thread(target=produce, args=(w,)) for w in range(4)]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    buffer.close()
+
+    written = [m for batch in writer.batches for m in batch]
+    assert len(written) == 4 * 20 * 3
+    assert len(set(written)) == len(written)
+    assert max(writer.sizes) <= 7
+    assert done == [True] * 80
+
+
+def test_put_after_close_raises():
+    buffer = WriteBehindBuffer(FakeWriter(), batch_size=2)
+    buffer.close()
+    buffer.close()  # closing twice is a no-op
+
+    try:
+        buffer.put([1])
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("put() after close() should raise")
+
+
+def test_empty_put_reports_success_without_writing():
+    writer = FakeWriter()
+    results = []
+    buffer = WriteBehindBuffer(writer, batch_size=2)
+    buffer.put([], on_written=results.append)
+    buffer.close()
+
+    assert results == [True]
+    assert writer.batches == []
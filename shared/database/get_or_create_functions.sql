@@ -0,0 +1,65 @@
+-- Race-safe wrestler/tournament creation used by the scraper (SupabaseClient.resolve_batch_ids).
+-- When to run:
+-- - Run once in the Supabase SQL editor, after schema_mvp.sql.
+-- - Without it the scraper still works, inserting names from the client; two writers
+--   creating the same name at the same moment can then leave a duplicate row.
+
+-- Names have no unique constraint (existing databases may already hold duplicates), so
+-- instead of ON CONFLICT each name is serialized with a transaction-level advisory lock:
+-- - names are locked in sorted order, so concurrent callers cannot deadlock
+-- - a name is inserted only if no row has it yet; id and created_at come from the column defaults
+-- - the oldest row for each name (created_at, then id) is returned
+-- Under READ COMMITTED each INSERT ... WHERE NOT EXISTS sees rows committed by whoever held
+-- the lock before us, so a name is created once however many writers race for it.
+
+CREATE OR REPLACE FUNCTION get_or_create_wrestlers(new_rows JSONB)
+RETURNS TABLE (row_name TEXT, row_id UUID)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    r RECORD;
+BEGIN
+    FOR r IN
+        SELECT DISTINCT ON (x.name) x.name, x.weight_class
+        FROM jsonb_to_recordset(new_rows) AS x(name VARCHAR(255), weight_class INTEGER)
+        ORDER BY x.name, x.weight_class NULLS LAST
+    LOOP
+        PERFORM pg_advisory_xact_lock(hashtextextended('wrestlers:' || r.name, 0));
+        INSERT INTO wrestlers (name, weight_class)
+        SELECT r.name, r.weight_class
+        WHERE NOT EXISTS (SELECT 1 FROM wrestlers w WHERE w.name = r.name);
+    END LOOP;
+
+    RETURN QUERY
+    SELECT DISTINCT ON (w.name) w.name::TEXT, w.id
+    FROM wrestlers w
+    WHERE w.name IN (SELECT x.name FROM jsonb_to_recordset(new_rows) AS x(name VARCHAR(255)))
+    ORDER BY w.name, w.created_at, w.id;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION get_or_create_tournaments(new_rows JSONB)
+RETURNS TABLE (row_name TEXT, row_id UUID)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    r RECORD;
+BEGIN
+    FOR r IN
+        SELECT DISTINCT ON (x.name) x.name, x.date
+        FROM jsonb_to_recordset(new_rows) AS x(name VARCHAR(255), date DATE)
+        ORDER BY x.name, x.date NULLS LAST
+    LOOP
+        PERFORM pg_advisory_xact_lock(hashtextextended('tournaments:' || r.name, 0));
+        INSERT INTO tournaments (name, date)
+        SELECT r.name, r.date
+        WHERE NOT EXISTS (SELECT 1 FROM tournaments t WHERE t.name = r.name);
+    END LOOP;
+
+    RETURN QUERY
+    SELECT DISTINCT ON (t.name) t.name::TEXT, t.id
+    FROM tournaments t
+    WHERE t.name IN (SELECT x.name FROM jsonb_to_recordset(new_rows) AS x(name VARCHAR(255)))
+    ORDER BY t.name, t.created_at, t.id;
+END;
+$$;
@@ -0,0 +1,72 @@
+-- Set-based match upsert used by the scraper (SupabaseClient.batch_insert_matches).
+-- When to run:
+-- - Run once in the Supabase SQL editor, after unique_matches_constraint.sql / schema_mvp.sql.
+-- - Without it the scraper still works, falling back to one request per match.
+
+-- The scraper writes pin times; older databases may not have the column yet.
+ALTER TABLE matches ADD COLUMN IF NOT EXISTS match_time VARCHAR(20);
+
+-- Insert a batch of matches in one statement, resolving duplicates on
+-- idx_matches_unique_match (tournament, round, wrestler pair in either order):
+-- - new matches are inserted
+-- - existing matches still at 0-0 get the new scores, match type and (if given) pin time
+-- - existing matches that already have scores are left untouched
+-- Returns how many rows were inserted, updated and skipped.
+CREATE OR REPLACE FUNCTION upsert_matches(match_rows JSONB)
+RETURNS TABLE (inserted INTEGER, updated INTEGER, skipped INTEGER)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    total INTEGER;
+BEGIN
+    SELECT count(*) INTO total FROM jsonb_array_elements(match_rows);
+
+    RETURN QUERY
+    WITH input AS (
+        SELECT *
+        FROM jsonb_to_recordset(match_rows) AS r(
+            tournament_id UUID,
+            wrestler1_id UUID,
+            wrestler2_id UUID,
+            winner_id UUID,
+            wrestler1_score INTEGER,
+            wrestler2_score INTEGER,
+            match_type VARCHAR(50),
+            round VARCHAR(50),
+            match_time VARCHAR(20)
+        )
+    ),
+    -- ON CONFLICT cannot touch the same row twice in one statement; keep one of any repeats
+    deduped AS (
+        SELECT DISTINCT ON (tournament_id, COALESCE(round, ''),
+                            LEAST(wrestler1_id, wrestler2_id), GREATEST(wrestler1_id, wrestler2_id)) *
+        FROM input
+    ),
+    upserted AS (
+        INSERT INTO matches AS m (
+            tournament_id, wrestler1_id, wrestler2_id, winner_id,
+            wrestler1_score, wrestler2_score, match_type, round, match_time
+        )
+        SELECT tournament_id, wrestler1_id, wrestler2_id, winner_id,
+               COALESCE(wrestler1_score, 0), COALESCE(wrestler2_score, 0),
+               COALESCE(match_type, 'decision'), round, match_time
+        FROM deduped
+        ON CONFLICT (tournament_id, (COALESCE(round, '')),
+                     (LEAST(wrestler1_id, wrestler2_id)), (GREATEST(wrestler1_id, wrestler2_id)))
+        DO UPDATE SET
+            -- The stored row may list the wrestlers the other way round
+            wrestler1_score = CASE WHEN m.wrestler1_id = EXCLUDED.wrestler1_id
+                                   THEN EXCLUDED.wrestler1_score ELSE EXCLUDED.wrestler2_score END,
+            wrestler2_score = CASE WHEN m.wrestler1_id = EXCLUDED.wrestler1_id
+                                   THEN EXCLUDED.wrestler2_score ELSE EXCLUDED.wrestler1_score END,
+            match_type = EXCLUDED.match_type,
+            match_time = COALESCE(EXCLUDED.match_time, m.match_time)
+        WHERE m.wrestler1_score = 0 AND m.wrestler2_score = 0
+        RETURNING (m.xmax = 0) AS was_inserted
+    )
+    SELECT (count(*) FILTER (WHERE was_inserted))::INTEGER,
+           (count(*) FILTER (WHERE NOT was_inserted))::INTEGER,
+           (total - count(*))::INTEGER
+    FROM upserted;
+END;
+$$;